@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+EconoVisionAI Benchmarks
+Times loading, searching and filtering on synthetic OECD-shaped corpora of
+increasing size and writes the results as JSON, so runs from different
+commits can be compared with --compare
+
+Example:
+  python benchmark.py --sizes 1000,100000,1000000 --output results.json
+  python benchmark.py --sizes 1000,100000,1000000 --compare results.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+# Add current directory to path to import modules
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from utils.data_cache import DataCache
+from utils.data_store import DataStore
+from utils.json_index import FlatJSON
+from utils.search_utils import DataSearcher
+from utils.synthetic import write_corpus
+
+DEFAULT_SIZES = "1000,10000,100000"
+
+# Queries run against every CSV size: selective, unselective, multi-keyword, no hits
+DATA_QUERIES = ["germany", "ger-000001", "2020", "growth germany", "zzzz"]
+
+# Queries run against the report corpus
+REPORT_QUERIES = ["growth", "education germany", "fiscal reform", "zzzz"]
+
+# A slower run than the baseline by more than this factor is flagged
+REGRESSION_THRESHOLD = 1.2
+
+
+def time_call(function: Callable[[], Any], repeat: int) -> Dict[str, float]:
+    """
+    Milliseconds for the first call (which may build indexes) and the
+    min/median/mean of the following `repeat` calls
+    """
+    started = time.perf_counter()
+    function()
+    first = time.perf_counter() - started
+
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        samples.append(time.perf_counter() - started)
+    samples = samples or [first]
+    return {
+        'first_ms': first * 1000,
+        'min_ms': min(samples) * 1000,
+        'median_ms': statistics.median(samples) * 1000,
+        'mean_ms': statistics.mean(samples) * 1000,
+    }
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)), check=True).stdout.strip()
+    except Exception:
+        return None
+
+
+def load_store(corpus: Dict[str, str], cache_dir: str) -> DataStore:
+    """Discover and eagerly load a corpus the way the application's load_data does"""
+    store = DataStore(corpus['data_dir'], corpus['reports_dir'], cache=DataCache(cache_dir))
+    with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+        store.discover()
+        for future in store.load_in_background(eager=True):
+            future.result()
+    return store
+
+
+class BenchmarkRunner:
+    """Runs every benchmark at every size and collects one record per (benchmark, size)"""
+
+    def __init__(self, workdir: str, repeat: int = 5, reports: int = 20, seed: int = 0):
+        self.workdir = workdir
+        self.repeat = repeat
+        self.reports = reports
+        self.seed = seed
+        self.results: List[Dict[str, Any]] = []
+
+    def record(self, benchmark: str, size: int, timings: Dict[str, float], **extra):
+        result = {'benchmark': benchmark, 'size': size, **timings, **extra}
+        self.results.append(result)
+        print(f"  {benchmark:<40} {size:>11,}  first {timings['first_ms']:9.2f} ms  "
+              f"median {timings['median_ms']:9.2f} ms")
+
+    def run_size(self, rows: int):
+        print(f"📊 {rows:,} rows")
+        directory = os.path.join(self.workdir, f"rows_{rows}")
+        started = time.perf_counter()
+        corpus = write_corpus(directory, rows, reports=self.reports, seed=self.seed)
+        print(f"  generated in {time.perf_counter() - started:.1f} s")
+
+        # Cold: parse, index and cache everything; warm: every file comes from the cache
+        cache_dir = os.path.join(directory, "cache")
+        cold = time.perf_counter()
+        store = load_store(corpus, cache_dir)
+        cold = time.perf_counter() - cold
+        warm = time_call(lambda: load_store(corpus, cache_dir).shutdown(), max(1, self.repeat // 2))
+        self.record("load_data.cold", rows, {'first_ms': cold * 1000, 'min_ms': cold * 1000,
+                                             'median_ms': cold * 1000, 'mean_ms': cold * 1000})
+        self.record("load_data.warm", rows, warm)
+
+        self.run_searches(store, rows)
+        store.shutdown()
+        shutil.rmtree(directory, ignore_errors=True)
+
+    def run_searches(self, store: DataStore, rows: int):
+        """Data searches and filters on the first panel of a loaded corpus"""
+        searcher = store.searcher
+        df = store.get_csv("panel_0.csv")
+        for query in DATA_QUERIES:
+            hits: List[int] = []
+            timings = time_call(lambda: hits.append(len(searcher.search_dataframe(df, query)[0])), self.repeat)
+            self.record(f"search_dataframe[{query}]", rows, timings, matches=hits[-1])
+            timings = time_call(lambda: searcher.search_dataframe_ranked(df, query, top_k=20), self.repeat)
+            self.record(f"search_dataframe_ranked[{query}]", rows, timings)
+
+        country, year = "Germany", 2020
+        for name, function in [
+            ("filter_by_country", lambda: searcher.filter_by_country(df, country)),
+            ("filter_by_year", lambda: searcher.filter_by_year(df, year)),
+            ("filter_by_country_year", lambda: searcher.filter_by_country_year(df, country, year)),
+            ("filter_by_range", lambda: searcher.filter_by_range(df, 'GDP_Growth_Rate', 1.0, 3.0)),
+            ("filter_by_ranges", lambda: searcher.filter_by_ranges(
+                df, {'GDP_Growth_Rate': (1.0, 3.0), 'Gini_Coefficient': (None, 0.3)})),
+        ]:
+            results: List[int] = []
+            timings = time_call(lambda: results.append(len(function())), self.repeat)
+            self.record(name, rows, timings, matches=results[-1])
+
+    def run_reports(self):
+        """Report searches, sized by the lines or leaves searched"""
+        print(f"📄 {self.reports} reports")
+        directory = os.path.join(self.workdir, "reports")
+        corpus = write_corpus(directory, 0, reports=self.reports, seed=self.seed, files=0)
+        searcher = DataSearcher()
+
+        texts, documents = [], []
+        for filename in sorted(os.listdir(corpus['reports_dir'])):
+            with open(os.path.join(corpus['reports_dir'], filename), 'r', encoding='utf-8') as f:
+                if filename.endswith(".json"):
+                    documents.append(json.load(f))
+                else:
+                    texts.append(f.read())
+        lines = sum(text.count('\n') + 1 for text in texts)
+        tables = [FlatJSON(document) for document in documents]
+        leaves = sum(len(table.paths) for table in tables)
+
+        for query in REPORT_QUERIES:
+            timings = time_call(lambda: [searcher.search_text_content(text, query) for text in texts], self.repeat)
+            self.record(f"search_text_content[{query}]", lines, timings)
+            timings = time_call(lambda: [searcher.search_json_content(d, query) for d in documents], self.repeat)
+            self.record(f"search_json_content[{query}]", leaves, timings)
+            timings = time_call(lambda: [searcher.search_json_content(t, query) for t in tables], self.repeat)
+            self.record(f"search_json_content.flat[{query}]", leaves, timings)
+
+        shutil.rmtree(directory, ignore_errors=True)
+
+    def report(self, sizes: List[int]) -> Dict[str, Any]:
+        return {
+            'meta': {
+                'commit': git_commit(),
+                'timestamp': time.strftime("%Y-%m-%dT%H:%M:%S"),
+                'python': platform.python_version(),
+                'pandas': pd.__version__,
+                'numpy': np.__version__,
+                'platform': platform.platform(),
+                'cpus': os.cpu_count(),
+                'sizes': sizes,
+                'reports': self.reports,
+                'repeat': self.repeat,
+                'seed': self.seed,
+            },
+            'results': self.results,
+        }
+
+
+def compare(results: List[Dict[str, Any]], baseline_path: str, threshold: float = REGRESSION_THRESHOLD) -> int:
+    """Print median timings against a baseline run; returns the number of regressions"""
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = {(r['benchmark'], r['size']): r for r in json.load(f)['results']}
+
+    regressions = 0
+    print(f"\n⚖️  Compared with {baseline_path}")
+    for result in results:
+        before = baseline.get((result['benchmark'], result['size']))
+        if before is None or not before['median_ms']:
+            continue
+        ratio = result['median_ms'] / before['median_ms']
+        flag = ""
+        if ratio > threshold:
+            flag = "  ⚠️ slower"
+            regressions += 1
+        elif ratio < 1 / threshold:
+            flag = "  ✅ faster"
+        print(f"  {result['benchmark']:<40} {result['size']:>11,}  {before['median_ms']:9.2f} → "
+              f"{result['median_ms']:9.2f} ms  ({ratio:.2f}x){flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="EconoVisionAI load and search benchmarks")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES,
+                        help="comma-separated CSV row counts, e.g. 1e3,1e5,1e7")
+    parser.add_argument("--reports", type=int, default=20, help="reports in the report corpus")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs after the first call")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="benchmark_results.json")
+    parser.add_argument("--compare", metavar="BASELINE", help="results JSON of an earlier run")
+    parser.add_argument("--workdir", help="where corpora are generated (default: a temporary folder)")
+    args = parser.parse_args()
+
+    sizes = [int(float(size)) for size in args.sizes.split(",") if size.strip()]
+    workdir = args.workdir or tempfile.mkdtemp(prefix="econovision_bench_")
+    os.makedirs(workdir, exist_ok=True)
+
+    print("🌍 EconoVisionAI Benchmarks")
+    print("=" * 60)
+    runner = BenchmarkRunner(workdir, repeat=args.repeat, reports=args.reports, seed=args.seed)
+    try:
+        for rows in sizes:
+            runner.run_size(rows)
+        runner.run_reports()
+    finally:
+        if args.workdir is None:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    report = runner.report(sizes)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"\n💾 Results written to {args.output}")
+
+    if args.compare:
+        regressions = compare(runner.results, args.compare)
+        if regressions:
+            print(f"⚠️ {regressions} benchmark(s) slower than the baseline")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
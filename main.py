@@ -5,13 +5,43 @@ A simple GUI application to search economic development data from OECD-style dat
 """
 
 import customtkinter as ctk
-import pandas as pd
-import json
 import os
-import glob
+import queue
 from tkinter import messagebox
 import sys
 
+from utils.search_utils import DataSearcher, SearchStats
+from utils.data_cache import DataCache
+from utils.data_store import DataStore
+from utils.search_executor import CancelToken, SearchExecutor
+from utils.result_view import DataFrameGroup, ResultModel, lines_group
+from utils.instrumentation import QueryProfiler, instruments
+
+# Delay after the last keystroke before a live search runs
+LIVE_SEARCH_DELAY_MS = 300
+
+# Approximate pixel height of one line in the results textbox
+RESULT_LINE_HEIGHT_PX = 18
+
+# Option shown in the column selector to return to the overview
+ALL_RESULTS_OPTION = "All results"
+
+# Number of best-ranked reports shown for a report search
+REPORT_TOP_K = 20
+
+# Interval at which file changes found by the folder watcher are shown
+FILE_EVENT_POLL_MS = 1000
+
+# Memory for resident CSVs; least recently searched ones are evicted beyond it
+# and CSVs expected to need more than all of it on their own are streamed
+MEMORY_BUDGET_BYTES = 2 * 1024 ** 3
+
+# Set to a file path to log every timed load/search stage as JSON lines
+STRUCTURED_LOG_ENV = "ECONOVISION_LOG"
+
+# Where the cProfile data of the last profiled search is saved
+PROFILE_OUTPUT = os.path.join(".econovision_cache", "last_search.prof")
+
 # Configure CustomTkinter appearance
 ctk.set_appearance_mode("dark")  # Modes: system (default), light, dark
 ctk.set_default_color_theme("blue")  # Themes: blue (default), dark-blue, green
@@ -25,60 +55,136 @@ class EconoVisionAI(ctk.CTk):
         self.geometry("1000x700")
         self.minsize(800, 600)
 
-        # Initialize data storage
-        self.csv_data = {}
-        self.report_data = {}
+        # Initialize data storage; files are loaded in the background
+        self.searcher = DataSearcher()
+        self.store = DataStore(searcher=self.searcher, cache=DataCache(), memory_budget=MEMORY_BUDGET_BYTES)
+        self._load_events = queue.Queue()
+        self._file_events = queue.Queue()
+
+        # Stage timings, counters and memory for the diagnostics line
+        if os.environ.get(STRUCTURED_LOG_ENV):
+            instruments.enable_log(os.environ[STRUCTURED_LOG_ENV])
+        instruments.register_gauge('datasets', self.store.cache_info)
+        instruments.register_gauge('query_cache', self.store.query_cache.stats)
+
+        # Searches run on a worker thread; results come back via after()
+        self.executor = SearchExecutor(schedule=self.after)
+        self.search_mode = "data"
+        self._live_search_job = None
+
+        # Results are kept as row ids and rendered one page at a time
+        self.result_model = ResultModel()
+        # (file, column) -> position of its group in the result model
+        self.csv_groups = {}
+
+        # Create GUI first so the window appears immediately
+        self.create_widgets()
 
         # Load data on startup
         self.load_data()
-
-        # Create GUI
-        self.create_widgets()
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
 
     def load_data(self):
-        """Load CSV and report data from files"""
+        """Discover CSV and report files and load them off the main loop"""
         try:
-            # Load CSV files from data folder
-            if os.path.exists("data"):
-                csv_files = glob.glob("data/*.csv")
-                for csv_file in csv_files:
-                    try:
-                        df = pd.read_csv(csv_file)
-                        filename = os.path.basename(csv_file)
-                        self.csv_data[filename] = df
-                        print(f"Loaded CSV: {filename} with {len(df)} rows")
-                    except Exception as e:
-                        print(f"Error loading {csv_file}: {e}")
-
-            # Load report files from reports folder
-            if os.path.exists("reports"):
-                # Load .txt files
-                txt_files = glob.glob("reports/*.txt")
-                for txt_file in txt_files:
-                    try:
-                        with open(txt_file, 'r', encoding='utf-8') as f:
-                            content = f.read()
-                        filename = os.path.basename(txt_file)
-                        self.report_data[filename] = content
-                        print(f"Loaded report: {filename}")
-                    except Exception as e:
-                        print(f"Error loading {txt_file}: {e}")
-
-                # Load .json files
-                json_files = glob.glob("reports/*.json")
-                for json_file in json_files:
-                    try:
-                        with open(json_file, 'r', encoding='utf-8') as f:
-                            content = json.load(f)
-                        filename = os.path.basename(json_file)
-                        self.report_data[filename] = content
-                        print(f"Loaded JSON report: {filename}")
-                    except Exception as e:
-                        print(f"Error loading {json_file}: {e}")
+            self.store.discover()
+
+            # New and changed files are re-indexed in the background while the app runs
+            self.store.start_watching(on_refresh=lambda *event: self._file_events.put(event))
+            self.after(FILE_EVENT_POLL_MS, self.poll_file_events)
+
+            total = len(self.store.csv_paths) + len(self.store.report_paths)
+            if not total:
+                self.status_label.configure(text=self.status_text())
+                return
+
+            # Worker threads only enqueue events; the Tk thread polls them
+            self.store.load_in_background(on_progress=lambda *event: self._load_events.put(event))
+            self.after(100, self.poll_load_progress)
 
         except Exception as e:
             print(f"Error in load_data: {e}")
 
+    def poll_load_progress(self):
+        """Show per-file loading progress in the status bar"""
+        finished = False
+        try:
+            while True:
+                filename, done, total, error = self._load_events.get_nowait()
+                if error is not None:
+                    text = f"⚠️ Could not load {filename} ({done}/{total})"
+                else:
+                    text = f"⏳ Prepared {filename} ({done}/{total})"
+                self.status_label.configure(text=text)
+                finished = finished or done == total
+        except queue.Empty:
+            pass
+
+        if finished:
+            self.status_label.configure(text=self.status_text())
+            self.update_diagnostics()
+        else:
+            self.after(100, self.poll_load_progress)
+
+    def poll_file_events(self):
+        """Show files refreshed by the folder watcher in the status bar"""
+        try:
+            while True:
+                filename, kind, error = self._file_events.get_nowait()
+                if error is not None:
+                    text = f"⚠️ Could not reload {filename}"
+                else:
+                    text = f"🔄 {kind.capitalize()}: {filename}  •  {self.status_text()}"
+                self.status_label.configure(text=text)
+        except queue.Empty:
+            pass
+        self.after(FILE_EVENT_POLL_MS, self.poll_file_events)
+
+    def status_text(self) -> str:
+        """Summary of available data for the status bar"""
+        info = self.store.cache_info()
+        queries = self.store.query_cache.stats()
+        csv_text = f"{info['datasets']} CSV files" + (f" ({info['streamed']} streamed)" if info['streamed'] else "")
+        return (
+            f"📊 Loaded: {csv_text}, {len(self.store.report_paths)} reports"
+            f"  •  💾 {info['resident']} resident ({info['resident_bytes'] / 1e6:.1f} MB), "
+            f"{info['hits']} hits / {info['misses']} misses"
+            f"  •  ⚡ {queries['hit_rate']:.0%} repeat searches cached ({queries['saved_seconds'] * 1000:.0f} ms saved)"
+        )
+
+    def update_diagnostics(self):
+        """Show the latest stage timings and memory use"""
+        self.diagnostics_label.configure(text=f"⏱️ {instruments.summary_line()}")
+
+    def profiled(self, task):
+        """
+        Wrap a search task so that, when profiling is switched on, only this
+        one search runs under cProfile and tracemalloc
+        """
+        if not self.profile_switch.get():
+            return task, None
+        self.profile_switch.deselect()
+        profiler = QueryProfiler()
+        return (lambda token: profiler.iterate(iter(task(token)))), profiler
+
+    def show_profile(self, profiler):
+        """Add the hottest functions and allocations of a profiled search to the results"""
+        if profiler is None:
+            return
+        lines = profiler.report()
+        try:
+            profiler.dump(PROFILE_OUTPUT)
+            lines.insert(1, f"cProfile data saved to {PROFILE_OUTPUT}")
+        except OSError as e:
+            print(f"Could not save profile: {e}")
+        self.add_result_group(lines_group("🧪 Search profile", [f"   {line}" for line in lines]))
+
+    def on_close(self):
+        """Stop background work and close the window"""
+        self.executor.shutdown()
+        self.store.shutdown()
+        self.destroy()
+
     def create_widgets(self):
         """Create and arrange GUI widgets"""
 
@@ -110,8 +216,9 @@ class EconoVisionAI(ctk.CTk):
         )
         self.search_entry.pack(pady=15, padx=15, fill="x")
 
-        # Bind Enter key to search
+        # Bind Enter key to search; other keys drive the optional live search
         self.search_entry.bind("<Return>", lambda event: self.search_data())
+        self.search_entry.bind("<KeyRelease>", self.on_search_key)
 
         # Button frame
         button_frame = ctk.CTkFrame(search_frame)
@@ -136,6 +243,22 @@ class EconoVisionAI(ctk.CTk):
         )
         search_reports_btn.pack(side="left", padx=5, fill="x", expand=True)
 
+        # Live search re-runs the last search mode while typing
+        self.live_search_switch = ctk.CTkSwitch(
+            button_frame,
+            text="⚡ Live search",
+            font=ctk.CTkFont(size=13)
+        )
+        self.live_search_switch.pack(side="left", padx=5)
+
+        # Profiles the next search (cProfile + tracemalloc), then switches itself off
+        self.profile_switch = ctk.CTkSwitch(
+            button_frame,
+            text="🧪 Profile",
+            font=ctk.CTkFont(size=13)
+        )
+        self.profile_switch.pack(side="left", padx=5)
+
         clear_btn = ctk.CTkButton(
             button_frame,
             text="🗑️ Clear Results",
@@ -147,6 +270,18 @@ class EconoVisionAI(ctk.CTk):
         )
         clear_btn.pack(side="right", padx=(10, 0), fill="x", expand=True)
 
+        # "Did you mean" correction; only shown when a search finds nothing
+        self.suggestion = None
+        self.suggestion_btn = ctk.CTkButton(
+            search_frame,
+            text="",
+            command=self.apply_suggestion,
+            font=ctk.CTkFont(size=13),
+            height=30,
+            fg_color="transparent",
+            border_width=1
+        )
+
         # Results frame
         results_frame = ctk.CTkFrame(self)
         results_frame.pack(pady=10, padx=20, fill="both", expand=True)
@@ -165,143 +300,294 @@ class EconoVisionAI(ctk.CTk):
             font=ctk.CTkFont(size=12),
             wrap="word"
         )
-        self.results_text.pack(pady=15, padx=15, fill="both", expand=True)
+        self.results_text.pack(pady=(15, 5), padx=15, fill="both", expand=True)
+
+        # Page navigation for the results view
+        nav_frame = ctk.CTkFrame(results_frame)
+        nav_frame.pack(pady=(0, 15), padx=15, fill="x")
+
+        self.prev_page_btn = ctk.CTkButton(
+            nav_frame,
+            text="◀ Prev",
+            command=self.prev_page,
+            width=90
+        )
+        self.prev_page_btn.pack(side="left", padx=(0, 5))
+
+        self.page_label = ctk.CTkLabel(
+            nav_frame,
+            text="Page 1/1",
+            font=ctk.CTkFont(size=12)
+        )
+        self.page_label.pack(side="left", padx=5)
+
+        self.next_page_btn = ctk.CTkButton(
+            nav_frame,
+            text="Next ▶",
+            command=self.next_page,
+            width=90
+        )
+        self.next_page_btn.pack(side="left", padx=5)
+
+        # "Show all" for a single column (or report) of the current results
+        self.group_selector = ctk.CTkOptionMenu(
+            nav_frame,
+            values=[ALL_RESULTS_OPTION],
+            command=self.select_result_group,
+            width=260
+        )
+        self.group_selector.pack(side="right")
 
         # Status label
         self.status_label = ctk.CTkLabel(
             self,
-            text=f"📊 Loaded: {len(self.csv_data)} CSV files, {len(self.report_data)} reports",
+            text="⏳ Loading data files...",
             font=ctk.CTkFont(size=12)
         )
-        self.status_label.pack(pady=(5, 15))
+        self.status_label.pack(pady=(5, 0))
+
+        # Diagnostics line: last duration of every stage and memory use
+        self.diagnostics_label = ctk.CTkLabel(
+            self,
+            text="",
+            font=ctk.CTkFont(size=11)
+        )
+        self.diagnostics_label.pack(pady=(0, 15))
 
-    def search_data(self):
-        """Search through CSV data files"""
+    def search_data(self, live: bool = False):
+        """Search through CSV data files on the background search thread"""
         query = self.search_entry.get().strip().lower()
         if not query:
-            messagebox.showwarning("Warning", "Please enter a search keyword!")
+            if not live:
+                messagebox.showwarning("Warning", "Please enter a search keyword!")
             return
 
+        self.search_mode = "data"
         self.results_label.configure(text=f"🔍 CSV Data Search Results for: '{query}'")
-        self.results_text.delete("0.0", "end")
+        self.reset_results()
 
-        if not self.csv_data:
+        if not self.store.csv_paths:
+            self.executor.cancel()
             self.results_text.insert("0.0", "❌ No CSV data files found. Please check the 'data/' folder.")
             return
 
-        results_found = False
-        total_matches = 0
-
-        for filename, df in self.csv_data.items():
-            matches = []
-
-            # Search in all text columns
-            for column in df.columns:
-                if df[column].dtype == 'object':  # Text columns
-                    mask = df[column].astype(str).str.lower().str.contains(query, na=False)
-                    column_matches = df[mask]
-                    if not column_matches.empty:
-                        matches.append((column, column_matches))
-
-            # Search in numeric columns (convert to string first)
-            for column in df.select_dtypes(include=['number']).columns:
-                mask = df[column].astype(str).str.lower().str.contains(query, na=False)
-                column_matches = df[mask]
-                if not column_matches.empty:
-                    matches.append((column, column_matches))
-
-            if matches:
-                results_found = True
-                self.results_text.insert("end", f"\n📁 File: {filename}\n")
-                self.results_text.insert("end", "=" * 50 + "\n")
-
-                for column_name, match_df in matches:
-                    match_count = len(match_df)
-                    total_matches += match_count
-                    self.results_text.insert("end", f"\n🔸 Found {match_count} match(es) in column '{column_name}':\n")
-
-                    # Show first 5 matches to avoid overwhelming the display
-                    display_df = match_df.head(5)
-                    for _, row in display_df.iterrows():
-                        self.results_text.insert("end", f"   • {dict(row)}\n")
-
-                    if len(match_df) > 5:
-                        self.results_text.insert("end", f"   ... and {len(match_df) - 5} more matches\n")
-
-                self.results_text.insert("end", "\n" + "-" * 50 + "\n")
-
-        if not results_found:
-            self.results_text.insert("0.0", f"❌ No matches found for '{query}' in CSV data.\n\n💡 Try different keywords like:\n- Country names: India, Brazil, Germany\n- Indicators: GDP, education, inequality, unemployment\n- Years: 2020, 2021, 2022")
-        else:
-            self.results_text.insert("0.0", f"✅ Found {total_matches} total matches across {len([f for f, _ in self.csv_data.items() if any(query in str(df.values).lower() for df in [_])])} files\n\n")
+        stats = SearchStats(query)
+        summary = {'suggestion': None}
+        task, profiler = self.profiled(lambda token: self.iter_csv_matches(query, token, stats, summary))
+        self.executor.submit(
+            task,
+            on_result=self.show_csv_matches,
+            on_done=lambda: self.finish_csv_search(query, stats, summary, profiler),
+            on_error=self.show_search_error
+        )
 
-    def search_reports(self):
-        """Search through report files"""
+    def iter_csv_matches(self, query: str, token: CancelToken, stats: SearchStats, summary: dict):
+        """
+        Yield (filename, df, {column: row ids}) per file or chunk, each
+        column's rows ordered by relevance; runs off the GUI thread.
+        A search that finds nothing looks for a "did you mean" correction.
+        """
+        for filename, df, column_rows in self.store.search_csvs(query, stats, check=token.check):
+            yield filename, df, {
+                column: self.searcher.rank_rows(df, column, rows, query)
+                for column, rows in column_rows.items()
+            }
+        if not stats.files_hit:
+            summary['suggestion'] = self.store.suggest(query, check=token.check)
+
+    def show_csv_matches(self, result):
+        """
+        Add the matches of one file to the result model as they arrive; the
+        chunks of a streamed file extend one group per column
+        """
+        filename, df, column_rows = result
+        for column_name, rows in column_rows.items():
+            index = self.csv_groups.get((filename, column_name))
+            if index is None:
+                group = DataFrameGroup(filename, column_name)
+                group.add_rows(df, rows)
+                self.add_result_group(group)
+                self.csv_groups[(filename, column_name)] = len(self.result_model.groups) - 1
+            else:
+                self.result_model.groups[index].add_rows(df, rows)
+                self.refresh_result_group(index)
+
+    def finish_csv_search(self, query: str, stats: SearchStats, summary: dict, profiler=None):
+        """Add the summary line from the statistics gathered during the search"""
+        if not stats.files_hit and summary['suggestion']:
+            self.result_model.header = f"❌ No matches found for '{query}' in CSV data.\n\n💡 Did you mean '{summary['suggestion']}'?"
+            self.show_suggestion(summary['suggestion'])
+        elif not stats.files_hit:
+            self.result_model.header = f"❌ No matches found for '{query}' in CSV data.\n\n💡 Try different keywords like:\n- Country names: India, Brazil, Germany\n- Indicators: GDP, education, inequality, unemployment\n- Years: 2020, 2021, 2022"
+        else:
+            self.result_model.header = (
+                f"✅ Found {stats.matches} total matches across {stats.files_hit} files "
+                f"({stats.rows_hit} rows, {stats.columns_hit} columns, {stats.elapsed * 1000:.0f} ms)"
+            )
+        self.render_results()
+        # Residency and hit/miss counts change with every search
+        self.status_label.configure(text=self.status_text())
+        self.update_diagnostics()
+        self.show_profile(profiler)
+
+    def search_reports(self, live: bool = False):
+        """Search through report files on the background search thread"""
         query = self.search_entry.get().strip().lower()
         if not query:
-            messagebox.showwarning("Warning", "Please enter a search keyword!")
+            if not live:
+                messagebox.showwarning("Warning", "Please enter a search keyword!")
             return
 
+        self.search_mode = "reports"
         self.results_label.configure(text=f"📄 Report Search Results for: '{query}'")
-        self.results_text.delete("0.0", "end")
+        self.reset_results()
 
-        if not self.report_data:
+        if not self.store.report_paths:
+            self.executor.cancel()
             self.results_text.insert("0.0", "❌ No report files found. Please check the 'reports/' folder.")
             return
 
-        results_found = False
-        total_matches = 0
+        summary = {'total_matches': 0, 'shown': 0, 'suggestion': None}
+        task, profiler = self.profiled(lambda token: self.iter_report_matches(query, token, summary))
+        self.executor.submit(
+            task,
+            on_result=lambda result: self.show_report_matches(result, summary),
+            on_done=lambda: self.finish_report_search(query, summary, profiler),
+            on_error=self.show_search_error
+        )
+
+    def iter_report_matches(self, query: str, token: CancelToken, summary: dict):
+        """Yield (filename, snippet lines) for the best-ranked reports; runs off the GUI thread"""
+        hits, total = self.store.search_reports(query, top_k=REPORT_TOP_K,
+                                                stop_words=self.searcher.stop_words, check=token.check)
+        summary['total_matches'] = total
+        if not total:
+            summary['suggestion'] = self.store.suggest(query, 'reports', self.searcher.stop_words)
+        for hit in hits:
+            yield hit.name, hit.lines
+
+    def show_report_matches(self, result, summary: dict):
+        """Add the snippet of one report to the result model as it arrives"""
+        filename, snippet = result
+        summary['shown'] += 1
+        self.add_result_group(lines_group(filename, [f"   {line}" for line in snippet]))
+
+    def finish_report_search(self, query: str, summary: dict, profiler=None):
+        """Add the summary line once every report has been searched"""
+        if not summary['total_matches'] and summary['suggestion']:
+            self.result_model.header = f"❌ No matches found for '{query}' in reports.\n\n💡 Did you mean '{summary['suggestion']}'?"
+            self.show_suggestion(summary['suggestion'])
+        elif not summary['total_matches']:
+            self.result_model.header = f"❌ No matches found for '{query}' in reports.\n\n💡 Try different keywords like:\n- Policy terms: development, investment, reform\n- Economic terms: growth, inflation, trade\n- Country names: India, Brazil, Germany"
+        elif summary['total_matches'] > summary['shown']:
+            self.result_model.header = f"✅ Found matches in {summary['total_matches']} report(s), showing the {summary['shown']} most relevant"
+        else:
+            self.result_model.header = f"✅ Found matches in {summary['total_matches']} report(s), most relevant first"
+        self.render_results()
+        self.status_label.configure(text=self.status_text())
+        self.update_diagnostics()
+        self.show_profile(profiler)
+
+    def show_suggestion(self, suggestion: str):
+        """Offer a corrected query as a one-click "did you mean" button"""
+        self.suggestion = suggestion
+        self.suggestion_btn.configure(text=f"💡 Did you mean: {suggestion}")
+        self.suggestion_btn.pack(pady=(0, 15), padx=15, fill="x")
+
+    def apply_suggestion(self):
+        """Search again for the suggested query in the same mode"""
+        if not self.suggestion:
+            return
+        self.search_entry.delete(0, "end")
+        self.search_entry.insert(0, self.suggestion)
+        if self.search_mode == "reports":
+            self.search_reports()
+        else:
+            self.search_data()
+
+    def reset_results(self):
+        """Empty the result model and the results view"""
+        self.suggestion = None
+        self.suggestion_btn.pack_forget()
+        self.result_model.clear()
+        self.csv_groups = {}
+        self.group_selector.configure(values=[ALL_RESULTS_OPTION])
+        self.group_selector.set(ALL_RESULTS_OPTION)
+        self.render_results()
+
+    def add_result_group(self, group):
+        """Append a result group, redrawing only if it lands on the visible page"""
+        self.result_model.add(group)
+        index = len(self.result_model.groups) - 1
+        self.group_selector.configure(values=[ALL_RESULTS_OPTION] + [g.label for g in self.result_model.groups])
+        self.refresh_result_group(index)
+
+    def refresh_result_group(self, index: int):
+        """Redraw after a group grew, only if it is on the visible page"""
+        if self.result_model.page_shows_group(index):
+            self.render_results()
+        else:
+            self.update_page_controls()
+
+    def render_results(self):
+        """Draw the current page of results in a single textbox update"""
+        visible_lines = self.results_text.winfo_height() // RESULT_LINE_HEIGHT_PX
+        self.result_model.rows_per_page = max(10, visible_lines)
+
+        with instruments.stage('render'):
+            self.results_text.delete("0.0", "end")
+            if self.result_model.groups or self.result_model.header:
+                self.results_text.insert("0.0", self.result_model.render_page())
+            self.update_page_controls()
+
+    def update_page_controls(self):
+        model = self.result_model
+        self.page_label.configure(text=f"Page {model.page + 1}/{model.page_count}")
+        self.prev_page_btn.configure(state="normal" if model.page > 0 else "disabled")
+        self.next_page_btn.configure(state="normal" if model.page + 1 < model.page_count else "disabled")
+
+    def next_page(self):
+        if self.result_model.next_page():
+            self.render_results()
+
+    def prev_page(self):
+        if self.result_model.prev_page():
+            self.render_results()
+
+    def select_result_group(self, choice: str):
+        """Show every match of the chosen column/report, or go back to the overview"""
+        labels = [group.label for group in self.result_model.groups]
+        self.result_model.show_all(labels.index(choice) if choice in labels else None)
+        self.render_results()
+
+    def show_search_error(self, error: Exception):
+        """Report a failed background search"""
+        self.results_text.insert("end", f"\n❌ Search failed: {error}\n")
+
+    def on_search_key(self, event=None):
+        """Debounce keystrokes into a live search when live mode is on"""
+        if not self.live_search_switch.get():
+            return
+        if event is not None and getattr(event, "keysym", None) == "Return":
+            return
 
-        for filename, content in self.report_data.items():
-            content_str = ""
+        if self._live_search_job is not None:
+            self.after_cancel(self._live_search_job)
+        self._live_search_job = self.after(LIVE_SEARCH_DELAY_MS, self.run_live_search)
 
-            # Handle different content types
-            if isinstance(content, dict):
-                content_str = json.dumps(content, indent=2).lower()
-            else:
-                content_str = str(content).lower()
-
-            if query in content_str:
-                results_found = True
-                total_matches += 1
-
-                self.results_text.insert("end", f"\n📄 File: {filename}\n")
-                self.results_text.insert("end", "=" * 50 + "\n")
-
-                # Find and display context around matches
-                lines = content_str.split('\n')
-                matching_lines = []
-
-                for i, line in enumerate(lines):
-                    if query in line:
-                        # Include context (previous and next lines)
-                        start = max(0, i-2)
-                        end = min(len(lines), i+3)
-                        context = lines[start:end]
-                        matching_lines.extend(context)
-                        matching_lines.append("---")
-
-                # Display unique matching content (first 10 matches)
-                unique_matches = list(dict.fromkeys(matching_lines))[:10]
-                for line in unique_matches:
-                    if line != "---":
-                        # Highlight the query term
-                        highlighted = line.replace(query, f"**{query.upper()}**")
-                        self.results_text.insert("end", f"   {highlighted}\n")
-                    else:
-                        self.results_text.insert("end", "   ---\n")
-
-                self.results_text.insert("end", "\n" + "-" * 50 + "\n")
-
-        if not results_found:
-            self.results_text.insert("0.0", f"❌ No matches found for '{query}' in reports.\n\n💡 Try different keywords like:\n- Policy terms: development, investment, reform\n- Economic terms: growth, inflation, trade\n- Country names: India, Brazil, Germany")
+    def run_live_search(self):
+        """Re-run the last search mode with the current entry text"""
+        self._live_search_job = None
+        if self.search_mode == "reports":
+            self.search_reports(live=True)
         else:
-            self.results_text.insert("0.0", f"✅ Found matches in {total_matches} report(s)\n\n")
+            self.search_data(live=True)
 
     def clear_results(self):
         """Clear search results"""
+        self.executor.cancel()
         self.results_label.configure(text="Results will appear here...")
-        self.results_text.delete("0.0", "end")
+        self.reset_results()
         self.search_entry.delete(0, "end")
 
 def main():
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+EconoVisionAI Search Server
+Headless HTTP/JSON service that keeps the datasets and reports indexed in one
+warm process and answers searches from many clients concurrently
+
+Endpoints:
+  GET  /health                          service and data status, latency metrics
+  GET  /search/data?q=india&limit=20    CSV search (exact=1 for whole values)
+  GET  /search/reports?q=growth&top_k=5 ranked report search
+                                        (profile=1 adds a cProfile/tracemalloc report)
+  POST /batch  {"requests": [{"mode": "data", "query": "india"}, ...]}
+"""
+
+import argparse
+import json
+import os
+import sys
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict
+from urllib.parse import parse_qs, urlparse
+
+# Add current directory to path to import modules
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from utils.data_cache import DataCache
+from utils.data_store import DataStore
+from utils.instrumentation import instruments
+from utils.search_service import SearchService
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# Largest request body accepted by /batch
+MAX_BODY_BYTES = 1024 * 1024
+
+
+class SearchRequestHandler(BaseHTTPRequestHandler):
+    """Maps HTTP requests onto the SearchService of the server"""
+
+    server_version = "EconoVisionAI/1.0"
+
+    @property
+    def service(self) -> SearchService:
+        return self.server.service
+
+    def send_json(self, status: int, payload: Dict[str, Any]):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        options: Dict[str, Any] = {}
+        try:
+            if params.get('profile') in ('1', 'true'):
+                options['profile'] = True
+            if url.path == "/health":
+                self.send_json(200, {'status': 'ok', **self.service.status()})
+            elif url.path == "/search/data":
+                if 'limit' in params:
+                    options['limit'] = int(params['limit'])
+                if params.get('exact') in ('1', 'true'):
+                    options['exact'] = True
+                self.send_json(200, self.service.search('data', params.get('q', ''), **options))
+            elif url.path == "/search/reports":
+                if 'top_k' in params:
+                    options['top_k'] = int(params['top_k'])
+                self.send_json(200, self.service.search('reports', params.get('q', ''), **options))
+            else:
+                self.send_json(404, {'error': f"Unknown path {url.path}"})
+        except ValueError as e:
+            self.send_json(400, {'error': str(e)})
+        except Exception as e:
+            print(f"Error handling {self.path}: {e}")
+            self.send_json(500, {'error': str(e)})
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        if url.path != "/batch":
+            self.send_json(404, {'error': f"Unknown path {url.path}"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            if length > MAX_BODY_BYTES:
+                self.send_json(413, {'error': "Request body too large"})
+                return
+            body = json.loads(self.rfile.read(length) or b"{}")
+            requests = body.get('requests') if isinstance(body, dict) else None
+            if not isinstance(requests, list) or not all(isinstance(r, dict) for r in requests):
+                raise ValueError("Expected {\"requests\": [{\"mode\": ..., \"query\": ...}, ...]}")
+            self.send_json(200, {'results': self.service.batch(requests)})
+        except ValueError as e:
+            self.send_json(400, {'error': str(e)})
+        except Exception as e:
+            print(f"Error handling {self.path}: {e}")
+            self.send_json(500, {'error': str(e)})
+
+    def log_message(self, format, *args):
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+
+def create_server(service: SearchService, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT,
+                  quiet: bool = False) -> ThreadingHTTPServer:
+    """HTTP server bound to host:port (port 0 picks a free port) serving a loaded SearchService"""
+    server = ThreadingHTTPServer((host, port), SearchRequestHandler)
+    server.daemon_threads = True
+    server.service = service
+    server.quiet = quiet
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="EconoVisionAI headless search server")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--workers", type=int, default=None, help="search worker threads")
+    parser.add_argument("--data-dir", default="data")
+    parser.add_argument("--reports-dir", default="reports")
+    parser.add_argument("--watch", action="store_true", help="reindex files that change on disk")
+    parser.add_argument("--quiet", action="store_true", help="do not log every request")
+    parser.add_argument("--log", metavar="PATH", help="log every timed load/search stage as JSON lines")
+    args = parser.parse_args()
+
+    if args.log:
+        instruments.enable_log(args.log)
+
+    store = DataStore(args.data_dir, args.reports_dir, cache=DataCache())
+    service = SearchService(store, max_workers=args.workers)
+    print("⏳ Loading data files...")
+    service.load(watch=args.watch)
+    print(f"📊 Loaded: {len(store.csv_paths)} CSV files, {len(store.report_paths)} reports")
+
+    server = create_server(service, args.host, args.port, quiet=args.quiet)
+    print(f"🚀 Serving on http://{args.host}:{server.server_address[1]}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Shutting down")
+    finally:
+        server.server_close()
+        service.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,6 @@
+"""Shared pytest setup: make the application packages importable from the repository root"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,81 @@
+"""Tests for precomputed and merged summary statistics"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.column_stats import ColumnStats, grouped_stats
+from utils.search_utils import DataSearcher
+
+
+def panel(rows: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    values = rng.normal(3, 2, rows)
+    values[rng.random(rows) < 0.1] = np.nan
+    return pd.DataFrame({
+        'Country': rng.choice(['India', 'Brazil', 'Germany', None], rows),
+        'Year': rng.integers(2000, 2010, rows),
+        'GDP_Growth_Rate': values,
+    })
+
+
+def expected_summary(series: pd.Series) -> dict:
+    return {
+        'count': int(series.count()),
+        'mean': series.mean(),
+        'median': series.median(),
+        'std': series.std(),
+        'min': series.min(),
+        'max': series.max(),
+        'q25': series.quantile(0.25),
+        'q75': series.quantile(0.75),
+    }
+
+
+def test_summary_matches_pandas():
+    df = panel(1000)
+    stats = DataSearcher().get_summary_stats(df, 'GDP_Growth_Rate')
+    assert stats == pytest.approx(expected_summary(df['GDP_Growth_Rate']))
+
+
+def test_group_stats_match_pandas():
+    df = panel(1000)
+    groups = grouped_stats(df['Country'], df['GDP_Growth_Rate'].to_numpy())
+    assert sorted(groups) == ['Brazil', 'Germany', 'India']
+    for country, values in df.groupby('Country')['GDP_Growth_Rate']:
+        assert groups[country].summary() == pytest.approx(expected_summary(values))
+
+
+def test_statistics_do_not_keep_the_values():
+    stats = DataSearcher().summarize_dataframe(panel(1000))
+    objects = list(stats.columns.values()) + [s for groups in stats.groups.values() for s in groups.values()]
+    assert objects
+    assert not any(isinstance(value, np.ndarray) for s in objects for value in vars(s).values())
+
+
+def test_merge_keeps_moments_and_recomputes_quantiles():
+    searcher = DataSearcher()
+    first, second = panel(700, seed=1), panel(300, seed=2)
+    # Statistics are kept (and merged) for frames the caller does not mutate
+    searcher.adopt_dataframe(first)
+    combined = searcher.append_rows(first, second)
+    expected = pd.concat([first, second], ignore_index=True)
+
+    merged = searcher.summarize_dataframe(combined).columns['GDP_Growth_Rate']
+    assert merged.quantiles is None
+    assert (merged.count, merged.mean, merged.std, merged.min, merged.max) == pytest.approx(
+        (expected['GDP_Growth_Rate'].count(), expected['GDP_Growth_Rate'].mean(), expected['GDP_Growth_Rate'].std(),
+         expected['GDP_Growth_Rate'].min(), expected['GDP_Growth_Rate'].max()))
+
+    assert searcher.get_summary_stats(combined, 'GDP_Growth_Rate') == pytest.approx(
+        expected_summary(expected['GDP_Growth_Rate']))
+    by_year = searcher.get_group_stats(combined, 'GDP_Growth_Rate', by='Year')
+    for year, values in expected.groupby('Year')['GDP_Growth_Rate']:
+        assert by_year.loc[year].to_dict() == pytest.approx(expected_summary(values))
+
+
+def test_empty_column():
+    stats = ColumnStats.from_sorted(np.zeros(0))
+    assert stats.count == 0
+    assert np.isnan(stats.summary()['median'])
+    assert ColumnStats.from_sorted(np.array([1.0, 2.0])).merge(stats).summary()['count'] == 2
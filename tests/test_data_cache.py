@@ -0,0 +1,75 @@
+"""Tests for the on-disk parse cache"""
+
+import os
+
+import pandas as pd
+import pytest
+
+from utils.data_cache import DataCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return DataCache(str(tmp_path / "cache"))
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = str(tmp_path / "a.csv")
+    pd.DataFrame({'Country': ['India', 'Brazil'], 'Year': [2000, 2001]}).to_csv(path, index=False)
+    return path
+
+
+def test_read_csv_is_served_from_the_cache(cache, csv_path):
+    df = cache.read_csv(csv_path)
+    assert cache.is_cached(csv_path, 'frame')
+    pd.testing.assert_frame_equal(cache.load_frame(csv_path), df)
+
+
+def test_size_change_invalidates(cache, csv_path):
+    cache.read_csv(csv_path)
+    cache.store_object(csv_path, 'index', 'old index')
+    with open(csv_path, 'a') as f:
+        f.write("Germany,2002\n")
+
+    assert not cache.is_cached(csv_path, 'frame')
+    assert cache.load_object(csv_path, 'index') is None
+    assert len(cache.read_csv(csv_path)) == 3
+
+
+def test_mtime_change_invalidates(cache, csv_path):
+    cache.read_csv(csv_path)
+    stat = os.stat(csv_path)
+    os.utime(csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+    assert not cache.is_cached(csv_path, 'frame')
+    assert cache.load_frame(csv_path) is None
+
+
+def test_no_write_for_a_file_changed_while_parsing(cache, csv_path):
+    signature = cache.signature(csv_path)
+    df = pd.read_csv(csv_path)
+    with open(csv_path, 'a') as f:
+        f.write("Germany,2002\n")
+
+    cache.store_frame(csv_path, df, signature)
+    cache.store_object(csv_path, 'index', 'stale index', signature)
+    assert cache.load_frame(csv_path) is None
+    assert cache.load_object(csv_path, 'index') is None
+
+
+def test_artifacts_of_an_older_version_are_not_loaded(cache, csv_path):
+    signature = cache.signature(csv_path)
+    with open(csv_path, 'a') as f:
+        f.write("Germany,2002\n")
+    cache.read_csv(csv_path)
+
+    assert cache.load_frame(csv_path, signature) is None
+    assert cache.load_frame(csv_path) is not None
+
+
+def test_no_temporary_files_are_left(cache, csv_path):
+    cache.read_csv(csv_path)
+    cache.store_object(csv_path, 'index', 'index')
+    entry = cache._entry_dir(csv_path)
+    assert not [name for name in os.listdir(entry) if name.endswith('.tmp')]
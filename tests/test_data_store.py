@@ -0,0 +1,173 @@
+"""Tests for DataStore loading, refreshing and cached searches"""
+
+import pandas as pd
+import pytest
+
+from utils.data_cache import DataCache
+from utils.data_store import DataStore
+from utils.result_view import DataFrameGroup
+
+
+def write_csv(path: str, rows: int, start: int = 0, header: bool = True, mode: str = 'w'):
+    pd.DataFrame({
+        'Country': [('India', 'Brazil', 'Germany')[i % 3] for i in range(start, start + rows)],
+        'Year': [2000 + i % 24 for i in range(start, start + rows)],
+        'GDP_Growth_Rate': [round(i * 0.1, 1) for i in range(start, start + rows)],
+    }).to_csv(path, index=False, header=header, mode=mode)
+
+
+@pytest.fixture
+def store(tmp_path):
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    (tmp_path / "reports").mkdir()
+    write_csv(str(data_dir / "a.csv"), 30)
+    store = DataStore(str(data_dir), str(tmp_path / "reports"), cache=DataCache(str(tmp_path / "cache")))
+    store.discover()
+    for future in store.load_in_background(eager=True):
+        future.result()
+    yield store
+    store.shutdown()
+
+
+def test_append_merges_statistics(store, capsys):
+    path = store.csv_paths['a.csv']
+    before = store.get_csv('a.csv')
+    store.searcher.summarize_dataframe(before)
+
+    write_csv(path, 12, start=30, header=False, mode='a')
+    store.refresh(path, 'modified')
+    assert "Appended 12 rows" in capsys.readouterr().out
+
+    df = store.get_csv('a.csv')
+    expected = pd.read_csv(path)
+    pd.testing.assert_frame_equal(df, expected)
+    assert store.searcher.get_summary_stats(df, 'GDP_Growth_Rate') == pytest.approx(
+        store.searcher.summarize_dataframe(expected).columns['GDP_Growth_Rate'].summary())
+    assert len(store.searcher.filter_by_country(df, 'Brazil')) == 14
+
+
+def test_rewrite_is_reloaded_in_full(store):
+    path = store.csv_paths['a.csv']
+    write_csv(path, 10, start=100)
+    store.refresh(path, 'modified')
+    pd.testing.assert_frame_equal(store.get_csv('a.csv'), pd.read_csv(path))
+
+
+def test_cached_rows_follow_the_searched_frame(store):
+    path = store.csv_paths['a.csv']
+    assert sum(len(rows) for _, _, c in store.search_csvs('india') for rows in c.values()) == 10
+
+    # Rewritten on disk, but the watcher has not refreshed the resident frame yet
+    write_csv(path, 6)
+    for _, df, column_rows in store.search_csvs('india'):
+        for rows in column_rows.values():
+            df.iloc[rows]
+
+    store.refresh(path, 'modified')
+    results = list(store.search_csvs('india'))
+    assert sum(len(rows) for _, _, c in results for rows in c.values()) == 2
+    for _, df, column_rows in results:
+        for rows in column_rows.values():
+            assert (df.iloc[rows]['Country'] == 'India').all()
+
+
+def test_streamed_chunks_are_not_cached(tmp_path):
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    write_csv(str(data_dir / "big.csv"), 2000)
+    store = DataStore(str(data_dir), str(tmp_path / "reports"), cache=DataCache(str(tmp_path / "cache")),
+                      memory_budget=1000, chunk_rows=500)
+    store.discover()
+    assert store.streamed_csvs == {'big.csv'}
+    try:
+        for _ in range(2):
+            chunks = list(store.search_csvs('india'))
+            assert len(chunks) == 4
+            assert sum(len(df) for _, df, _ in chunks) == 667
+        assert store.query_cache.stats()['entries'] == 0
+    finally:
+        store.shutdown()
+
+
+def test_streamed_search_matches_the_in_memory_search(tmp_path):
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    write_csv(str(data_dir / "big.csv"), 2000)
+    stores = [
+        DataStore(str(data_dir), str(tmp_path / "reports"), cache=DataCache(str(tmp_path / name)), **options)
+        for name, options in [("resident", {}), ("streamed", {'memory_budget': 1000, 'chunk_rows': 300})]
+    ]
+    try:
+        found = []
+        for store in stores:
+            store.discover()
+            groups = {}
+            for filename, df, column_rows in store.search_csvs('20'):
+                for column, rows in column_rows.items():
+                    group = groups.setdefault((filename, column), DataFrameGroup(filename, column))
+                    group.add_rows(df, rows)
+            found.append({key: sorted(group.fetch(0, group.count)) for key, group in groups.items()})
+        assert stores[1].streamed_csvs == {'big.csv'}
+        assert set(found[0]) == {('big.csv', 'Year'), ('big.csv', 'GDP_Growth_Rate')}
+        assert found[0] == found[1]
+    finally:
+        for store in stores:
+            store.shutdown()
+
+
+def test_least_recently_used_is_evicted_counting_indexes(tmp_path):
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    for name in 'abc':
+        write_csv(str(data_dir / f"{name}.csv"), 300)
+
+    def open_store(budget):
+        store = DataStore(str(data_dir), str(tmp_path / "reports"), cache=DataCache(str(tmp_path / "cache")),
+                          memory_budget=budget)
+        store.discover()
+        return store
+
+    probe = open_store(None)
+    probe.get_csv('a.csv')
+    frame, full = probe.csv_bytes['a.csv'], probe.resident_bytes
+    probe.shutdown()
+
+    # All three frames would fit, but not together with their indexes
+    budget = 2 * full + full // 2
+    assert 3 * frame <= budget < 3 * full
+    store = open_store(budget)
+    try:
+        for name in ('a.csv', 'b.csv', 'c.csv'):
+            store.get_csv(name)
+        assert list(store.csv_data) == ['b.csv', 'c.csv']
+
+        store.get_csv('b.csv')
+        store.get_csv('a.csv')
+        assert list(store.csv_data) == ['b.csv', 'a.csv']
+        assert store.evictions == 2
+        assert store.resident_bytes <= budget
+        assert store.cache_info()['hits'] == 1
+    finally:
+        store.shutdown()
+
+
+def test_suggestions_find_rows(store):
+    assert store.suggest('brasil') == 'brazil'
+    assert store.suggest('germnay') == 'germany'
+    # Each word is known after correction, but no cell holds the whole query
+    assert store.suggest('brazil indai') is None
+    assert store.suggest('india') is None
+
+
+def test_typo_index_follows_file_versions(store):
+    store.suggest('brasil')
+    typo_index = store.searcher._typo_index
+    store.suggest('indai')
+    assert store.searcher._typo_index is typo_index
+
+    path = store.csv_paths['a.csv']
+    pd.DataFrame({'Country': ['Argentina'], 'Year': [2020], 'GDP_Growth_Rate': [1.0]}).to_csv(path, index=False)
+    store.refresh(path, 'modified')
+    assert store.suggest('argentna') == 'argentina'
+    assert store.searcher._typo_index is not typo_index
@@ -0,0 +1,87 @@
+"""Tests for the file watcher and the refreshes it drives in DataStore"""
+
+import os
+import pathlib
+import queue
+
+import pandas as pd
+
+from utils.data_cache import DataCache
+from utils.data_store import DataStore
+from utils.file_watcher import FileWatcher
+
+
+def write_csv(path: str, countries, mode: str = 'w'):
+    pd.DataFrame({'Country': countries, 'Year': range(2000, 2000 + len(countries))}).to_csv(
+        path, index=False, header=mode == 'w', mode=mode)
+
+
+def test_check_reports_each_change_once(tmp_path):
+    changes = []
+    watcher = FileWatcher([(str(tmp_path), ("*.csv",))], lambda path, kind: changes.append((os.path.basename(path), kind)))
+    write_csv(str(tmp_path / "a.csv"), ['India'])
+    watcher.start()
+    watcher.stop()
+    assert watcher.check() == []
+
+    write_csv(str(tmp_path / "b.csv"), ['Brazil'])
+    (tmp_path / "notes.txt").write_text("not watched")
+    write_csv(str(tmp_path / "a.csv"), ['Germany'], mode='a')
+    watcher.check()
+    assert sorted(changes) == [('a.csv', 'modified'), ('b.csv', 'added')]
+
+    changes.clear()
+    os.remove(tmp_path / "b.csv")
+    watcher.check()
+    assert changes == [('b.csv', 'deleted')]
+    assert watcher.check() == []
+
+
+def test_watched_changes_are_searchable(tmp_path):
+    data_dir = tmp_path / "data"
+    reports_dir = tmp_path / "reports"
+    data_dir.mkdir()
+    reports_dir.mkdir()
+    write_csv(str(data_dir / "a.csv"), ['India', 'Brazil'])
+    (reports_dir / "old.txt").write_text("Inflation outlook")
+
+    store = DataStore(str(data_dir), str(reports_dir), cache=DataCache(str(tmp_path / "cache")))
+    store.discover()
+    for future in store.load_in_background(eager=True):
+        future.result()
+    refreshed = queue.Queue()
+    store.start_watching(lambda filename, kind, error: refreshed.put((filename, kind, error)), poll_interval=0.05)
+
+    def wait_for(count):
+        events = sorted(refreshed.get(timeout=10) for _ in range(count))
+        assert all(error is None for _, _, error in events)
+        return [(filename, kind) for filename, kind, _ in events]
+
+    def countries(query):
+        return sorted(country for _, df, column_rows in store.search_csvs(query)
+                      for rows in column_rows.values() for country in df.iloc[rows]['Country'])
+
+    def create(path, write):
+        # Complete before the watcher can see it
+        write(str(tmp_path / "partial"))
+        os.replace(tmp_path / "partial", path)
+
+    try:
+        assert countries('germany') == []
+        write_csv(str(data_dir / "a.csv"), ['Germany'], mode='a')
+        create(data_dir / "b.csv", lambda path: write_csv(path, ['Germany']))
+        create(reports_dir / "new.txt", lambda path: pathlib.Path(path).write_text("Germany trade report"))
+        assert wait_for(3) == [('a.csv', 'modified'), ('b.csv', 'added'), ('new.txt', 'added')]
+
+        assert countries('germany') == ['Germany', 'Germany']
+        assert len(store.get_csv('a.csv')) == 3
+        hits, total = store.search_reports('germany')
+        assert [hit.name for hit in hits] == ['new.txt']
+
+        os.remove(data_dir / "b.csv")
+        os.remove(reports_dir / "old.txt")
+        assert wait_for(2) == [('b.csv', 'deleted'), ('old.txt', 'deleted')]
+        assert countries('germany') == ['Germany']
+        assert store.search_reports('inflation')[1] == 0
+    finally:
+        store.shutdown()
@@ -0,0 +1,22 @@
+"""Tests for the query profiler"""
+
+import tracemalloc
+
+from utils.instrumentation import QueryProfiler
+
+
+def test_overlapping_profiles():
+    first, second = QueryProfiler(), QueryProfiler()
+    first.start()
+    second.start()
+    data = [str(i) for i in range(10000)]
+    first.stop()
+    assert tracemalloc.is_tracing()
+    data.extend(str(i) for i in range(10000))
+    second.stop()
+    assert not tracemalloc.is_tracing()
+
+    for profiler in (first, second):
+        lines = profiler.report()
+        assert lines[0].startswith("Profiled")
+        assert "Largest allocations:" in lines
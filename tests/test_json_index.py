@@ -0,0 +1,90 @@
+"""Tests for the flattened JSON path table and the JSON search built on it"""
+
+import pytest
+
+from utils.json_index import FlatJSON
+from utils.search_utils import DataSearcher
+
+REPORT = {
+    'title': 'Economic Outlook',
+    'executive_summary': {
+        'overview': 'GDP growth in India stayed strong',
+        'risks': ['Inflation', 'Trade tensions', {'note': 'growth may slow'}],
+    },
+    'executive_summary_extra': 'growth appendix',
+    'sections': [
+        {'name': 'Education', 'text': 'Education spending grew; education matters'},
+        {'name': 'Growth', 'value': 3.5},
+    ],
+}
+
+
+def walk(obj, path=""):
+    """Leaves of a document in the order a recursive walk visits them"""
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            yield from walk(value, f"{path}.{key}" if path else key)
+    elif isinstance(obj, list):
+        for i, item in enumerate(obj):
+            yield from walk(item, f"{path}[{i}]")
+    else:
+        yield path, str(obj)
+
+
+@pytest.fixture
+def flat():
+    return FlatJSON(REPORT)
+
+
+def test_paths_follow_a_recursive_walk(flat):
+    assert list(zip(flat.paths.tolist(), flat.values.tolist())) == list(walk(REPORT))
+
+
+@pytest.mark.parametrize('keyword', ['growth', 'education', 'in', 'h', '3.5', 'missing'])
+def test_find_matches_a_substring_scan(flat, keyword):
+    expected = [i for i, (_, value) in enumerate(walk(REPORT)) if keyword in value.lower()]
+    assert flat.find(keyword).tolist() == expected
+
+
+def test_keywords_do_not_match_across_leaves(flat):
+    # 'Outlook' ends one leaf and 'GDP' starts the next
+    assert len(flat.find('outlookgdp')) == 0
+
+
+@pytest.mark.parametrize('prefix, expected', [
+    (None, 10),
+    ('executive_summary', 4),
+    ('executive_summary.*', 4),
+    ('executive_summary.risks', 3),
+    ('executive_summary.risks[2]', 1),
+    ('sections', 4),
+    ('title', 1),
+    ('nothing', 0),
+])
+def test_prefix_mask(flat, prefix, expected):
+    mask = flat.prefix_mask(prefix)
+    assert mask.sum() == expected
+    if prefix:
+        base = prefix[:-2] if prefix.endswith('.*') else prefix
+        # a sibling sharing the prefix text is not under it
+        assert all(path == base or path[len(base)] in '.[' for path in flat.paths[mask].tolist())
+
+
+def test_search_matches_the_recursive_search(flat):
+    searcher = DataSearcher()
+    for query in ['growth education', 'trade inflation', 'india']:
+        keywords = searcher.preprocess_query(query)
+        expected = {
+            (path, keyword) for path, value in walk(REPORT) for keyword in keywords if keyword in value.lower()
+        }
+        from_dict = searcher.search_json_content(REPORT, query)
+        from_table = searcher.search_json_content(flat, query)
+        assert {(m['path'], m['keyword']) for m in from_table} == expected
+        assert from_dict == from_table
+        scores = [m['relevance_score'] for m in from_table]
+        assert scores == sorted(scores, reverse=True)
+
+
+def test_search_within_a_prefix(flat):
+    matches = DataSearcher().search_json_content(flat, 'growth', path_prefix='executive_summary.*')
+    assert sorted(m['path'] for m in matches) == ['executive_summary.overview', 'executive_summary.risks[2].note']
@@ -0,0 +1,82 @@
+"""Tests for BM25 ranking and phrase queries over the report index"""
+
+import pytest
+
+from utils.report_index import DocumentIndex, ReportIndex
+
+
+@pytest.fixture
+def index():
+    index = ReportIndex()
+    reports = {
+        'growth.txt': "GDP growth in India.\nGrowth of exports drove growth.\nGrowth outlook.",
+        'mixed.txt': "GDP growth was modest.\nInflation and trade dominated.\nGrowth of trade.",
+        'trade.txt': "Trade policy and tariffs.\nExport growth slowed.\nTrade balance.",
+        'padded.txt': "Growth.\n" + "Unrelated filler text about weather and sport.\n" * 20,
+    }
+    for name, text in reports.items():
+        index.add(name, DocumentIndex(text))
+    return index
+
+
+def names(hits):
+    return [hit.name for hit in hits]
+
+
+def test_more_occurrences_rank_higher(index):
+    hits, total = index.search("growth")
+    assert total == 4
+    assert names(hits)[0] == 'growth.txt'
+
+
+def test_longer_documents_rank_lower(index):
+    hits, _ = index.search("growth")
+    # one occurrence each, but padded.txt is many times longer
+    ranked = names(hits)
+    assert ranked.index('trade.txt') < ranked.index('padded.txt')
+
+
+def test_rare_terms_weigh_more(index):
+    hits, total = index.search("growth inflation")
+    assert total == 4
+    assert names(hits)[0] == 'mixed.txt'
+
+
+def test_scores_are_descending_and_top_k_is_applied(index):
+    hits, total = index.search("growth trade", top_k=2)
+    assert total == 4
+    assert len(hits) == 2
+    assert hits[0].score >= hits[1].score
+
+
+def test_phrases_are_required(index):
+    hits, total = index.search('"gdp growth"')
+    assert total == 2
+    assert sorted(names(hits)) == ['growth.txt', 'mixed.txt']
+
+    # trade.txt has both words, but not next to each other in that order
+    hits, total = index.search('"growth export"')
+    assert total == 0 and hits == []
+
+
+def test_phrase_and_free_terms(index):
+    hits, total = index.search('"gdp growth" trade')
+    assert total == 2
+    assert names(hits)[0] == 'mixed.txt'
+
+
+def test_phrase_spans_lines_and_is_highlighted(index):
+    index.add('wrapped.txt', DocumentIndex("Report on GDP\ngrowth rates."))
+    hits, _ = index.search('"gdp growth"')
+    assert 'wrapped.txt' in names(hits)
+    lines = {hit.name: hit.lines for hit in hits}
+    assert "**GDP growth** in India." in lines['growth.txt']
+
+
+def test_prefixes_expand_and_removed_reports_are_forgotten(index):
+    hits, total = index.search("tarif")
+    assert names(hits) == ['trade.txt']
+
+    index.remove('trade.txt')
+    hits, total = index.search("tarif")
+    assert total == 0
@@ -0,0 +1,54 @@
+"""Tests for the dictionary-encoded n-gram column index"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.search_index import SCAN_UNIQUES_LIMIT, DatasetIndex
+
+TERMS = ['india', 'ind', 'a', 'nan', 'none', '2.5', '1', '.', '(', 'a+', '[x', '$', '\\', '*', 'ger-0000', 'zzz']
+
+
+def baseline(df: pd.DataFrame, term: str, exact: bool):
+    """The original full-scan search: literal contains (or equality) on the lowercased string form"""
+    matches = {}
+    for column in df.columns:
+        values = df[column].astype(str).str.lower()
+        mask = values == term if exact else values.str.contains(term, na=False, regex=False)
+        if mask.any():
+            matches[column] = np.flatnonzero(mask.to_numpy())
+    return matches
+
+
+@pytest.fixture(scope="module", params=[200, SCAN_UNIQUES_LIMIT * 3])
+def frame(request):
+    rows = request.param
+    rng = np.random.default_rng(rows)
+    df = pd.DataFrame({
+        'Country': rng.choice(['India', 'Brazil', 'Germany', 'United States', 'a+b (x)', '$[x]*'], rows),
+        'Region': [f"GER-{i:06d}" for i in range(rows)],
+        'GDP': np.round(rng.normal(2.5, 1.5, rows), 3),
+        'Year': rng.integers(1990, 2024, rows),
+        'Mixed': rng.choice(np.array([1, 'India', True, None, 2.5, 'NaN'], dtype=object), rows),
+    })
+    df.loc[::7, 'Country'] = None
+    df.loc[::11, 'GDP'] = np.nan
+    return df
+
+
+@pytest.mark.parametrize('postings', [True, False])
+@pytest.mark.parametrize('exact', [False, True])
+def test_index_matches_full_scan(frame, postings, exact):
+    index = DatasetIndex(frame, postings=postings)
+    for term in TERMS:
+        found = index.search(term, exact=exact)
+        expected = baseline(frame, term, exact)
+        assert found.keys() == expected.keys(), term
+        for column in found:
+            np.testing.assert_array_equal(found[column], expected[column], err_msg=term)
+
+
+def test_numeric_columns_get_no_postings(frame):
+    index = DatasetIndex(frame)
+    assert index.columns['GDP'].grams is None
+    assert index.columns['Year'].grams is None
@@ -0,0 +1,81 @@
+"""Tests for DataSearcher index memoisation"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from utils.search_utils import DataSearcher
+
+
+def sample_frame() -> pd.DataFrame:
+    return pd.DataFrame({
+        'Country': ['India', 'Brazil', 'Germany', 'India'],
+        'Year': [2020, 2021, 2022, 2023],
+        'GDP_Growth_Rate': [6.1, 2.9, 1.8, 7.2],
+    })
+
+
+def test_in_place_edits_are_seen():
+    searcher = DataSearcher()
+    df = sample_frame()
+    assert len(searcher.filter_by_country(df, 'India')) == 2
+    assert len(searcher.search_dataframe(df, 'brazil')[0]) == 1
+
+    df.loc[1, 'Country'] = 'India'
+    assert len(searcher.filter_by_country(df, 'India')) == 3
+    assert searcher.search_dataframe(df, 'brazil')[0].empty
+
+    df.drop(index=2, inplace=True)
+    assert len(searcher.filter_by_country(df, 'Germany')) == 0
+    assert len(searcher.filter_by_year(df, 2023)) == 1
+    assert searcher.get_summary_stats(df, 'GDP_Growth_Rate')['count'] == 3
+
+
+def test_adopted_frames_keep_their_indexes():
+    searcher = DataSearcher()
+    df = sample_frame()
+    assert searcher.index_dataframe(df) is not searcher.index_dataframe(df)
+
+    searcher.adopt_dataframe(df)
+    index = searcher.index_dataframe(df)
+    assert searcher.index_dataframe(df) is index
+    assert searcher.key_index(df, 'Country') is searcher.key_index(df, 'Country')
+
+    searcher.release_dataframe(df)
+    assert searcher.index_dataframe(df) is not index
+
+
+def test_rank_rows_of_one_off_frames():
+    searcher = DataSearcher()
+    df = pd.DataFrame({'Country': ['Germany', 'East Germany', 'germany germany', 'India', 'Germany'] * 20})
+    searcher.adopt_dataframe(df)
+    rows = searcher.index_dataframe(df).search('germany')['Country']
+    expected = searcher.rank_rows(df, 'Country', rows, 'germany')
+
+    # e.g. the matching rows of a streamed chunk, which is never adopted
+    subset = df.iloc[rows]
+    one_off = DataSearcher()
+    ranked = one_off.rank_rows(subset, 'Country', np.arange(len(rows)), 'germany')
+    np.testing.assert_array_equal(rows[ranked], expected)
+    matches, _, _ = one_off.search_dataframe_ranked(subset, 'germany')
+    np.testing.assert_array_equal(matches.index.to_numpy(), subset.index.to_numpy()[ranked])
+
+
+def test_concurrent_suggestions_share_one_typo_index():
+    searcher = DataSearcher()
+    df = sample_frame()
+    searcher.adopt_dataframe(df)
+    rebuilds = []
+
+    def datasets():
+        rebuilds.append(1)
+        # Slow enough for every thread to reach the check before it is rebuilt
+        time.sleep(0.1)
+        yield 'a.csv', df
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(lambda _: searcher.suggest_queries(datasets(), 'brasil', key='v1'), range(4)))
+    assert results == [['brazil']] * 4
+    assert len(rebuilds) == 1
@@ -0,0 +1,76 @@
+"""End-to-end tests of the HTTP/JSON search service on the bundled sample data"""
+
+import json
+import os
+import threading
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from server import create_server
+from utils.data_cache import DataCache
+from utils.data_store import DataStore
+from utils.search_service import SearchService
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture(scope="module")
+def base_url(tmp_path_factory):
+    store = DataStore(os.path.join(ROOT, "data"), os.path.join(ROOT, "reports"),
+                      cache=DataCache(str(tmp_path_factory.mktemp("cache"))))
+    service = SearchService(store)
+    service.load()
+    server = create_server(service, port=0, quiet=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+    service.shutdown()
+
+
+def get(url: str):
+    with urllib.request.urlopen(url) as response:
+        return json.load(response)
+
+
+def test_search_data(base_url):
+    result = get(f"{base_url}/search/data?q=india&limit=2")
+    assert result['mode'] == 'data'
+    assert {group['file'] for group in result['groups']} == {'gdp.csv', 'education.csv', 'inequality.csv'}
+    assert all(len(group['rows']) <= 2 for group in result['groups'])
+    assert all(row['Country'] == 'India' for group in result['groups'] for row in group['rows'])
+    assert result['stats']['files_hit'] == 3
+
+
+def test_search_reports(base_url):
+    result = get(f"{base_url}/search/reports?q=growth&top_k=2")
+    assert result['total'] >= 2
+    assert len(result['hits']) == 2
+    assert result['hits'][0]['score'] >= result['hits'][1]['score']
+
+
+def test_concurrent_profiles(base_url):
+    # Distinct requests, so none is shared with another in flight or answered from the query cache
+    urls = [f"{base_url}/search/data?q=brazil&limit={i}&profile=1" for i in range(1, 9)]
+    urls += [f"{base_url}/search/reports?q=growth&top_k={i}&profile=1" for i in range(1, 9)]
+    with ThreadPoolExecutor(max_workers=len(urls)) as pool:
+        results = list(pool.map(get, urls))
+    for result in results:
+        assert result['profile'][0].startswith("Profiled")
+
+
+def test_health_and_errors(base_url):
+    health = get(f"{base_url}/health")
+    assert health['status'] == 'ok'
+    assert 'match' in health['instruments']['stages']
+
+    with pytest.raises(urllib.error.HTTPError) as error:
+        get(f"{base_url}/nowhere")
+    assert error.value.code == 404
+    with pytest.raises(urllib.error.HTTPError) as error:
+        get(f"{base_url}/search/data?q=india&limit=x")
+    assert error.value.code == 400
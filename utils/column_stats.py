@@ -0,0 +1,145 @@
+"""
+Summary statistics for EconoVisionAI
+Numeric column aggregates computed once per dataset (one vectorised pass over
+the sorted order the column's NumericIndex already keeps), per Country/Year
+group, and merged incrementally when rows are appended instead of being
+recomputed; only a few numbers are kept per column and group
+"""
+
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Columns whose groups get their own statistics
+GROUP_COLUMNS = ('Country', 'Year')
+
+# Quantiles of the summary: q25, median, q75
+QUANTILES = (0.25, 0.5, 0.75)
+
+
+def run_quantiles(sorted_values: np.ndarray, starts: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """
+    QUANTILES of every sorted run sorted_values[start:start + count], one row
+    per run, with linear interpolation as Series.quantile; runs must not be empty
+    """
+    positions = np.multiply.outer(counts - 1, QUANTILES)
+    low = np.floor(positions).astype(np.int64)
+    high = np.minimum(low + 1, (counts - 1)[:, None])
+    fraction = positions - low
+    low_values = sorted_values[starts[:, None] + low]
+    return low_values + (sorted_values[starts[:, None] + high] - low_values) * fraction
+
+
+class ColumnStats:
+    """
+    Mergeable statistics of one numeric column.
+    Moments (count, mean, sum of squared deviations) are combined with the
+    parallel Welford/Chan update, min and max directly. Quantiles are not
+    mergeable without keeping the values, so a merge leaves them unknown
+    (None) and they are taken again from the column's sorted index when
+    asked for (see DataSearcher.get_summary_stats).
+    """
+
+    def __init__(self, count: int, mean: float, m2: float, minimum: float, maximum: float,
+                 quantiles: Optional[Tuple[float, ...]] = None):
+        self.count = count
+        self.mean = mean
+        self.m2 = m2
+        self.min = minimum
+        self.max = maximum
+        self.quantiles = quantiles
+
+    @classmethod
+    def from_sorted(cls, sorted_values: np.ndarray) -> 'ColumnStats':
+        """Statistics of sorted values without NaN (e.g. a NumericIndex's)"""
+        count = len(sorted_values)
+        if not count:
+            return cls(0, float('nan'), 0.0, float('nan'), float('nan'), (float('nan'),) * len(QUANTILES))
+        mean = float(sorted_values.mean())
+        m2 = float(((sorted_values - mean) ** 2).sum())
+        quantiles = run_quantiles(sorted_values, np.zeros(1, dtype=np.int64), np.array([count]))[0]
+        return cls(count, mean, m2, float(sorted_values[0]), float(sorted_values[-1]), tuple(quantiles.tolist()))
+
+    def merge(self, other: 'ColumnStats') -> 'ColumnStats':
+        """Statistics of both samples together; quantiles become unknown"""
+        if not other.count:
+            return self
+        if not self.count:
+            return other
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        mean = self.mean + delta * other.count / count
+        m2 = self.m2 + other.m2 + delta * delta * self.count * other.count / count
+        return ColumnStats(count, mean, m2, min(self.min, other.min), max(self.max, other.max))
+
+    @property
+    def std(self) -> float:
+        """Sample standard deviation (ddof=1, as pandas)"""
+        return float(np.sqrt(self.m2 / (self.count - 1))) if self.count > 1 else float('nan')
+
+    def summary(self) -> Dict[str, Any]:
+        q25, median, q75 = self.quantiles if self.quantiles is not None else (float('nan'),) * len(QUANTILES)
+        return {
+            'count': self.count,
+            'mean': self.mean,
+            'median': median,
+            'std': self.std,
+            'min': self.min,
+            'max': self.max,
+            'q25': q25,
+            'q75': q75
+        }
+
+
+def grouped_stats(keys: pd.Series, values: np.ndarray) -> Dict[Hashable, ColumnStats]:
+    """
+    Statistics of values per distinct key, from one lexsort and bincount
+    sums instead of a pass per group; rows with a missing key or value are skipped
+    """
+    codes, uniques = pd.factorize(keys, sort=True)
+    present = (codes >= 0) & ~np.isnan(values)
+    codes = codes[present]
+    values = values[present]
+
+    # Sort by (group, value): every group becomes one sorted run
+    order = np.lexsort((values, codes))
+    codes = codes[order]
+    values = values[order]
+
+    counts = np.bincount(codes, minlength=len(uniques))
+    sums = np.bincount(codes, weights=values, minlength=len(uniques))
+    means = np.divide(sums, counts, out=np.full(len(uniques), np.nan), where=counts > 0)
+    m2s = np.bincount(codes, weights=(values - means[codes]) ** 2, minlength=len(uniques))
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1])).astype(np.int64)
+
+    hit = np.flatnonzero(counts)
+    quantiles = run_quantiles(values, starts[hit], counts[hit]).tolist()
+    minimums = values[starts[hit]].tolist()
+    maximums = values[starts[hit] + counts[hit] - 1].tolist()
+    keys = uniques.tolist()
+    return {
+        keys[i]: ColumnStats(int(counts[i]), float(means[i]), float(m2s[i]), minimum, maximum, tuple(group_quantiles))
+        for i, minimum, maximum, group_quantiles in zip(hit.tolist(), minimums, maximums, quantiles)
+    }
+
+
+class DatasetStats:
+    """Column and per-group statistics of one dataset"""
+
+    def __init__(self):
+        self.columns: Dict[str, ColumnStats] = {}
+        # (group column, value column) -> {group key: ColumnStats}
+        self.groups: Dict[Tuple[str, str], Dict[Hashable, ColumnStats]] = {}
+
+    def merge(self, other: 'DatasetStats') -> 'DatasetStats':
+        """Statistics of both datasets together, e.g. a file and rows appended to it"""
+        merged = DatasetStats()
+        for column in self.columns.keys() & other.columns.keys():
+            merged.columns[column] = self.columns[column].merge(other.columns[column])
+        for key in self.groups.keys() & other.groups.keys():
+            groups = dict(self.groups[key])
+            for group, stats in other.groups[key].items():
+                groups[group] = groups[group].merge(stats) if group in groups else stats
+            merged.groups[key] = groups
+        return merged
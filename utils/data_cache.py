@@ -0,0 +1,214 @@
+"""
+On-disk cache for EconoVisionAI
+Keeps a columnar binary copy of each CSV, parsed reports and search indexes
+so unchanged files load without being re-parsed
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import shutil
+import tempfile
+from typing import Any, Dict, Optional
+
+import pandas as pd
+
+try:
+    import pyarrow.feather as feather
+except ImportError:  # pyarrow is optional; fall back to pickled frames
+    feather = None
+
+DEFAULT_CACHE_DIR = ".econovision_cache"
+
+# Bump when the layout of any cached artifact changes
+CACHE_VERSION = 4
+
+
+class DataCache:
+    """File cache keyed by source path, size and modification time"""
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR):
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def signature(self, path: str) -> Dict[str, Any]:
+        """
+        Identity of the current version of a source file. Take it before
+        reading the file and pass it to the load_*/store_* calls, so what is
+        cached is always filed under the version that was actually read.
+        """
+        stat = os.stat(path)
+        return {
+            'path': os.path.abspath(path),
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'version': CACHE_VERSION,
+        }
+
+    def _entry_dir(self, path: str) -> str:
+        digest = hashlib.sha1(os.path.abspath(path).encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, digest)
+
+    @staticmethod
+    def _read_meta(entry: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(os.path.join(entry, 'meta.json'), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _valid_entry(self, path: str, signature: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        """
+        Return the entry directory if it holds the given version of the file
+        (default: the version on disk). Stale entries (file changed since it
+        was cached) are removed.
+        """
+        entry = self._entry_dir(path)
+        meta = self._read_meta(entry)
+        if meta is None:
+            return None
+
+        if meta != self.signature(path):
+            shutil.rmtree(entry, ignore_errors=True)
+            return None
+        if signature is not None and meta != signature:
+            return None
+        return entry
+
+    def _writable_entry(self, path: str, signature: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        """
+        Return the entry directory for the given version of the file (default:
+        the version on disk), (re)creating it if needed; None if the file has
+        changed since that version was read, so nothing may be stored for it
+        """
+        current = self.signature(path)
+        if signature is not None and signature != current:
+            return None
+
+        entry = self._entry_dir(path)
+        if self._read_meta(entry) == current:
+            return entry
+        shutil.rmtree(entry, ignore_errors=True)
+        os.makedirs(entry, exist_ok=True)
+        self._atomic_write(os.path.join(entry, 'meta.json'), json.dumps(current).encode('utf-8'))
+        return entry
+
+    @staticmethod
+    def _temporary(target: str) -> str:
+        """A new, uniquely named file next to target, so concurrent writers never share one"""
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(target), prefix=f"{os.path.basename(target)}.",
+                                   suffix=".tmp")
+        os.close(fd)
+        return tmp
+
+    @classmethod
+    def _atomic_write(cls, target: str, data: bytes):
+        tmp = cls._temporary(target)
+        try:
+            with open(tmp, 'wb') as f:
+                f.write(data)
+            os.replace(tmp, target)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def is_cached(self, path: str, *names: str) -> bool:
+        """True if the file has a fresh entry holding every named artifact"""
+        entry = self._valid_entry(path)
+        if entry is None:
+            return False
+        files = set(os.listdir(entry))
+        for name in names:
+            if name == 'frame':
+                if 'frame.arrow' not in files and 'frame.pkl' not in files:
+                    return False
+            elif f"{name}.pkl" not in files:
+                return False
+        return True
+
+    def load_frame(self, path: str, signature: Optional[Dict[str, Any]] = None) -> Optional[pd.DataFrame]:
+        """Load the cached columnar copy of a CSV, or None if missing/stale"""
+        entry = self._valid_entry(path, signature)
+        if entry is None:
+            return None
+
+        try:
+            if feather is not None and os.path.exists(os.path.join(entry, 'frame.arrow')):
+                table = feather.read_table(os.path.join(entry, 'frame.arrow'), memory_map=True)
+                return table.to_pandas()
+            if os.path.exists(os.path.join(entry, 'frame.pkl')):
+                return pd.read_pickle(os.path.join(entry, 'frame.pkl'))
+        except Exception as e:
+            print(f"Ignoring unreadable cache for {path}: {e}")
+        return None
+
+    def store_frame(self, path: str, df: pd.DataFrame, signature: Optional[Dict[str, Any]] = None):
+        """Store a columnar copy of a parsed CSV read at version signature"""
+        try:
+            entry = self._writable_entry(path, signature)
+            if entry is None:
+                return
+            if feather is not None:
+                tmp = self._temporary(os.path.join(entry, 'frame.arrow'))
+                try:
+                    feather.write_feather(df, tmp, compression='uncompressed')
+                    os.replace(tmp, os.path.join(entry, 'frame.arrow'))
+                    return
+                except Exception:
+                    # e.g. non-string column names; pickle handles any frame
+                    os.unlink(tmp)
+            self._atomic_write(os.path.join(entry, 'frame.pkl'),
+                               pickle.dumps(df, protocol=pickle.HIGHEST_PROTOCOL))
+        except Exception as e:
+            print(f"Could not cache {path}: {e}")
+
+    def load_object(self, path: str, name: str, signature: Optional[Dict[str, Any]] = None) -> Optional[Any]:
+        """Load a pickled artifact (parsed report, search index, ...) for a file"""
+        entry = self._valid_entry(path, signature)
+        if entry is None:
+            return None
+
+        try:
+            with open(os.path.join(entry, f"{name}.pkl"), 'rb') as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"Ignoring unreadable cache for {path} ({name}): {e}")
+            return None
+
+    def store_object(self, path: str, name: str, obj: Any, signature: Optional[Dict[str, Any]] = None):
+        """Store a pickled artifact computed from the file at version signature"""
+        try:
+            entry = self._writable_entry(path, signature)
+            if entry is None:
+                return
+            self._atomic_write(os.path.join(entry, f"{name}.pkl"),
+                               pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL))
+        except Exception as e:
+            print(f"Could not cache {name} for {path}: {e}")
+
+    def read_csv(self, path: str, signature: Optional[Dict[str, Any]] = None) -> pd.DataFrame:
+        """Read a CSV through the cache, parsing it only when it has changed"""
+        signature = signature or self.signature(path)
+        df = self.load_frame(path, signature)
+        if df is None:
+            df = pd.read_csv(path)
+            self.store_frame(path, df, signature)
+        return df
+
+    def read_json(self, path: str, signature: Optional[Dict[str, Any]] = None) -> Any:
+        """Read a JSON report through the cache"""
+        signature = signature or self.signature(path)
+        content = self.load_object(path, 'json', signature)
+        if content is None:
+            with open(path, 'r', encoding='utf-8') as f:
+                content = json.load(f)
+            self.store_object(path, 'json', content, signature)
+        return content
+
+    def clear(self):
+        """Remove every cached entry"""
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+        os.makedirs(self.cache_dir, exist_ok=True)
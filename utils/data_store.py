@@ -0,0 +1,703 @@
+"""
+Data store for EconoVisionAI
+Discovers CSV datasets and reports, loads them on a background thread pool
+and keeps files that are never queried unloaded until they are needed.
+Resident CSVs are kept within a memory budget by evicting the least
+recently searched ones; CSVs too large for the budget are streamed instead.
+Files changed on disk are re-indexed one at a time and swapped in
+"""
+
+import glob
+import io
+import itertools
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+import numpy as np
+
+import pandas as pd
+
+from .data_cache import DataCache
+from .file_watcher import FileWatcher
+from .instrumentation import instruments
+from .json_index import FlatJSON
+from .query_cache import QueryCache, file_versions
+from .report_index import DocumentIndex, ReportHit, ReportIndex, report_text
+from .search_utils import DataSearcher, SearchStats
+
+# Callback signature: (filename, files_done, files_total, error or None)
+ProgressCallback = Callable[[str, int, int, Optional[Exception]], None]
+
+# Callback signature: (filename, 'added' | 'modified' | 'deleted', error or None)
+RefreshCallback = Callable[[str, str, Optional[Exception]], None]
+
+# Rows per chunk when a CSV is scanned instead of loaded
+STREAM_CHUNK_ROWS = 100_000
+
+# Lines read from the top of a CSV to estimate its loaded size
+ESTIMATE_SAMPLE_ROWS = 1000
+
+# Bytes at the end of a loaded CSV remembered to recognise later appends
+APPEND_CHECK_BYTES = 64 * 1024
+
+# (size, mtime_ns, last APPEND_CHECK_BYTES bytes) of the CSV a frame was loaded from
+CsvSource = Tuple[int, int, bytes]
+
+
+def estimate_csv_memory(path: str, sample_rows: int = ESTIMATE_SAMPLE_ROWS) -> int:
+    """
+    Estimated bytes a CSV takes once loaded into a DataFrame, extrapolated
+    from the in-memory size of its first rows; falls back to the file size
+    """
+    size = os.path.getsize(path)
+    try:
+        with open(path, 'rb') as f:
+            sample = b''.join(itertools.islice(f, sample_rows + 1))
+        if not sample:
+            return 0
+        used = int(pd.read_csv(io.BytesIO(sample)).memory_usage(deep=True).sum())
+        return used if len(sample) >= size else int(used * size / len(sample))
+    except Exception as e:
+        print(f"Error estimating size of {path}: {e}")
+        return size
+
+
+def csv_source(path: str) -> Optional[CsvSource]:
+    """Current version of a CSV on disk, or None if it cannot be read"""
+    try:
+        with open(path, 'rb') as f:
+            stat = os.fstat(f.fileno())
+            f.seek(max(0, stat.st_size - APPEND_CHECK_BYTES))
+            return stat.st_size, stat.st_mtime_ns, f.read(APPEND_CHECK_BYTES)
+    except OSError:
+        return None
+
+
+class DataStore:
+    """Thread-safe registry of CSV datasets and reports with lazy loading"""
+
+    def __init__(self, data_dir: str = "data", reports_dir: str = "reports",
+                 searcher: Optional[DataSearcher] = None, cache: Optional[DataCache] = None,
+                 max_workers: Optional[int] = None, memory_budget: Optional[int] = None,
+                 chunk_rows: int = STREAM_CHUNK_ROWS):
+        self.data_dir = data_dir
+        self.reports_dir = reports_dir
+        self.searcher = searcher or DataSearcher()
+        self.cache = cache or DataCache()
+
+        # filename -> path for every file found on disk
+        self.csv_paths: Dict[str, str] = {}
+        self.report_paths: Dict[str, str] = {}
+
+        # filename -> loaded content; only resident files appear here.
+        # csv_data is kept in least- to most-recently-used order
+        self.csv_data: "OrderedDict[str, pd.DataFrame]" = OrderedDict()
+        self.report_data: Dict[str, Any] = {}
+
+        # BM25 full-text index over every loaded report
+        self.report_index = ReportIndex()
+        # filename -> flattened path table of each loaded JSON report
+        self.json_tables: Dict[str, FlatJSON] = {}
+
+        # Resident CSVs are held within memory_budget bytes, counting each frame
+        # (memory_usage(deep=True)) and the indexes and statistics derived from it,
+        # evicting the least recently used; CSVs whose estimated size alone
+        # exceeds the budget are never made resident and are streamed in chunks
+        self.memory_budget = memory_budget
+        self.chunk_rows = chunk_rows
+        self.streamed_csvs: Set[str] = set()
+        # filename -> bytes of each resident frame itself
+        self.csv_bytes: Dict[str, int] = {}
+        # filename -> version of the file each resident CSV was loaded from
+        self.csv_sources: Dict[str, CsvSource] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        # Results of repeated searches, invalidated when a source file changes
+        self.query_cache = QueryCache()
+
+        self._lock = threading.RLock()
+        self._pending: Dict[str, Future] = {}
+        self._queued: List[Future] = []
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="loader")
+
+        # Watches the folders for changed files once start_watching() is called
+        self.watcher: Optional[FileWatcher] = None
+        # One refresh at a time per file, so an older version never wins
+        self._refresh_locks: Dict[str, threading.Lock] = {}
+
+    def discover(self):
+        """Register every data and report file without reading it"""
+        if os.path.exists(self.data_dir):
+            for path in sorted(glob.glob(os.path.join(self.data_dir, "*.csv"))):
+                self._register(path)
+
+        if os.path.exists(self.reports_dir):
+            for pattern in ("*.txt", "*.json"):
+                for path in sorted(glob.glob(os.path.join(self.reports_dir, pattern))):
+                    self._register(path)
+
+    def _register(self, path: str):
+        """Register one file, deciding whether a CSV is loaded or streamed"""
+        filename = os.path.basename(path)
+        if not path.endswith(".csv"):
+            with self._lock:
+                self.report_paths[filename] = path
+            return
+
+        streamed = self.memory_budget is not None and estimate_csv_memory(path) > self.memory_budget
+        with self._lock:
+            self.csv_paths[filename] = path
+            if streamed:
+                self.streamed_csvs.add(filename)
+            else:
+                self.streamed_csvs.discard(filename)
+
+    def _unregister(self, path: str):
+        """Forget a file that has been deleted, with everything loaded from it"""
+        filename = os.path.basename(path)
+        with self._lock:
+            if path.endswith(".csv"):
+                self.csv_paths.pop(filename, None)
+                self.streamed_csvs.discard(filename)
+                df = self.csv_data.pop(filename, None)
+                self.csv_bytes.pop(filename, None)
+                self.csv_sources.pop(filename, None)
+                if df is not None:
+                    self.searcher.release_dataframe(df)
+                return
+            self.report_paths.pop(filename, None)
+            self.report_data.pop(filename, None)
+            self.json_tables.pop(filename, None)
+        self.report_index.remove(filename)
+
+    def _is_cached(self, path: str) -> bool:
+        """True if loading the file on demand only needs the fast cache"""
+        if path.endswith(".csv"):
+            return self.cache.is_cached(path, 'frame', 'index', 'stats')
+        if path.endswith(".json"):
+            return self.cache.is_cached(path, 'json', 'flat_json', 'doc_index')
+        return self.cache.is_cached(path, 'doc_index')
+
+    def load_in_background(self, on_progress: Optional[ProgressCallback] = None,
+                           eager: bool = False) -> List[Future]:
+        """
+        Prepare every registered file on the worker pool.
+        Files that still need parsing/indexing are loaded and become searchable
+        as soon as each one finishes. Files already in the disk cache stay
+        unloaded (unless eager=True) and are read on their first query.
+        Progress is reported per file through on_progress, from worker threads.
+        """
+        paths = list(self.csv_paths.values()) + list(self.report_paths.values())
+        total = len(paths)
+        done = [0]
+        done_lock = threading.Lock()
+
+        def prepare(path: str):
+            error = None
+            try:
+                # Streamed CSVs are never loaded; there is nothing to prepare
+                streamed = os.path.basename(path) in self.streamed_csvs
+                if not streamed and (eager or not self._is_cached(path)):
+                    self._load(path)
+            except Exception as e:
+                error = e
+                print(f"Error loading {path}: {e}")
+            with done_lock:
+                done[0] += 1
+                count = done[0]
+            if on_progress is not None:
+                on_progress(os.path.basename(path), count, total, error)
+
+        futures = [self._executor.submit(prepare, path) for path in paths]
+        self._queued.extend(futures)
+        return futures
+
+    def _read(self, path: str):
+        """Parse one file (through the cache) and make it resident"""
+        filename = os.path.basename(path)
+        with instruments.stage('load', file=filename):
+            content = self._parse_and_index(path, filename)
+        instruments.count('files_loaded')
+        return content
+
+    def _parse_and_index(self, path: str, filename: str):
+        # Everything derived below is cached under the version that was read
+        signature = self.cache.signature(path)
+        if path.endswith(".csv"):
+            source = csv_source(path)
+            with instruments.stage('parse', file=filename):
+                df = self.cache.read_csv(path, signature)
+            # The store never mutates its frames, so their indexes can be kept
+            self.searcher.adopt_dataframe(df)
+            with instruments.stage('index', file=filename, rows=len(df)):
+                index = self.cache.load_object(path, 'index', signature)
+                if index is None:
+                    index = self.searcher.index_dataframe(df)
+                    self.cache.store_object(path, 'index', index, signature)
+                else:
+                    self.searcher.index_dataframe(df, index)
+                self.searcher.build_key_indexes(df)
+                stats = self.cache.load_object(path, 'stats', signature)
+                if stats is None:
+                    stats = self.searcher.summarize_dataframe(df)
+                    self.cache.store_object(path, 'stats', stats, signature)
+                else:
+                    self.searcher.summarize_dataframe(df, stats)
+            # A file that changed while it was parsed has no known version
+            self._make_resident(filename, df, source if csv_source(path) == source else None)
+            instruments.count('rows_loaded', len(df))
+            print(f"Loaded CSV: {filename} with {len(df)} rows")
+            return df
+
+        if path.endswith(".json"):
+            with instruments.stage('parse', file=filename):
+                content = self.cache.read_json(path, signature)
+            with instruments.stage('index', file=filename):
+                table = self.cache.load_object(path, 'flat_json', signature)
+                if table is None:
+                    table = FlatJSON(content)
+                    self.cache.store_object(path, 'flat_json', table, signature)
+            with self._lock:
+                self.json_tables[filename] = table
+            print(f"Loaded JSON report: {filename}")
+        else:
+            with instruments.stage('parse', file=filename):
+                with open(path, 'r', encoding='utf-8') as f:
+                    content = f.read()
+            print(f"Loaded report: {filename}")
+
+        with instruments.stage('index', file=filename):
+            document = self.cache.load_object(path, 'doc_index', signature)
+            if document is None:
+                document = DocumentIndex(report_text(content))
+                self.cache.store_object(path, 'doc_index', document, signature)
+            self.report_index.add(filename, document)
+
+        with self._lock:
+            self.report_data[filename] = content
+        return content
+
+    def _make_resident(self, filename: str, df: pd.DataFrame, source: Optional[CsvSource] = None):
+        """
+        Add a dataset as most recently used and evict others beyond the budget;
+        source is the version of the file it was loaded from, if known
+        """
+        size = int(df.memory_usage(deep=True).sum())
+        released = []
+        with self._lock:
+            previous = self.csv_data.get(filename)
+            if previous is not None and previous is not df:
+                released.append(previous)
+            self.csv_data[filename] = df
+            self.csv_data.move_to_end(filename)
+            self.csv_bytes[filename] = size
+            if source is not None:
+                self.csv_sources[filename] = source
+            else:
+                self.csv_sources.pop(filename, None)
+            while (self.memory_budget is not None and self.resident_bytes > self.memory_budget
+                   and len(self.csv_data) > 1):
+                evicted, evicted_df = self.csv_data.popitem(last=False)
+                del self.csv_bytes[evicted]
+                self.csv_sources.pop(evicted, None)
+                released.append(evicted_df)
+                self.evictions += 1
+                print(f"Evicted CSV: {evicted}")
+        # Indexes of replaced and evicted frames go with them
+        for old in released:
+            self.searcher.release_dataframe(old)
+
+    @property
+    def resident_bytes(self) -> int:
+        """
+        Memory used by the resident datasets and their derived structures;
+        those built after loading (e.g. a range index) count from then on
+        """
+        with self._lock:
+            derived = sum(self.searcher.memory_usage(df) for df in self.csv_data.values())
+            return sum(self.csv_bytes.values()) + derived
+
+    def cache_info(self) -> Dict[str, int]:
+        """Residency and hit/miss counters of the dataset cache"""
+        with self._lock:
+            return {
+                'datasets': len(self.csv_paths),
+                'resident': len(self.csv_data),
+                'streamed': len(self.streamed_csvs),
+                'resident_bytes': self.resident_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+            }
+
+    def _load(self, path: str):
+        """
+        Load a file exactly once, even if several threads ask for it together
+        """
+        filename = os.path.basename(path)
+        with self._lock:
+            loaded = self.csv_data if path.endswith(".csv") else self.report_data
+            if filename in loaded:
+                return loaded[filename]
+            future = self._pending.get(path)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._pending[path] = future
+
+        if owner:
+            try:
+                future.set_result(self._read(path))
+            except Exception as e:
+                future.set_exception(e)
+            finally:
+                with self._lock:
+                    self._pending.pop(path, None)
+        return future.result()
+
+    def get_csv(self, filename: str) -> pd.DataFrame:
+        """Return a dataset, (re)loading it from the cache if it is not resident"""
+        with self._lock:
+            df = self.csv_data.get(filename)
+            if df is not None:
+                self.csv_data.move_to_end(filename)
+                self.hits += 1
+            else:
+                self.misses += 1
+        if df is None:
+            df = self._load(self.csv_paths[filename])
+        return df
+
+    def get_report(self, filename: str) -> Any:
+        """Return a report, loading it on first use"""
+        content = self.report_data.get(filename)
+        if content is None:
+            content = self._load(self.report_paths[filename])
+        return content
+
+    def get_json_table(self, filename: str) -> FlatJSON:
+        """Return the flattened path table of a JSON report, loading it on first use"""
+        self.get_report(filename)
+        return self.json_tables[filename]
+
+    def csv_items(self) -> Iterator[Tuple[str, pd.DataFrame]]:
+        """Iterate over every dataset that fits in memory, loading unloaded ones on demand"""
+        for filename in list(self.csv_paths):
+            if filename in self.streamed_csvs:
+                continue
+            try:
+                yield filename, self.get_csv(filename)
+            except Exception as e:
+                print(f"Error loading {filename}: {e}")
+
+    def iter_csv_chunks(self, filename: str) -> Iterator[pd.DataFrame]:
+        """Read a dataset in chunks of chunk_rows rows without keeping it resident"""
+        with pd.read_csv(self.csv_paths[filename], chunksize=self.chunk_rows) as reader:
+            for chunk in reader:
+                yield chunk
+
+    def search_csvs(self, query: str, stats: Optional[SearchStats] = None, exact: bool = False,
+                    check: Optional[Callable[[], None]] = None) -> Iterator[Tuple[str, pd.DataFrame, Dict[str, np.ndarray]]]:
+        """
+        Search every dataset: resident ones through their index, then streamed
+        ones chunk by chunk. Yields (filename, df, {column: row ids}) as
+        matches are found; check() is called between files and chunks.
+        Repeated searches are answered from the query cache while no CSV changed.
+        """
+        started = time.perf_counter()
+        stats = stats if stats is not None else SearchStats(query)
+        # The query is matched literally, so only its case is normalised
+        key = ('data', query.lower(), exact)
+        with self._lock:
+            paths = dict(self.csv_paths)
+            streamed = set(self.streamed_csvs)
+        versions = file_versions(paths.values())
+
+        cached = self.query_cache.get(key, versions)
+        frames = self._cached_frames(cached[0], versions) if cached is not None else None
+        if frames is not None:
+            items, files = cached
+            for (filename, column_rows), df in zip(items, frames):
+                yield filename, df, column_rows
+            stats.files.extend(files)
+            stats.elapsed = time.perf_counter() - started
+            instruments.record('match', stats.elapsed, mode='data', query=query, cached=True)
+            return
+
+        # Version of the file each searched frame was loaded from, which may
+        # be older than the file on disk until the watcher refreshes it
+        searched: Dict[str, Optional[Tuple[str, int, int]]] = {}
+
+        def resident():
+            for filename, df in self.csv_items():
+                if check is not None:
+                    check()
+                searched[filename] = self._loaded_version(filename, df)
+                yield filename, df
+
+        def matches():
+            yield from self.searcher.search_datasets(resident(), query, stats, exact)
+            for filename in paths:
+                if filename in streamed:
+                    yield from self.searcher.search_chunks(filename, self.iter_csv_chunks(filename),
+                                                           query, stats, exact, check)
+
+        items = []
+        cacheable = True
+        for filename, df, column_rows in matches():
+            if filename in streamed:
+                # Chunk rows are not kept alive in the cache: that would defeat the memory budget
+                cacheable = False
+            else:
+                items.append((filename, column_rows))
+            yield filename, df, column_rows
+        stats.elapsed = time.perf_counter() - started
+        instruments.record('match', stats.elapsed, mode='data', query=query, cached=False,
+                           files=stats.files_searched, rows=stats.rows_hit)
+        instruments.count('rows_searched', sum(f.rows_searched for f in stats.files))
+
+        # Keyed on the versions actually searched, so a result computed from
+        # a stale frame never matches the newer file on disk
+        loaded = tuple(
+            version if filename in streamed else searched.get(filename)
+            for filename, version in zip(paths, versions)
+        )
+        if cacheable and all(version is not None for version in loaded):
+            self.query_cache.put(key, loaded, (items, list(stats.files)), stats.elapsed)
+
+    def _loaded_version(self, filename: str, df: pd.DataFrame) -> Optional[Tuple[str, int, int]]:
+        """
+        (path, size, mtime_ns) of the file a frame was loaded from, or None
+        if it is no longer the resident copy or its version is unknown
+        """
+        with self._lock:
+            source = self.csv_sources.get(filename)
+            if source is None or self.csv_data.get(filename) is not df:
+                return None
+            return self.csv_paths[filename], source[0], source[1]
+
+    def _cached_frames(self, items: List[Tuple[str, Dict[str, np.ndarray]]],
+                       versions: Tuple) -> Optional[List[pd.DataFrame]]:
+        """
+        The resident frames a cached result refers to, or None if any of them
+        is missing or is not the version on disk (e.g. not refreshed yet)
+        """
+        current = {version[0]: version for version in versions}
+        frames = []
+        for filename, _ in items:
+            try:
+                df = self.get_csv(filename)
+            except Exception:
+                return None
+            version = self._loaded_version(filename, df)
+            if version is None or current.get(version[0]) != version:
+                return None
+            frames.append(df)
+        return frames
+
+    def search_reports(self, query: str, top_k: int = 10, stop_words: Optional[Set[str]] = None,
+                       check: Optional[Callable[[], None]] = None) -> Tuple[List[ReportHit], int]:
+        """
+        Rank every report for a query (see ReportIndex.search), loading
+        unloaded reports first; check() is called between reports.
+        Repeated searches are answered from the query cache while no report changed.
+        """
+        started = time.perf_counter()
+        # Ranking only depends on the phrases and the set of free terms
+        phrases, terms = self.report_index.query_terms(query, stop_words)
+        key = ('reports', tuple(tuple(phrase) for phrase in phrases), frozenset(terms), top_k)
+        versions = file_versions(self.report_paths.values())
+
+        cached = self.query_cache.get(key, versions)
+        if cached is not None:
+            instruments.record('match', time.perf_counter() - started, mode='reports', query=query, cached=True)
+            return cached
+
+        # Make sure every report is loaded and in the full-text index
+        for _ in self.report_items():
+            if check is not None:
+                check()
+        result = self.report_index.search(query, top_k=top_k, stop_words=stop_words)
+        self.query_cache.put(key, versions, result, time.perf_counter() - started)
+        return result
+
+    def suggest(self, query: str, mode: str = 'data', stop_words: Optional[Set[str]] = None,
+                check: Optional[Callable[[], None]] = None) -> Optional[str]:
+        """
+        "Did you mean" for a query: the query with misspelled words corrected
+        against the words of the resident datasets (mode 'data') or of the
+        reports (mode 'reports'), or None if there is nothing to correct.
+        A data suggestion is only offered if searching for it finds rows.
+        """
+        if mode == 'reports':
+            return self.report_index.suggest(query, stop_words)
+
+        def resident():
+            for item in self.csv_items():
+                if check is not None:
+                    check()
+                yield item
+
+        for candidate in self.searcher.suggest_queries(resident(), query, self._resident_versions(), check):
+            # CSV search matches the whole query, which a corrected word alone does not guarantee
+            if next(self.searcher.search_datasets(resident(), candidate), None) is not None:
+                return candidate
+        return None
+
+    def _resident_versions(self) -> Tuple:
+        """
+        Version each CSV that is not streamed would be searched at: the one
+        its resident frame was loaded from, or else the file on disk
+        """
+        with self._lock:
+            paths = {name: path for name, path in self.csv_paths.items() if name not in self.streamed_csvs}
+            loaded = {name: (paths[name],) + self.csv_sources[name][:2]
+                      for name in paths if name in self.csv_sources and name in self.csv_data}
+        on_disk = dict(zip(paths, file_versions(paths.values())))
+        return tuple(loaded.get(name, on_disk[name]) for name in paths)
+
+    def report_items(self) -> Iterator[Tuple[str, Any]]:
+        """Iterate over every report, loading unloaded ones on demand"""
+        for filename in list(self.report_paths):
+            try:
+                yield filename, self.get_report(filename)
+            except Exception as e:
+                print(f"Error loading {filename}: {e}")
+
+    def refresh(self, path: str, kind: str):
+        """
+        Bring one added, modified or deleted file up to date.
+        The new version is parsed and indexed completely before it replaces
+        the old one, so searches in flight keep using a consistent old version.
+        """
+        with self._lock:
+            path_lock = self._refresh_locks.setdefault(path, threading.Lock())
+        with path_lock:
+            if kind == 'deleted' or not os.path.exists(path):
+                self._unregister(path)
+                return
+
+            self._register(path)
+            filename = os.path.basename(path)
+            if filename in self.streamed_csvs:
+                # Now too large to keep resident: drop the loaded copy
+                with self._lock:
+                    df = self.csv_data.pop(filename, None)
+                    self.csv_bytes.pop(filename, None)
+                    self.csv_sources.pop(filename, None)
+                if df is not None:
+                    self.searcher.release_dataframe(df)
+                return
+            if path.endswith(".csv") and self._append(path, filename):
+                return
+            self._read(path)
+
+    def _appended_rows(self, path: str,
+                       filename: str) -> Optional[Tuple[pd.DataFrame, pd.DataFrame, CsvSource, Dict[str, Any]]]:
+        """
+        (resident frame, new rows, new version, its cache signature) if the
+        CSV on disk is the resident version with whole rows appended,
+        recognised by the bytes at the old end of file being unchanged;
+        None otherwise
+        """
+        with self._lock:
+            df = self.csv_data.get(filename)
+            source = self.csv_sources.get(filename)
+        if df is None or source is None:
+            return None
+        size, _, tail = source
+        signature = self.cache.signature(path)
+        current = csv_source(path)
+        if current is None or current[0] <= size or not tail.endswith(b'\n'):
+            return None
+        if current[0] != signature['size'] or current[1] != signature['mtime_ns']:
+            return None
+
+        with open(path, 'rb') as f:
+            header = f.readline()
+            f.seek(size - len(tail))
+            if f.read(len(tail)) != tail:
+                return None
+            added = f.read(current[0] - size)
+        rows = pd.read_csv(io.BytesIO(header + added))
+        if list(rows.columns) != list(df.columns):
+            return None
+        return df, rows, current, signature
+
+    def _append(self, path: str, filename: str) -> bool:
+        """
+        Bring a CSV that was appended to up to date by parsing only the new
+        rows and merging the summary statistics (see DataSearcher.append_rows).
+        Returns False, with nothing changed, if the file changed in any other
+        way or the new rows would change a column's type; it is then reloaded.
+        """
+        try:
+            appended = self._appended_rows(path, filename)
+        except Exception as e:
+            print(f"Reloading {filename} in full: {e}")
+            return False
+        if appended is None:
+            return False
+
+        df, rows, source, signature = appended
+        with instruments.stage('load', file=filename, appended=len(rows)):
+            combined = self.searcher.append_rows(df, rows)
+            # A full parse would infer other dtypes, e.g. float for an int column gaining blanks
+            if not combined.dtypes.equals(df.dtypes):
+                self.searcher.release_dataframe(combined)
+                return False
+            with instruments.stage('index', file=filename, rows=len(combined)):
+                index = self.searcher.index_dataframe(combined)
+                self.searcher.build_key_indexes(combined)
+                stats = self.searcher.summarize_dataframe(combined)
+            if csv_source(path) != source:
+                # Changed again meanwhile: the next refresh brings it up to date
+                source = None
+            else:
+                self.cache.store_frame(path, combined, signature)
+                self.cache.store_object(path, 'index', index, signature)
+                self.cache.store_object(path, 'stats', stats, signature)
+            self._make_resident(filename, combined, source)
+        instruments.count('rows_loaded', len(rows))
+        print(f"Appended {len(rows)} rows to CSV: {filename}")
+        return True
+
+    def start_watching(self, on_refresh: Optional[RefreshCallback] = None,
+                       poll_interval: float = 2.0) -> FileWatcher:
+        """
+        Watch the data and report folders and refresh every changed file on
+        the worker pool; on_refresh is called from worker threads afterwards
+        """
+        def refresh(path: str, kind: str):
+            error = None
+            try:
+                self.refresh(path, kind)
+            except Exception as e:
+                error = e
+                print(f"Error refreshing {path}: {e}")
+            if on_refresh is not None:
+                on_refresh(os.path.basename(path), kind, error)
+
+        def changed(path: str, kind: str):
+            self._executor.submit(refresh, path, kind)
+
+        self.watcher = FileWatcher(
+            [(self.data_dir, ("*.csv",)), (self.reports_dir, ("*.txt", "*.json"))],
+            changed, poll_interval=poll_interval
+        )
+        self.watcher.start()
+        return self.watcher
+
+    def shutdown(self):
+        """Stop watching and stop the loader pool without waiting for queued files"""
+        if self.watcher is not None:
+            self.watcher.stop()
+        for future in self._queued:
+            future.cancel()
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,139 @@
+"""
+File watcher for EconoVisionAI
+Reports added, modified and deleted data and report files. Uses filesystem
+notifications (inotify and friends, through watchdog) when available and
+falls back to polling directory snapshots otherwise
+"""
+
+import fnmatch
+import os
+import threading
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # watchdog is optional; polling is used instead
+    FileSystemEventHandler = object
+    Observer = None
+
+# Callback signature: (path, 'added' | 'modified' | 'deleted')
+ChangeCallback = Callable[[str, str], None]
+
+# (size, mtime_ns) of a file
+Signature = Tuple[int, int]
+
+
+class _WakeHandler(FileSystemEventHandler):
+    """Turns any notification into a wake-up of the scan loop"""
+
+    def __init__(self, wake: threading.Event):
+        super().__init__()
+        self.wake = wake
+
+    def on_any_event(self, event):
+        self.wake.set()
+
+
+class FileWatcher:
+    """
+    Watches directories for files matching glob patterns.
+    Changes are always found by diffing snapshots of (size, mtime), so a burst
+    of notifications for a file being written is reported once; notifications
+    only make the next scan happen sooner than the polling interval.
+    """
+
+    def __init__(self, directories: Sequence[Tuple[str, Sequence[str]]], on_change: ChangeCallback,
+                 poll_interval: float = 2.0, settle_delay: float = 0.5):
+        self.directories = [(directory, tuple(patterns)) for directory, patterns in directories]
+        self.on_change = on_change
+        self.poll_interval = poll_interval
+        # Time to let a writer finish after a notification before scanning
+        self.settle_delay = settle_delay
+
+        self._snapshot: Dict[str, Signature] = {}
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._observer = None
+
+    @property
+    def uses_notifications(self) -> bool:
+        return self._observer is not None
+
+    def scan(self) -> Dict[str, Signature]:
+        """Current signature of every watched file"""
+        snapshot = {}
+        for directory, patterns in self.directories:
+            try:
+                entries = list(os.scandir(directory))
+            except OSError:
+                continue
+            for entry in entries:
+                if not any(fnmatch.fnmatch(entry.name, pattern) for pattern in patterns):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                if entry.is_file():
+                    snapshot[entry.path] = (stat.st_size, stat.st_mtime_ns)
+        return snapshot
+
+    def check(self) -> List[Tuple[str, str]]:
+        """Compare with the previous snapshot and report every change"""
+        snapshot = self.scan()
+        changes = []
+        for path, signature in snapshot.items():
+            previous = self._snapshot.get(path)
+            if previous is None:
+                changes.append((path, 'added'))
+            elif previous != signature:
+                changes.append((path, 'modified'))
+        for path in self._snapshot.keys() - snapshot.keys():
+            changes.append((path, 'deleted'))
+        self._snapshot = snapshot
+
+        for path, kind in changes:
+            try:
+                self.on_change(path, kind)
+            except Exception as e:
+                print(f"Error handling change of {path}: {e}")
+        return changes
+
+    def start(self):
+        """Take the initial snapshot and watch on a background thread"""
+        self._snapshot = self.scan()
+        if Observer is not None:
+            try:
+                observer = Observer()
+                handler = _WakeHandler(self._wake)
+                for directory, _ in self.directories:
+                    if os.path.isdir(directory):
+                        observer.schedule(handler, directory, recursive=False)
+                observer.daemon = True
+                observer.start()
+                self._observer = observer
+            except Exception as e:
+                print(f"File notifications unavailable, polling instead: {e}")
+                self._observer = None
+
+        self._thread = threading.Thread(target=self._run, name="file-watcher", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while not self._stop.is_set():
+            if self._wake.wait(self.poll_interval):
+                self._wake.clear()
+                if self._stop.wait(self.settle_delay):
+                    break
+            if self._stop.is_set():
+                break
+            self.check()
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer = None
@@ -0,0 +1,193 @@
+"""
+Typo-tolerant word lookup for EconoVisionAI
+Trigram index over a vocabulary (the words of distinct cell values, or of
+the report corpus). A misspelled term is matched by first collecting the
+words that share enough trigrams with it and only then checking their edit
+distance, so a lookup touches a handful of words instead of the whole
+vocabulary
+"""
+
+import re
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+WORD_RE = re.compile(r'\w+')
+
+# Trigrams, with the word padded so its first and last letters count fully
+NGRAM_SIZE = 3
+PAD = '\x01'
+
+# Words shorter than this are never corrected
+MIN_WORD_LENGTH = 3
+
+# Suggestions returned per term
+MAX_SUGGESTIONS = 5
+
+# Words whose edit distance is checked per lookup
+MAX_CANDIDATES = 500
+
+
+def max_typos(term: str) -> int:
+    """Edits tolerated for a term of this length: 0 below 3 letters, 1 up to 5, then 2"""
+    if len(term) < MIN_WORD_LENGTH:
+        return 0
+    return 1 if len(term) <= 5 else 2
+
+
+def bounded_edit_distance(a: str, b: str, limit: int) -> int:
+    """
+    Optimal string alignment distance between a and b (insertions,
+    deletions, substitutions and transpositions of adjacent letters), or
+    limit + 1 as soon as it is certain to exceed limit
+    """
+    if a == b:
+        return 0
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+
+    before_previous: Optional[List[int]] = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        letter = a[i - 1]
+        for j in range(1, len(b) + 1):
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (letter != b[j - 1]))
+            if before_previous is not None and j > 1 and letter == b[j - 2] and a[i - 2] == b[j - 1]:
+                value = min(value, before_previous[j - 2] + 1)
+            current[j] = value
+        if min(current) > limit:
+            return limit + 1
+        before_previous, previous = previous, current
+    return min(previous[-1], limit + 1)
+
+
+def _grams(word: str, n: int = NGRAM_SIZE) -> List[str]:
+    padded = PAD * (n - 1) + word + PAD * (n - 1)
+    return [padded[i:i + n] for i in range(len(padded) - n + 1)]
+
+
+def vocabulary_of(values: Iterable[str]) -> Dict[str, int]:
+    """Word -> number of values it occurs in, for words that contain a letter"""
+    counts: Dict[str, int] = {}
+    for value in values:
+        for word in set(WORD_RE.findall(str(value).lower())):
+            if len(word) >= MIN_WORD_LENGTH and not word.isdigit():
+                counts[word] = counts.get(word, 0) + 1
+    return counts
+
+
+class FuzzyIndex:
+    """Trigram postings (CSR arrays of word ids) over a weighted vocabulary"""
+
+    def __init__(self, vocabulary: Dict[str, int], n: int = NGRAM_SIZE):
+        self.n = n
+        words = sorted(vocabulary)
+        self.words = np.asarray(words, dtype=object)
+        self.weights = np.asarray([vocabulary[word] for word in words], dtype=np.int64)
+        self.lengths = np.asarray([len(word) for word in words], dtype=np.int32)
+        self._ids = {word: i for i, word in enumerate(words)}
+
+        postings: Dict[str, List[int]] = {}
+        for i, word in enumerate(words):
+            for gram in set(_grams(word, n)):
+                postings.setdefault(gram, []).append(i)
+        self.grams = sorted(postings)
+        self._gram_ids = {gram: i for i, gram in enumerate(self.grams)}
+        self.offsets = np.zeros(len(self.grams) + 1, dtype=np.int64)
+        self.offsets[1:] = np.cumsum([len(postings[gram]) for gram in self.grams])
+        self.word_ids = np.asarray(
+            [i for gram in self.grams for i in postings[gram]] or [], dtype=np.int32
+        )
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def __contains__(self, word: str) -> bool:
+        return word in self._ids
+
+    def candidates(self, term: str, limit: int) -> np.ndarray:
+        """
+        Ids of the words that can be within `limit` edits of term: of
+        similar length and sharing enough trigrams (an edit changes at most
+        n + 1 of them). At most MAX_CANDIDATES words, those sharing the most
+        trigrams, are returned, so short terms with loose bounds stay fast.
+        """
+        grams = set(_grams(term, self.n))
+        lists = [
+            self.word_ids[self.offsets[g]:self.offsets[g + 1]]
+            for g in (self._gram_ids.get(gram) for gram in grams) if g is not None
+        ]
+        if not lists:
+            return np.zeros(0, dtype=np.int64)
+        needed = max(1, len(grams) - (self.n + 1) * limit)
+        shared = np.bincount(np.concatenate(lists), minlength=len(self.words))
+        ids = np.flatnonzero(shared >= needed)
+        ids = ids[np.abs(self.lengths[ids] - len(term)) <= limit]
+        if len(ids) > MAX_CANDIDATES:
+            ids = ids[np.argpartition(-shared[ids], MAX_CANDIDATES - 1)[:MAX_CANDIDATES]]
+        return ids
+
+    def lookup(self, term: str, limit: Optional[int] = None,
+               max_results: int = MAX_SUGGESTIONS) -> List[Tuple[str, int]]:
+        """
+        (word, distance) of the vocabulary words within `limit` edits of term
+        (default max_typos(term)), closest and most frequent first
+        """
+        term = term.lower()
+        limit = max_typos(term) if limit is None else limit
+        if term in self._ids:
+            return [(term, 0)]
+        if limit <= 0 or not len(self.words):
+            return []
+
+        found = []
+        for i in self.candidates(term, limit).tolist():
+            distance = bounded_edit_distance(term, self.words[i], limit)
+            if distance <= limit:
+                found.append((distance, -int(self.weights[i]), self.words[i]))
+        found.sort()
+        return [(word, distance) for distance, _, word in found[:max_results]]
+
+    def corrections(self, text: str, ignore: Optional[Set[str]] = None,
+                    max_results: int = MAX_SUGGESTIONS) -> List[str]:
+        """
+        Candidate corrections of text, best first: with a single unknown
+        word, the text with that word replaced by each close vocabulary word;
+        with several, only the text as correct() returns it
+        """
+        text = text.lower()
+        unknown = {
+            word for word in WORD_RE.findall(text)
+            if word not in self._ids and not word.isdigit() and not (ignore and word in ignore)
+        }
+        if len(unknown) != 1:
+            corrected = self.correct(text, ignore)
+            return [corrected] if corrected is not None else []
+        word = unknown.pop()
+        return [
+            WORD_RE.sub(lambda match: replacement if match.group() == word else match.group(), text)
+            for replacement, _ in self.lookup(word, max_results=max_results)
+        ]
+
+    def correct(self, text: str, ignore: Optional[Set[str]] = None) -> Optional[str]:
+        """
+        The text with every unknown word (other than those in ignore, e.g.
+        stop words) replaced by its closest vocabulary word, or None if
+        nothing needed correcting
+        """
+        changed = False
+
+        def replace(match) -> str:
+            nonlocal changed
+            word = match.group()
+            if word in self._ids or word.isdigit() or (ignore and word in ignore):
+                return word
+            suggestions = self.lookup(word)
+            if not suggestions:
+                return word
+            changed = True
+            return suggestions[0][0]
+
+        corrected = WORD_RE.sub(replace, text.lower())
+        return corrected if changed else None
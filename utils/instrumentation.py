@@ -0,0 +1,284 @@
+"""
+Instrumentation for EconoVisionAI
+Per-stage timers and counters for the load and search hot paths (load,
+parse, index, match, rank, render), memory gauges, an optional structured
+log with one JSON line per timed stage, and cProfile/tracemalloc capture
+of a single query
+"""
+
+import cProfile
+import io
+import json
+import logging
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+try:
+    import resource
+except ImportError:  # not available on Windows; peak RSS is then unknown
+    resource = None
+
+# Stages every search or load passes through, in pipeline order
+STAGES = ('load', 'parse', 'index', 'match', 'rank', 'render')
+
+# Logger that receives one JSON line per timed stage once enabled
+LOGGER_NAME = "econovision.instruments"
+
+# Functions and allocation sites listed in a query profile
+PROFILE_TOP = 25
+ALLOCATION_TOP = 10
+
+# tracemalloc is process-global: the first running QueryProfiler starts it
+# (unless something else already traces) and the last one stops it
+_tracing_lock = threading.Lock()
+_tracing_users = 0
+_started_tracing = False
+
+
+def _acquire_tracing():
+    """Start tracing allocations for one more profiler"""
+    global _tracing_users, _started_tracing
+    with _tracing_lock:
+        if _tracing_users == 0:
+            _started_tracing = not tracemalloc.is_tracing()
+            if _started_tracing:
+                tracemalloc.start()
+            if hasattr(tracemalloc, 'reset_peak'):  # Python 3.9+
+                tracemalloc.reset_peak()
+        _tracing_users += 1
+
+
+def _release_tracing():
+    """Stop tracing allocations once no profiler needs it"""
+    global _tracing_users
+    with _tracing_lock:
+        _tracing_users -= 1
+        if _tracing_users == 0 and _started_tracing:
+            tracemalloc.stop()
+
+
+class StageTimer:
+    """Running count, total, last and maximum duration of one stage"""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.last = 0.0
+        self.max = 0.0
+
+    def add(self, seconds: float):
+        self.count += 1
+        self.total += seconds
+        self.last = seconds
+        self.max = max(self.max, seconds)
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            'count': self.count,
+            'total_ms': self.total * 1000,
+            'mean_ms': self.total / self.count * 1000 if self.count else 0.0,
+            'last_ms': self.last * 1000,
+            'max_ms': self.max * 1000,
+        }
+
+
+def memory_usage() -> Dict[str, Optional[int]]:
+    """Current and peak resident set size of the process, and traced Python allocations"""
+    rss = None
+    try:
+        with open("/proc/self/statm", 'r') as f:
+            rss = int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        pass
+
+    peak = None
+    if resource is not None:
+        # ru_maxrss is in kilobytes on Linux and bytes on macOS
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        peak = peak if sys.platform == "darwin" else peak * 1024
+
+    traced = tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else None
+    return {'rss_bytes': rss, 'peak_rss_bytes': peak, 'traced_bytes': traced}
+
+
+class Instruments:
+    """
+    Thread-safe registry of stage timers, counters and gauges.
+    Gauges are callables sampled when a snapshot is taken, e.g. the residency
+    counters of a DataStore or the statistics of its query cache.
+    """
+
+    def __init__(self):
+        self._timers: Dict[str, StageTimer] = {}
+        self._counters: Dict[str, int] = {}
+        self._gauges: Dict[str, Callable[[], Any]] = {}
+        self._lock = threading.Lock()
+        self.log = logging.getLogger(LOGGER_NAME)
+
+    @contextmanager
+    def stage(self, name: str, **fields) -> Iterator[None]:
+        """Time the body of a with block as one run of a stage"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - started, **fields)
+
+    def record(self, name: str, seconds: float, **fields):
+        """Add one run of a stage; fields (file, query, rows...) only go to the log"""
+        with self._lock:
+            timer = self._timers.get(name)
+            if timer is None:
+                timer = self._timers[name] = StageTimer()
+            timer.add(seconds)
+        if self.log.isEnabledFor(logging.INFO):
+            self.log.info(json.dumps({'ts': time.time(), 'stage': name, 'ms': seconds * 1000, **fields},
+                                     default=str))
+
+    def count(self, name: str, n: int = 1):
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + n
+
+    def register_gauge(self, name: str, sample: Callable[[], Any]):
+        with self._lock:
+            self._gauges[name] = sample
+
+    def timer(self, name: str) -> Optional[StageTimer]:
+        with self._lock:
+            return self._timers.get(name)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Every timer, counter and gauge, plus memory usage"""
+        with self._lock:
+            stages = {name: timer.to_dict() for name, timer in self._timers.items()}
+            counters = dict(self._counters)
+            gauges = dict(self._gauges)
+
+        sampled = {}
+        for name, sample in gauges.items():
+            try:
+                sampled[name] = sample()
+            except Exception as e:
+                sampled[name] = f"error: {e}"
+        return {'stages': stages, 'counters': counters, 'gauges': sampled, 'memory': memory_usage()}
+
+    def summary_line(self) -> str:
+        """Last duration of each stage that has run, and memory, on one line"""
+        with self._lock:
+            parts = [f"{name} {self._timers[name].last * 1000:.0f} ms" for name in STAGES if name in self._timers]
+        memory = memory_usage()
+        if memory['rss_bytes'] is not None:
+            parts.append(f"RSS {memory['rss_bytes'] / 1e6:.0f} MB")
+        if memory['peak_rss_bytes'] is not None:
+            parts.append(f"peak {memory['peak_rss_bytes'] / 1e6:.0f} MB")
+        return "  •  ".join(parts)
+
+    def reset(self):
+        with self._lock:
+            self._timers.clear()
+            self._counters.clear()
+
+    def enable_log(self, path: Optional[str] = None) -> logging.Handler:
+        """Write one JSON line per timed stage to path (stderr if None)"""
+        handler = logging.FileHandler(path, encoding='utf-8') if path else logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        self.log.addHandler(handler)
+        self.log.setLevel(logging.INFO)
+        self.log.propagate = False
+        return handler
+
+
+# Process-wide instruments shared by the store, the searcher and the front ends
+instruments = Instruments()
+
+
+class QueryProfiler:
+    """
+    cProfile and tracemalloc capture of one query.
+    Use as a context manager, or wrap a lazily consumed search with
+    iterate() so only the time spent producing its results is profiled.
+    Profiles may overlap (e.g. concurrent server requests); the peak
+    traced memory of each then includes the others' allocations.
+    """
+
+    def __init__(self, top: int = PROFILE_TOP):
+        self.top = top
+        self.profile = cProfile.Profile()
+        self.elapsed = 0.0
+        self.peak_bytes = 0
+        self._snapshot: Optional[tracemalloc.Snapshot] = None
+        self._started = 0.0
+        # Set if cProfile refused to run (Python 3.12+ allows one profiler at a time)
+        self.profile_error: Optional[str] = None
+        self._profiling = False
+
+    def start(self):
+        _acquire_tracing()
+        self.resume()
+
+    def resume(self):
+        self._started = time.perf_counter()
+        try:
+            self.profile.enable()
+            self._profiling = True
+        except ValueError as e:
+            self.profile_error = str(e)
+
+    def pause(self):
+        if self._profiling:
+            self.profile.disable()
+            self._profiling = False
+        self.elapsed += time.perf_counter() - self._started
+
+    def stop(self):
+        self.pause()
+        try:
+            self.peak_bytes = max(self.peak_bytes, tracemalloc.get_traced_memory()[1])
+            self._snapshot = tracemalloc.take_snapshot()
+        finally:
+            _release_tracing()
+
+    def __enter__(self) -> "QueryProfiler":
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def iterate(self, iterator: Iterator[Any]) -> Iterator[Any]:
+        """Yield from iterator, profiling only while it produces items"""
+        self.start()
+        try:
+            for item in iterator:
+                self.pause()
+                try:
+                    yield item
+                finally:
+                    self.resume()
+        finally:
+            self.stop()
+
+    def report(self) -> List[str]:
+        """Hottest functions by cumulative time and the largest allocation sites"""
+        lines = [f"Profiled {self.elapsed * 1000:.1f} ms, peak traced memory {self.peak_bytes / 1e6:.1f} MB", ""]
+        if self.profile_error is not None:
+            lines.append(f"No function profile: {self.profile_error}")
+        else:
+            stream = io.StringIO()
+            pstats.Stats(self.profile, stream=stream).sort_stats('cumulative').print_stats(self.top)
+            lines.extend(line for line in stream.getvalue().splitlines() if line.strip())
+        if self._snapshot is not None:
+            lines.extend(["", "Largest allocations:"])
+            for stat in self._snapshot.statistics('lineno')[:ALLOCATION_TOP]:
+                lines.append(f"  {stat}")
+        return lines
+
+    def dump(self, path: str):
+        """Save the cProfile data for snakeviz, pstats and friends"""
+        self.profile.dump_stats(path)
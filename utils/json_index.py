@@ -0,0 +1,72 @@
+"""
+Flattened JSON reports for EconoVisionAI
+Every leaf of a JSON report is stored once as (path, value, lowercased value)
+so keyword and path-prefix searches are array lookups instead of tree walks
+"""
+
+from typing import Any, List, Optional
+
+import numpy as np
+
+# Separator between leaf values in the search blob; never part of a keyword
+LEAF_SEPARATOR = '\x00'
+
+
+class FlatJSON:
+    """Columnar path table of the leaves of a JSON document"""
+
+    def __init__(self, data: Any):
+        paths: List[str] = []
+        values: List[str] = []
+
+        # Iterative walk in the same order (and path format) as a recursive one
+        stack = [("", data)]
+        while stack:
+            path, obj = stack.pop()
+            if isinstance(obj, dict):
+                children = [(f"{path}.{key}" if path else key, value) for key, value in obj.items()]
+                stack.extend(reversed(children))
+            elif isinstance(obj, list):
+                children = [(f"{path}[{i}]", item) for i, item in enumerate(obj)]
+                stack.extend(reversed(children))
+            else:
+                paths.append(path)
+                values.append(str(obj))
+
+        self.paths = np.asarray(paths, dtype=str) if paths else np.zeros(0, dtype=str)
+        self.values = np.asarray(values, dtype=object)
+        self.lowered = np.asarray([value.lower() for value in values], dtype=object)
+
+        # All lowered values in one string, so a keyword is found with one scan
+        self._blob = LEAF_SEPARATOR.join(self.lowered)
+        lengths = np.fromiter((len(value) + 1 for value in self.lowered), dtype=np.int64, count=len(self.lowered))
+        self._starts = np.concatenate(([0], np.cumsum(lengths)[:-1])) if len(lengths) else np.zeros(0, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def find(self, keyword: str) -> np.ndarray:
+        """Sorted ids of the leaves whose lowercased value contains the keyword"""
+        positions = []
+        find = self._blob.find
+        position = find(keyword)
+        while position != -1:
+            positions.append(position)
+            position = find(keyword, position + 1)
+        if not positions:
+            return np.zeros(0, dtype=np.int64)
+        leaves = np.searchsorted(self._starts, np.asarray(positions, dtype=np.int64), side='right') - 1
+        return np.unique(leaves)
+
+    def prefix_mask(self, prefix: Optional[str]) -> np.ndarray:
+        """
+        Boolean mask of leaves under a path prefix such as 'executive_summary'
+        or 'executive_summary.*'; None selects every leaf
+        """
+        if not prefix:
+            return np.ones(len(self.paths), dtype=bool)
+        prefix = prefix[:-2] if prefix.endswith('.*') else prefix
+        exact = self.paths == prefix
+        child = np.char.startswith(self.paths, prefix + '.')
+        item = np.char.startswith(self.paths, prefix + '[')
+        return exact | child | item
@@ -0,0 +1,149 @@
+"""
+Key lookup indexes for EconoVisionAI
+Hash and sorted indexes over lookup columns such as Country and Year, and
+sorted numeric indexes over value columns, so exact, prefix, range and
+pattern filters cost a few lookups instead of a full column scan
+"""
+
+import re
+from typing import Any, Optional
+
+import numpy as np
+import pandas as pd
+
+# Appended to a prefix to get the upper bound of every string starting with it
+_PREFIX_END = '\U0010ffff'
+
+
+class KeyIndex:
+    """
+    Sorted distinct keys of one column with the rows holding each key.
+    String columns are keyed by their lowercased text (lookups are
+    case-insensitive), numeric columns by their float value; missing values
+    are not indexed. All lookups return sorted row positions.
+    """
+
+    def __init__(self, values: pd.Series):
+        self.num_rows = len(values)
+        self.numeric = pd.api.types.is_numeric_dtype(values.dtype)
+
+        if self.numeric:
+            keys = values.to_numpy(dtype=np.float64, na_value=np.nan)
+            present = ~np.isnan(keys)
+        else:
+            keys = values.astype(str).str.lower().to_numpy(dtype=object)
+            present = values.notna().to_numpy() & pd.notna(keys)
+
+        rows = np.flatnonzero(present)
+        codes, uniques = pd.factorize(keys[rows], sort=True)
+
+        # Sorted distinct keys, and rows grouped by key (CSR layout)
+        self.keys = np.asarray(uniques, dtype=np.float64 if self.numeric else object)
+        self.order = rows[np.argsort(codes, kind='stable')]
+        self.offsets = np.zeros(len(self.keys) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(codes, minlength=len(self.keys)), out=self.offsets[1:])
+
+        # Hash part: key -> position in self.keys
+        self.positions = {key: i for i, key in enumerate(self.keys.tolist())}
+
+    def _normalise(self, value: Any) -> Any:
+        if self.numeric:
+            return float(value) if isinstance(value, (int, float, np.number)) else None
+        return value.lower() if isinstance(value, str) else None
+
+    def _rows_between(self, start: int, stop: int) -> np.ndarray:
+        """Rows of the keys start..stop-1, in row order"""
+        if stop - start == 1:
+            return self.order[self.offsets[start]:self.offsets[stop]]
+        return np.sort(self.order[self.offsets[start]:self.offsets[stop]])
+
+    def exact(self, value: Any) -> np.ndarray:
+        """Rows whose key equals the value"""
+        key = self._normalise(value)
+        position = self.positions.get(key) if key is not None else None
+        if position is None:
+            return np.zeros(0, dtype=np.int64)
+        return self._rows_between(position, position + 1)
+
+    def range(self, low: Any = None, high: Any = None) -> np.ndarray:
+        """Rows whose key lies in [low, high]; None leaves a side open"""
+        start = 0
+        stop = len(self.keys)
+        if low is not None:
+            low = self._normalise(low)
+            if low is None:
+                return np.zeros(0, dtype=np.int64)
+            start = int(np.searchsorted(self.keys, low, side='left'))
+        if high is not None:
+            high = self._normalise(high)
+            if high is None:
+                return np.zeros(0, dtype=np.int64)
+            stop = int(np.searchsorted(self.keys, high, side='right'))
+        if start >= stop:
+            return np.zeros(0, dtype=np.int64)
+        return self._rows_between(start, stop)
+
+    def prefix(self, prefix: str) -> np.ndarray:
+        """Rows whose (lowercased) key starts with the prefix"""
+        if self.numeric:
+            return np.zeros(0, dtype=np.int64)
+        prefix = prefix.lower()
+        start = int(np.searchsorted(self.keys, prefix, side='left'))
+        stop = int(np.searchsorted(self.keys, prefix + _PREFIX_END, side='left'))
+        if start >= stop:
+            return np.zeros(0, dtype=np.int64)
+        return self._rows_between(start, stop)
+
+    def contains(self, pattern: str) -> np.ndarray:
+        """
+        Rows whose key matches a case-insensitive regular expression anywhere,
+        as Series.str.contains(pattern, case=False) does; only the distinct
+        keys are tested
+        """
+        if self.numeric:
+            return np.zeros(0, dtype=np.int64)
+        search = re.compile(pattern, re.IGNORECASE).search
+        matched = [i for i, key in enumerate(self.keys) if search(key)]
+        if not matched:
+            return np.zeros(0, dtype=np.int64)
+        if len(matched) == matched[-1] - matched[0] + 1:
+            return self._rows_between(matched[0], matched[-1] + 1)
+        return np.sort(np.concatenate([self.order[self.offsets[i]:self.offsets[i + 1]] for i in matched]))
+
+
+class NumericIndex:
+    """
+    Numeric view of a column, coerced once like pd.to_numeric(errors='coerce'),
+    with the row order that sorts it so ranges are answered by binary search
+    """
+
+    def __init__(self, values: pd.Series):
+        self.series = pd.to_numeric(values, errors='coerce')
+        self.values = self.series.to_numpy(dtype=np.float64, na_value=np.nan)
+
+        # NaN sorts last; only the first `count` sorted values are numbers
+        self.order = np.argsort(self.values, kind='stable')
+        self.sorted_values = self.values[self.order]
+        self.count = int(len(self.values) - np.isnan(self.values).sum())
+
+    def range(self, low: Optional[float] = None, high: Optional[float] = None) -> np.ndarray:
+        """Sorted row positions whose value lies in [low, high]; None leaves a side open"""
+        numbers = self.sorted_values[:self.count]
+        start = int(np.searchsorted(numbers, low, side='left')) if low is not None else 0
+        stop = int(np.searchsorted(numbers, high, side='right')) if high is not None else self.count
+        if start >= stop:
+            return np.zeros(0, dtype=np.int64)
+        return np.sort(self.order[start:stop])
+
+
+def intersect_rows(*row_sets: Optional[np.ndarray]) -> np.ndarray:
+    """Intersect sorted row position arrays, smallest first; None means no constraint"""
+    sets = sorted((rows for rows in row_sets if rows is not None), key=len)
+    if not sets:
+        raise ValueError("at least one row set is required")
+    result = sets[0]
+    for rows in sets[1:]:
+        if not len(result):
+            break
+        result = np.intersect1d(result, rows, assume_unique=True)
+    return result
@@ -0,0 +1,41 @@
+"""
+Multi-keyword matcher for EconoVisionAI
+Compiled once per query and reused for every report and JSON leaf, so a
+text is scanned as a whole instead of line by line and keyword by keyword
+"""
+
+import re
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+
+class KeywordMatcher:
+    """
+    Finds every occurrence of a set of keywords in a text.
+    Each keyword is located with str.find over the whole text, which runs the
+    scan in C; for the handful of keywords a query produces this beats a
+    Python-level Aho-Corasick automaton and a regex alternation alike.
+    Texts passed to find() must already be lowercased.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords: List[str] = list(dict.fromkeys(keyword.lower() for keyword in keywords))
+        self._highlighters: Dict[str, re.Pattern] = {
+            keyword: re.compile(f'({re.escape(keyword)})', re.IGNORECASE)
+            for keyword in self.keywords
+        }
+
+    def find(self, text: str) -> Iterator[Tuple[int, str]]:
+        """Yield (position, keyword) for every keyword occurrence, in text order"""
+        hits = []
+        for keyword in self.keywords:
+            find = text.find
+            position = find(keyword)
+            while position != -1:
+                hits.append((position, keyword))
+                position = find(keyword, position + 1)
+        hits.sort()
+        return iter(hits)
+
+    def highlight(self, text: str, keyword: str) -> str:
+        """Wrap every occurrence of a keyword (any case) in **...**"""
+        return self._highlighters[keyword].sub(r'**\1**', text)
@@ -0,0 +1,119 @@
+"""
+Country-year panel for EconoVisionAI
+Aligns every dataset with Country and Year columns on one integer
+(country, year) key, so cross-indicator questions are answered with array
+masks over shared rows instead of repeated DataFrame merges
+"""
+
+import os
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+# Indicator range conditions: column -> (min, max), None leaves a side open
+Conditions = Dict[str, Tuple[Optional[float], Optional[float]]]
+
+
+class PanelStore:
+    """
+    Numeric indicators of several datasets on a shared (country, year) axis.
+    Row i is the pair (countries[country_codes[i]], years[i]); rows are the
+    sorted union of the pairs present in any dataset, and every indicator is a
+    float64 array over those rows with NaN where its dataset has no value.
+    """
+
+    def __init__(self, datasets: Iterable[Tuple[str, pd.DataFrame]]):
+        frames = []
+        for filename, df in datasets:
+            if 'Country' not in df.columns or 'Year' not in df.columns:
+                continue
+            years = pd.to_numeric(df['Year'], errors='coerce')
+            present = (df['Country'].notna() & years.notna()).to_numpy()
+            frames.append((filename, df[present], years[present].to_numpy(dtype=np.int64)))
+
+        names = pd.unique(np.concatenate([f[1]['Country'].astype(str).to_numpy(dtype=object) for f in frames])) if frames else []
+        self.countries = pd.Index(sorted(names), dtype=object)
+        all_years = np.concatenate([f[2] for f in frames]) if frames else np.zeros(0, dtype=np.int64)
+        self.first_year = int(all_years.min()) if len(all_years) else 0
+        span = int(all_years.max()) - self.first_year + 1 if len(all_years) else 1
+
+        # Integer key per (country, year): country code * span + year offset
+        frame_keys = []
+        for filename, df, years in frames:
+            codes = self.countries.get_indexer(df['Country'].astype(str))
+            frame_keys.append(codes.astype(np.int64) * span + (years - self.first_year))
+        keys = np.unique(np.concatenate(frame_keys)) if frame_keys else np.zeros(0, dtype=np.int64)
+
+        self.country_codes = (keys // span).astype(np.int32)
+        self.years = (keys % span + self.first_year).astype(np.int64)
+        self.columns: Dict[str, np.ndarray] = {}
+        # indicator -> file it comes from
+        self.sources: Dict[str, str] = {}
+
+        for (filename, df, _), frame_key in zip(frames, frame_keys):
+            rows = np.searchsorted(keys, frame_key)
+            for column in df.columns:
+                if column in ('Country', 'Year') or not pd.api.types.is_numeric_dtype(df[column].dtype):
+                    continue
+                # Same column name in two files: the later one is prefixed with its file
+                name = column if column not in self.columns else f"{os.path.splitext(filename)[0]}.{column}"
+                values = np.full(len(keys), np.nan)
+                values[rows] = df[column].to_numpy(dtype=np.float64, na_value=np.nan)
+                self.columns[name] = values
+                self.sources[name] = filename
+
+    def __len__(self) -> int:
+        return len(self.years)
+
+    def query(self, columns: Optional[List[str]] = None, where: Optional[Conditions] = None,
+              countries: Optional[Sequence[str]] = None,
+              years: Union[Sequence[int], Tuple[Optional[int], Optional[int]], None] = None,
+              complete: bool = False) -> pd.DataFrame:
+        """
+        Country, Year and the selected indicators (all by default) for the
+        (country, year) pairs where every `where` range holds (bounds
+        inclusive), limited to the given countries and to a list of years or a
+        (first, last) tuple. Pairs with no selected indicator are dropped;
+        with complete=True every selected indicator must have a value.
+        """
+        columns = list(self.columns) if columns is None else columns
+        where = where or {}
+        if any(column not in self.columns for column in list(columns) + list(where)):
+            return pd.DataFrame()
+
+        mask = np.ones(len(self), dtype=bool)
+        for column, (min_val, max_val) in where.items():
+            values = self.columns[column]
+            if min_val is not None:
+                mask &= values >= min_val
+            if max_val is not None:
+                mask &= values <= max_val
+            if min_val is None and max_val is None:
+                mask &= ~np.isnan(values)
+
+        if countries is not None:
+            codes = self.countries.get_indexer(list(countries))
+            mask &= np.isin(self.country_codes, codes[codes >= 0])
+
+        if isinstance(years, tuple):
+            first, last = years
+            if first is not None:
+                mask &= self.years >= first
+            if last is not None:
+                mask &= self.years <= last
+        elif years is not None:
+            mask &= np.isin(self.years, list(years))
+
+        if columns:
+            present = np.column_stack([~np.isnan(self.columns[column]) for column in columns])
+            mask &= present.all(axis=1) if complete else present.any(axis=1)
+
+        rows = np.flatnonzero(mask)
+        result = {
+            'Country': self.countries[self.country_codes[rows]],
+            'Year': self.years[rows],
+        }
+        for column in columns:
+            result[column] = self.columns[column][rows]
+        return pd.DataFrame(result)
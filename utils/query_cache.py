@@ -0,0 +1,83 @@
+"""
+Query result cache for EconoVisionAI
+LRU cache of search results keyed by normalised query and search mode;
+each entry remembers the versions of the files it was computed from and is
+dropped as soon as any of them changes
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, Optional, Tuple
+
+# (filename, size, mtime_ns) of every file a result depends on
+Versions = Tuple[Tuple[str, int, int], ...]
+
+
+def file_versions(paths: Iterable[str]) -> Versions:
+    """Current version of each file; a missing file gets size -1"""
+    versions = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            versions.append((path, stat.st_size, stat.st_mtime_ns))
+        except OSError:
+            versions.append((path, -1, 0))
+    return tuple(versions)
+
+
+class QueryCache:
+    """Thread-safe LRU cache of query results with hit/miss accounting"""
+
+    def __init__(self, max_entries: int = 128):
+        self.max_entries = max_entries
+        # key -> (versions, result, seconds the search took)
+        self._entries: "OrderedDict[Hashable, Tuple[Versions, Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.saved_seconds = 0.0
+
+    def get(self, key: Hashable, versions: Versions) -> Optional[Any]:
+        """Cached result for key if it was computed from the same file versions"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] != versions:
+                del self._entries[key]
+                self.invalidations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            self.saved_seconds += entry[2]
+            return entry[1]
+
+    def put(self, key: Hashable, versions: Versions, result: Any, elapsed: float):
+        with self._lock:
+            self._entries[key] = (versions, result, elapsed)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'hits': self.hits,
+                'misses': self.misses,
+                'invalidations': self.invalidations,
+                'hit_rate': self.hit_rate,
+                'saved_seconds': self.saved_seconds,
+            }
@@ -0,0 +1,296 @@
+"""
+Full-text report index for EconoVisionAI
+Positional inverted index over text and JSON reports with BM25 ranking,
+phrase queries and top-k retrieval; snippets are only built for the hits
+that are returned
+"""
+
+import bisect
+import heapq
+import json
+import math
+import re
+import threading
+import time
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+from .fuzzy_index import FuzzyIndex
+from .instrumentation import instruments
+
+TOKEN_RE = re.compile(r'\w+')
+PHRASE_RE = re.compile(r'"([^"]+)"')
+
+# Maximum vocabulary terms a query prefix is expanded to
+MAX_PREFIX_EXPANSIONS = 50
+
+
+def report_text(content: Any) -> str:
+    """Text that is indexed and shown for a report (JSON is pretty-printed)"""
+    if isinstance(content, (dict, list)):
+        return json.dumps(content, indent=2)
+    return str(content)
+
+
+class DocumentIndex:
+    """Token positions and line layout of a single report"""
+
+    def __init__(self, text: str):
+        self.text = text
+        lowered = text.lower()
+
+        starts = []
+        terms: Dict[str, List[int]] = {}
+        for position, match in enumerate(TOKEN_RE.finditer(lowered)):
+            starts.append(match.start())
+            terms.setdefault(match.group(), []).append(position)
+
+        self.length = len(starts)
+        self.postings: Dict[str, np.ndarray] = {
+            term: np.asarray(positions, dtype=np.int32) for term, positions in terms.items()
+        }
+
+        # Offsets of line starts, and the line each token falls on
+        newlines = [m.start() for m in re.finditer('\n', text)]
+        self.line_starts = np.asarray([0] + [n + 1 for n in newlines], dtype=np.int64)
+        self.token_lines = (np.searchsorted(self.line_starts, np.asarray(starts, dtype=np.int64), side='right') - 1).astype(np.int32)
+
+    def line(self, number: int) -> str:
+        start = self.line_starts[number]
+        if number + 1 < len(self.line_starts):
+            return self.text[start:self.line_starts[number + 1] - 1]
+        return self.text[start:]
+
+    def phrase_positions(self, terms: List[str]) -> np.ndarray:
+        """Start positions where the terms occur consecutively"""
+        first = self.postings.get(terms[0])
+        if first is None:
+            return np.zeros(0, dtype=np.int32)
+        starts = first
+        for offset, term in enumerate(terms[1:], start=1):
+            positions = self.postings.get(term)
+            if positions is None:
+                return np.zeros(0, dtype=np.int32)
+            starts = np.intersect1d(starts, positions - offset, assume_unique=True)
+            if not len(starts):
+                break
+        return starts
+
+
+class ReportHit:
+    """One ranked report with the snippet lines around its best matches"""
+
+    def __init__(self, name: str, score: float, lines: List[str]):
+        self.name = name
+        self.score = score
+        self.lines = lines
+
+    def __repr__(self):
+        return f"ReportHit({self.name!r}, score={self.score:.3f})"
+
+
+class ReportIndex:
+    """BM25-ranked positional inverted index over a corpus of reports"""
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.documents: Dict[str, DocumentIndex] = {}
+        self._term_docs: Dict[str, Set[str]] = {}
+        self._total_length = 0
+        self._vocabulary: Optional[List[str]] = None
+        # Trigram index over the vocabulary for misspelled terms, built on first use
+        self._typos: Optional[FuzzyIndex] = None
+        self._lock = threading.RLock()
+
+    def add(self, name: str, document: DocumentIndex):
+        """Add (or replace) a report"""
+        with self._lock:
+            self.remove(name)
+            self.documents[name] = document
+            self._total_length += document.length
+            for term in document.postings:
+                self._term_docs.setdefault(term, set()).add(name)
+            self._vocabulary = None
+            self._typos = None
+
+    def remove(self, name: str):
+        """Remove a report if it is indexed"""
+        with self._lock:
+            document = self.documents.pop(name, None)
+            if document is None:
+                return
+            self._total_length -= document.length
+            for term in document.postings:
+                docs = self._term_docs.get(term)
+                if docs is not None:
+                    docs.discard(name)
+                    if not docs:
+                        del self._term_docs[term]
+            self._vocabulary = None
+            self._typos = None
+
+    def _expand(self, term: str) -> List[str]:
+        """
+        Vocabulary terms for a query term: the term itself if indexed,
+        otherwise the indexed terms it is a prefix of, otherwise the indexed
+        terms within a few edits of it (a misspelling)
+        """
+        if term in self._term_docs:
+            return [term]
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self._term_docs)
+        start = bisect.bisect_left(self._vocabulary, term)
+        expanded = []
+        for candidate in self._vocabulary[start:start + MAX_PREFIX_EXPANSIONS]:
+            if not candidate.startswith(term):
+                break
+            expanded.append(candidate)
+        if expanded:
+            return expanded
+        return [word for word, _ in self._typo_index().lookup(term)]
+
+    def _typo_index(self) -> FuzzyIndex:
+        if self._typos is None:
+            self._typos = FuzzyIndex({term: len(docs) for term, docs in self._term_docs.items()})
+        return self._typos
+
+    def suggest(self, query: str, stop_words: Optional[Set[str]] = None) -> Optional[str]:
+        """
+        "Did you mean": the query with every word no report contains replaced
+        by the closest indexed word, or None if every word is indexed
+        """
+        with self._lock:
+            return self._typo_index().correct(query, ignore=stop_words)
+
+    @staticmethod
+    def parse_query(query: str) -> Tuple[List[List[str]], List[str]]:
+        """Split a query into quoted phrases and free terms"""
+        phrases = []
+        for phrase in PHRASE_RE.findall(query.lower()):
+            terms = TOKEN_RE.findall(phrase)
+            if len(terms) > 1:
+                phrases.append(terms)
+            elif terms:
+                # A one-word phrase is just a term
+                query += f" {terms[0]}"
+        terms = TOKEN_RE.findall(PHRASE_RE.sub(" ", query.lower()))
+        return phrases, list(dict.fromkeys(terms))
+
+    def query_terms(self, query: str, stop_words: Optional[Set[str]] = None) -> Tuple[List[List[str]], List[str]]:
+        """
+        Phrases and free terms a query is ranked by; free terms that are
+        stop words are ignored unless nothing else is left
+        """
+        phrases, terms = self.parse_query(query)
+        if stop_words:
+            terms = [term for term in terms if term not in stop_words] or terms
+        return phrases, terms
+
+    def _bm25(self, tf: int, length: int, idf: float, avgdl: float) -> float:
+        norm = tf + self.k1 * (1 - self.b + self.b * length / avgdl)
+        return idf * tf * (self.k1 + 1) / norm
+
+    def search(self, query: str, top_k: int = 10, context_lines: int = 2,
+               max_snippet_lines: int = 10, stop_words: Optional[Set[str]] = None) -> Tuple[List[ReportHit], int]:
+        """
+        Rank reports for a query.
+        Free terms that are stop words are ignored unless nothing else is left.
+        Returns the top_k hits (best first) and the number of matching reports.
+        """
+        started = time.perf_counter()
+        phrases, terms = self.query_terms(query, stop_words)
+
+        with self._lock:
+            n_docs = len(self.documents)
+            if not n_docs or not (phrases or terms):
+                return [], 0
+            avgdl = max(self._total_length / n_docs, 1.0)
+
+            scores: Dict[str, float] = {}
+            # positions per document that snippets should be built around
+            hit_positions: Dict[str, List[np.ndarray]] = {}
+
+            def idf(doc_freq: int) -> float:
+                return math.log(1 + (n_docs - doc_freq + 0.5) / (doc_freq + 0.5))
+
+            # Misspelled terms are highlighted as the words they matched
+            highlight_terms = list(terms)
+            for term in terms:
+                for vocab_term in self._expand(term):
+                    if not vocab_term.startswith(term):
+                        highlight_terms.append(vocab_term)
+                    docs = self._term_docs[vocab_term]
+                    term_idf = idf(len(docs))
+                    for name in docs:
+                        document = self.documents[name]
+                        positions = document.postings[vocab_term]
+                        scores[name] = scores.get(name, 0.0) + self._bm25(len(positions), document.length, term_idf, avgdl)
+                        hit_positions.setdefault(name, []).append(positions)
+
+            # Reports must contain every quoted phrase
+            required: Optional[Set[str]] = None
+            for phrase in phrases:
+                # Candidates must contain every term of the phrase
+                candidates = None
+                for term in phrase:
+                    docs = self._term_docs.get(term, set())
+                    candidates = docs if candidates is None else candidates & docs
+                matched = {}
+                for name in candidates or ():
+                    starts = self.documents[name].phrase_positions(phrase)
+                    if len(starts):
+                        matched[name] = starts
+                phrase_idf = idf(len(matched))
+                for name, starts in matched.items():
+                    document = self.documents[name]
+                    scores[name] = scores.get(name, 0.0) + self._bm25(len(starts), document.length, phrase_idf, avgdl)
+                    hit_positions.setdefault(name, []).append(starts)
+                required = set(matched) if required is None else required & set(matched)
+
+            if required is not None:
+                scores = {name: score for name, score in scores.items() if name in required}
+
+            matched = time.perf_counter()
+            instruments.record('match', matched - started, mode='reports', query=query, reports=len(scores))
+
+            best = heapq.nlargest(top_k, scores.items(), key=lambda item: item[1])
+            highlight = self._highlighter(phrases, highlight_terms)
+            hits = [
+                ReportHit(name, score, self._snippet(self.documents[name], hit_positions[name],
+                                                     highlight, context_lines, max_snippet_lines))
+                for name, score in best
+            ]
+            instruments.record('rank', time.perf_counter() - matched, mode='reports', query=query, hits=len(hits))
+            return hits, len(scores)
+
+    @staticmethod
+    def _highlighter(phrases: List[List[str]], terms: List[str]) -> Optional[re.Pattern]:
+        words = [r'\W+'.join(re.escape(t) for t in phrase) for phrase in phrases]
+        # Free terms may be prefixes of the indexed words they matched
+        words += [re.escape(term) + r'\w*' for term in terms]
+        if not words:
+            return None
+        return re.compile(r'\b(' + '|'.join(words) + r')', re.IGNORECASE)
+
+    @staticmethod
+    def _snippet(document: DocumentIndex, positions: List[np.ndarray], highlight: Optional[re.Pattern],
+                 context_lines: int, max_lines: int) -> List[str]:
+        """Context lines around the first matches of a report, '---' between blocks"""
+        hit_lines = np.unique(document.token_lines[np.concatenate(positions)])
+        snippet: List[str] = []
+        shown = set()
+        for line_number in hit_lines:
+            start = max(0, line_number - context_lines)
+            end = min(len(document.line_starts), line_number + context_lines + 1)
+            for number in range(start, end):
+                if number in shown:
+                    continue
+                shown.add(number)
+                line = document.line(number)
+                snippet.append(highlight.sub(r'**\1**', line) if highlight is not None else line)
+            snippet.append("---")
+            if len(snippet) >= max_lines:
+                break
+        return snippet[:max_lines]
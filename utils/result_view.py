@@ -0,0 +1,167 @@
+"""
+Paged result model for EconoVisionAI
+Search results are kept as row ids per (file, column) and only the rows of
+the page on screen are materialised and formatted
+"""
+
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Rows shown under each column in the overview before "... and N more"
+PREVIEW_ROWS = 5
+
+
+class ResultGroup:
+    """One block of results (a file/column pair or a report) addressed by position"""
+
+    def __init__(self, filename: str, title: Optional[str], count: int,
+                 fetch: Callable[[int, int], List[str]], label: Optional[str] = None,
+                 icon: str = "📁"):
+        self.filename = filename
+        self.title = title
+        self.count = count
+        # fetch(start, stop) -> formatted lines for items start..stop-1
+        self.fetch = fetch
+        self.label = label or filename
+        self.icon = icon
+
+
+class DataFrameGroup(ResultGroup):
+    """
+    Result group for the matching rows of one column. Rows may come from
+    several frames (the chunks of a streamed file); they are only looked up
+    and formatted when a page that shows them is rendered
+    """
+
+    def __init__(self, filename: str, column: str):
+        super().__init__(filename, None, 0, self._fetch, label=f"{filename} › {column}")
+        self.column = column
+        # (position of the part's first row in the group, frame, row ids)
+        self.parts: List[Tuple[int, pd.DataFrame, np.ndarray]] = []
+
+    def add_rows(self, df: pd.DataFrame, rows: np.ndarray):
+        """Append matching rows of a frame (e.g. the next chunk)"""
+        self.parts.append((self.count, df, rows))
+        self.count += len(rows)
+        self.title = f"🔸 Found {self.count} match(es) in column '{self.column}':"
+
+    def _fetch(self, start: int, stop: int) -> List[str]:
+        lines = []
+        for first, df, rows in self.parts:
+            if first >= stop:
+                break
+            if first + len(rows) <= start:
+                continue
+            part_rows = rows[max(start - first, 0):stop - first]
+            lines.extend(f"   • {record}" for record in df.iloc[part_rows].to_dict('records'))
+        return lines
+
+
+def dataframe_group(filename: str, column: str, df: pd.DataFrame, rows: np.ndarray) -> DataFrameGroup:
+    """Result group for the rows of one column of a frame"""
+    group = DataFrameGroup(filename, column)
+    group.add_rows(df, rows)
+    return group
+
+
+def lines_group(filename: str, lines: List[str]) -> ResultGroup:
+    """Result group for pre-formatted lines such as report context"""
+    return ResultGroup(filename, None, len(lines), lambda start, stop: lines[start:stop], icon="📄")
+
+
+class ResultModel:
+    """
+    Paged view over result groups.
+    The overview pages through groups, showing a short preview of each;
+    focusing a group ("show all") pages through every one of its rows.
+    """
+
+    def __init__(self, groups_per_page: int = 10, rows_per_page: int = 30):
+        self.groups_per_page = groups_per_page
+        self.rows_per_page = rows_per_page
+        self.clear()
+
+    def clear(self):
+        self.groups: List[ResultGroup] = []
+        self.header: Optional[str] = None
+        self.focus: Optional[int] = None
+        self.page = 0
+
+    def add(self, group: ResultGroup):
+        self.groups.append(group)
+
+    def show_all(self, group_index: Optional[int]):
+        """Focus one group (None returns to the overview) and go to its first page"""
+        self.focus = group_index
+        self.page = 0
+
+    @property
+    def page_count(self) -> int:
+        if self.focus is not None:
+            items, per_page = self.groups[self.focus].count, self.rows_per_page
+        else:
+            items, per_page = len(self.groups), self.groups_per_page
+        return max(1, -(-items // per_page))
+
+    def next_page(self) -> bool:
+        if self.page + 1 < self.page_count:
+            self.page += 1
+            return True
+        return False
+
+    def prev_page(self) -> bool:
+        if self.page > 0:
+            self.page -= 1
+            return True
+        return False
+
+    def page_shows_group(self, group_index: int) -> bool:
+        """True if a group is on the page currently shown"""
+        if self.focus is not None:
+            return self.focus == group_index
+        return group_index // self.groups_per_page == self.page
+
+    def render_page(self) -> str:
+        """Format only the content of the current page"""
+        lines = []
+        if self.header:
+            lines.append(self.header)
+            lines.append("")
+
+        if self.focus is not None:
+            group = self.groups[self.focus]
+            start = self.page * self.rows_per_page
+            stop = min(group.count, start + self.rows_per_page)
+            lines.append(f"{group.icon} File: {group.filename}")
+            lines.append("=" * 50)
+            if group.title:
+                lines.append(group.title)
+            lines.append(f"   (showing {start + 1}-{stop} of {group.count})")
+            lines.extend(group.fetch(start, stop))
+            return "\n".join(lines) + "\n"
+
+        start = self.page * self.groups_per_page
+        previous_file = None
+        for group in self.groups[start:start + self.groups_per_page]:
+            if group.filename != previous_file:
+                if previous_file is not None:
+                    lines.append("\n" + "-" * 50)
+                lines.append(f"\n{group.icon} File: {group.filename}")
+                lines.append("=" * 50)
+                previous_file = group.filename
+
+            if group.title:
+                lines.append("")
+                lines.append(group.title)
+                # Show first rows to avoid overwhelming the display
+                lines.extend(group.fetch(0, min(group.count, PREVIEW_ROWS)))
+                if group.count > PREVIEW_ROWS:
+                    lines.append(f"   ... and {group.count - PREVIEW_ROWS} more matches")
+            else:
+                lines.extend(group.fetch(0, group.count))
+
+        if previous_file is not None:
+            lines.append("\n" + "-" * 50)
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,124 @@
+"""
+Asynchronous search execution for EconoVisionAI
+Runs searches on a worker thread and hands results back to the Tk main loop
+through after() callbacks, cancelling any search that a newer one replaces
+"""
+
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterator, Optional
+
+# Schedules a callback on the GUI thread after a delay in ms (e.g. widget.after)
+Scheduler = Callable[[int, Callable[[], None]], Any]
+
+
+class SearchCancelled(Exception):
+    """Raised inside a search task when it has been superseded"""
+
+
+class CancelToken:
+    """Cooperative cancellation flag shared between the GUI and a search task"""
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def check(self):
+        """Abort the running task if it has been cancelled"""
+        if self._event.is_set():
+            raise SearchCancelled()
+
+
+class SearchExecutor:
+    """
+    Runs one search at a time off the GUI thread.
+    A task is a callable taking a CancelToken and returning an iterator of
+    partial results; every item is delivered to on_result on the GUI thread
+    as soon as it is produced, so results stream in while the search runs.
+    Submitting a new task cancels the one in flight.
+    """
+
+    def __init__(self, schedule: Scheduler, poll_interval_ms: int = 30):
+        self.schedule = schedule
+        self.poll_interval_ms = poll_interval_ms
+        self._worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="search")
+        self._events: "queue.Queue" = queue.Queue()
+        self._token: Optional[CancelToken] = None
+        self._callbacks = {}
+        self._polling = False
+
+    @property
+    def busy(self) -> bool:
+        return self._token is not None
+
+    def submit(self, task: Callable[[CancelToken], Iterator[Any]],
+               on_result: Callable[[Any], None],
+               on_done: Optional[Callable[[], None]] = None,
+               on_error: Optional[Callable[[Exception], None]] = None) -> CancelToken:
+        """Cancel the running search and start a new one"""
+        self.cancel()
+        token = CancelToken()
+        self._token = token
+
+        def run():
+            try:
+                for item in task(token):
+                    token.check()
+                    self._events.put((token, 'result', item))
+                self._events.put((token, 'done', None))
+            except SearchCancelled:
+                pass
+            except Exception as e:
+                self._events.put((token, 'error', e))
+
+        self._callbacks = {'result': on_result, 'done': on_done, 'error': on_error}
+        self._worker.submit(run)
+        if not self._polling:
+            self._polling = True
+            self.schedule(self.poll_interval_ms, self._poll)
+        return token
+
+    def cancel(self):
+        """Cancel the search in flight, if any"""
+        if self._token is not None:
+            self._token.cancel()
+            self._token = None
+
+    def _poll(self):
+        """Deliver queued results on the GUI thread"""
+        try:
+            while True:
+                token, kind, payload = self._events.get_nowait()
+                # Results from a superseded search are dropped silently
+                if token.cancelled or token is not self._token:
+                    continue
+
+                if kind != 'result':
+                    self._token = None
+                callback = self._callbacks.get(kind)
+                if callback is None:
+                    if kind == 'error':
+                        print(f"Search failed: {payload}")
+                elif kind == 'done':
+                    callback()
+                else:
+                    callback(payload)
+        except queue.Empty:
+            pass
+
+        if self._token is not None or not self._events.empty():
+            self.schedule(self.poll_interval_ms, self._poll)
+        else:
+            self._polling = False
+
+    def shutdown(self):
+        """Cancel the current search and stop the worker"""
+        self.cancel()
+        self._worker.shutdown(wait=False)
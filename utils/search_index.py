@@ -0,0 +1,222 @@
+"""
+Search index for EconoVisionAI
+Builds dictionary-encoded, n-gram indexed views of DataFrame columns so that
+substring queries become a few lookups over distinct values instead of full
+column scans
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:  # pyarrow is optional; fall back to Python string checks
+    pa = None
+    pc = None
+
+# Length of the character n-grams stored in the index
+NGRAM_SIZE = 3
+
+# Columns with at most this many distinct values are matched by scanning the
+# distinct values directly; larger text dictionaries get an n-gram index
+SCAN_UNIQUES_LIMIT = 4096
+
+# Distinct-value count above which text values are kept as an Arrow string array
+ARROW_MIN_UNIQUES = 50000
+
+
+class ColumnIndex:
+    """
+    Search view of the lowercased string form of one column.
+    The column is dictionary-encoded once: each row stores an integer code
+    into the distinct lowercased values, so a query only checks the distinct
+    values (e.g. ~200 countries) and maps hits back to rows through the codes.
+    """
+
+    def __init__(self, values: pd.Series, n: int = NGRAM_SIZE, postings: bool = True):
+        self.n = n
+        self.num_rows = len(values)
+        # Numeric columns never get n-gram postings: the string forms of e.g. a
+        # million distinct GDP figures share few grams, so postings would
+        # dwarf the column while barely narrowing a scan of the distinct values
+        self.numeric = pd.api.types.is_numeric_dtype(values.dtype)
+
+        # Mixed object columns are stringified before encoding so that values
+        # such as 1 and True stay distinct; typed columns are encoded first and
+        # only their distinct values are stringified
+        if values.dtype == object:
+            values = values.astype(str)
+        codes, uniques = pd.factorize(values)
+
+        # Same normalisation as the old `astype(str).str.lower()` scan, so
+        # index lookups keep the exact `contains(na=False)` semantics; values
+        # that stay missing after astype(str) become "" and never match
+        lowered = pd.Series(uniques).astype(str).str.lower().fillna("").tolist()
+        missing = codes < 0
+        if missing.any():
+            lowered.append(values[missing].iloc[:1].astype(str).str.lower().fillna("").iloc[0])
+            codes[missing] = len(lowered) - 1
+
+        self.codes = codes.astype(np.int32)
+        self.uniques = np.asarray(lowered, dtype=object)
+
+        # Rows grouped by value id (CSR layout) to map value hits back to rows
+        self.row_order = np.argsort(self.codes, kind='stable').astype(np.int64)
+        self.row_offsets = np.zeros(len(self.uniques) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.codes, minlength=len(self.uniques)), out=self.row_offsets[1:])
+
+        # High-cardinality values are kept as an Arrow string array for
+        # vectorised matching; for numeric columns it replaces the postings
+        arrow_min = SCAN_UNIQUES_LIMIT if self.numeric else ARROW_MIN_UNIQUES
+        self.arrow_uniques = None
+        if pa is not None and len(self.uniques) > arrow_min:
+            self.arrow_uniques = pa.array(lowered, type=pa.large_string())
+
+        # One-off searches (e.g. streamed chunks) skip the n-gram postings
+        self.grams = None
+        if postings and not self.numeric and len(self.uniques) > SCAN_UNIQUES_LIMIT:
+            self.grams, self.offsets, self.value_ids = self._build_postings()
+
+    def _build_postings(self):
+        """
+        Build CSR-style posting lists: gram -> sorted distinct-value ids
+        """
+        lowered = pd.Series(self.uniques, dtype=object)
+        lengths = lowered.str.len().to_numpy()
+        max_len = int(lengths.max()) if len(lengths) else 0
+
+        gram_parts = []
+        id_parts = []
+        for start in range(max(0, max_len - self.n + 1)):
+            ids = np.flatnonzero(lengths >= start + self.n)
+            if not len(ids):
+                continue
+            grams = lowered.iloc[ids].str.slice(start, start + self.n)
+            gram_parts.append(grams.to_numpy(dtype=object))
+            id_parts.append(ids)
+
+        if not gram_parts:
+            return {}, np.zeros(1, dtype=np.int64), np.zeros(0, dtype=np.int64)
+
+        all_grams = np.concatenate(gram_parts)
+        all_ids = np.concatenate(id_parts)
+
+        codes, uniques = pd.factorize(all_grams)
+        # Sort by (gram, value id) and drop repeated grams within the same value
+        order = np.lexsort((all_ids, codes))
+        codes = codes[order]
+        all_ids = all_ids[order]
+        keep = np.ones(len(codes), dtype=bool)
+        keep[1:] = (codes[1:] != codes[:-1]) | (all_ids[1:] != all_ids[:-1])
+        codes = codes[keep]
+        all_ids = all_ids[keep]
+
+        counts = np.bincount(codes, minlength=len(uniques))
+        offsets = np.zeros(len(uniques) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        grams = {gram: i for i, gram in enumerate(uniques)}
+        return grams, offsets, all_ids.astype(np.int64)
+
+    def _postings(self, gram: str) -> Optional[np.ndarray]:
+        """Return the posting list for a gram, or None if the gram is absent"""
+        gram_id = self.grams.get(gram)
+        if gram_id is None:
+            return None
+        return self.value_ids[self.offsets[gram_id]:self.offsets[gram_id + 1]]
+
+    def candidates(self, term: str) -> Optional[np.ndarray]:
+        """
+        Distinct-value ids that contain every n-gram of the term.
+        Returns None when there is no n-gram index or the term is too short.
+        """
+        if self.grams is None or len(term) < self.n:
+            return None
+
+        grams = {term[i:i + self.n] for i in range(len(term) - self.n + 1)}
+        postings = []
+        for gram in grams:
+            ids = self._postings(gram)
+            if ids is None:
+                return np.zeros(0, dtype=np.int64)
+            postings.append(ids)
+
+        # Intersect the shortest lists first to keep intermediates small
+        postings.sort(key=len)
+        result = postings[0]
+        for ids in postings[1:]:
+            if not len(result):
+                break
+            result = np.intersect1d(result, ids, assume_unique=True)
+        return result
+
+    def _verify(self, term: str, exact: bool, ids: Optional[np.ndarray]) -> np.ndarray:
+        """Check the real substring/equality on the given (or all) distinct values"""
+        if self.arrow_uniques is not None:
+            values = self.arrow_uniques if ids is None else self.arrow_uniques.take(pa.array(ids))
+            if exact:
+                keep = pc.equal(values, term)
+            else:
+                keep = pc.match_substring(values, term)
+            keep = keep.to_numpy(zero_copy_only=False)
+        else:
+            values = self.uniques if ids is None else self.uniques[ids]
+            if exact:
+                keep = values == term
+            else:
+                keep = np.fromiter((term in value for value in values), dtype=bool, count=len(values))
+
+        matched = np.flatnonzero(keep)
+        return matched if ids is None else ids[matched]
+
+    def match_values(self, term: str, exact: bool = False) -> np.ndarray:
+        """Sorted ids of the distinct values that contain (or equal) the term"""
+        term = term.lower()
+        candidates = self.candidates(term)
+        if candidates is not None and not len(candidates):
+            return candidates
+        return self._verify(term, exact, candidates)
+
+    def rows_for_values(self, ids: np.ndarray) -> np.ndarray:
+        """Sorted row positions holding any of the given distinct values"""
+        if not len(ids):
+            return np.zeros(0, dtype=np.int64)
+        if len(ids) == 1:
+            return self.row_order[self.row_offsets[ids[0]]:self.row_offsets[ids[0] + 1]]
+
+        counts = self.row_offsets[ids + 1] - self.row_offsets[ids]
+        if counts.sum() * 8 > self.num_rows:
+            # Many rows: a vectorised pass over the codes is cheaper than sorting
+            selected = np.zeros(len(self.uniques), dtype=bool)
+            selected[ids] = True
+            return np.flatnonzero(selected[self.codes])
+        rows = np.concatenate([self.row_order[self.row_offsets[i]:self.row_offsets[i + 1]] for i in ids])
+        rows.sort()
+        return rows
+
+    def search(self, term: str, exact: bool = False) -> np.ndarray:
+        """
+        Return sorted row positions whose value contains (or equals) the term
+        """
+        return self.rows_for_values(self.match_values(term, exact))
+
+
+class DatasetIndex:
+    """Per-column n-gram indexes for one DataFrame"""
+
+    def __init__(self, df: pd.DataFrame, n: int = NGRAM_SIZE, postings: bool = True):
+        self.num_rows = len(df)
+        self.columns = {column: ColumnIndex(df[column], n, postings) for column in df.columns}
+
+    def search(self, term: str, exact: bool = False, columns: Optional[List[str]] = None) -> Dict[str, np.ndarray]:
+        """
+        Search every (or the given) column for a term.
+        Returns {column: row positions} for columns with at least one match.
+        """
+        matches = {}
+        for column in columns if columns is not None else self.columns:
+            rows = self.columns[column].search(term, exact=exact)
+            if len(rows):
+                matches[column] = rows
+        return matches
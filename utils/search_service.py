@@ -0,0 +1,203 @@
+"""
+Search service for EconoVisionAI
+Runs CSV and report searches for many clients on a worker pool over one
+shared, already indexed DataStore, coalescing identical concurrent queries
+and recording per-request latency
+"""
+
+import json
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .data_store import DataStore
+from .instrumentation import QueryProfiler, instruments
+from .search_utils import SearchStats
+
+# Search modes a request can ask for
+SEARCH_MODES = ('data', 'reports')
+
+# Latency samples kept per mode for the percentiles
+LATENCY_WINDOW = 1000
+
+
+class LatencyMetrics:
+    """Request counts and latency percentiles per search mode"""
+
+    def __init__(self, window: int = LATENCY_WINDOW):
+        self.window = window
+        self._samples: Dict[str, Deque[float]] = {}
+        self._counts: Dict[str, int] = {}
+        self._errors: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def record(self, mode: str, seconds: float, error: bool = False):
+        with self._lock:
+            self._samples.setdefault(mode, deque(maxlen=self.window)).append(seconds)
+            self._counts[mode] = self._counts.get(mode, 0) + 1
+            if error:
+                self._errors[mode] = self._errors.get(mode, 0) + 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            metrics = {}
+            for mode, samples in self._samples.items():
+                values = np.asarray(samples) * 1000
+                metrics[mode] = {
+                    'requests': self._counts[mode],
+                    'errors': self._errors.get(mode, 0),
+                    'mean_ms': float(values.mean()),
+                    'p50_ms': float(np.percentile(values, 50)),
+                    'p95_ms': float(np.percentile(values, 95)),
+                    'max_ms': float(values.max()),
+                }
+            return metrics
+
+
+class SearchService:
+    """
+    Thread-safe front end over a DataStore for concurrent clients.
+    Requests for the same (mode, query, options) that arrive while one is
+    already running share its result instead of searching again.
+    """
+
+    def __init__(self, store: DataStore, max_workers: Optional[int] = None, max_rows: int = 100):
+        self.store = store
+        self.searcher = store.searcher
+        # Rows returned per (file, column) group unless a request asks for fewer
+        self.max_rows = max_rows
+        self.metrics = LatencyMetrics()
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="service")
+        self._inflight: Dict[Tuple, Future] = {}
+        self._lock = threading.Lock()
+
+    def load(self, watch: bool = False):
+        """Discover and index every file before serving (optionally keep watching the folders)"""
+        self.store.discover()
+        for future in self.store.load_in_background(eager=True):
+            future.result()
+        if watch:
+            self.store.start_watching()
+
+    def submit(self, mode: str, query: str, **options) -> Future:
+        """Queue a search; the future resolves to its JSON-serialisable result"""
+        if mode not in SEARCH_MODES:
+            raise ValueError(f"Unknown search mode '{mode}', expected one of {', '.join(SEARCH_MODES)}")
+        query = query.strip().lower()
+        if not query:
+            raise ValueError("Empty query")
+
+        key = (mode, query, tuple(sorted(options.items())))
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                return future
+            future = self._pool.submit(self._run, mode, query, options, time.perf_counter())
+            self._inflight[key] = future
+        future.add_done_callback(lambda _: self._forget(key))
+        return future
+
+    def _forget(self, key: Tuple):
+        with self._lock:
+            self._inflight.pop(key, None)
+
+    def search(self, mode: str, query: str, **options) -> Dict[str, Any]:
+        return self.submit(mode, query, **options).result()
+
+    def batch(self, requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Run several searches concurrently, e.g.
+        [{'mode': 'data', 'query': 'india'}, {'mode': 'reports', 'query': 'growth', 'top_k': 5}];
+        results (or {'error': ...}) come back in request order
+        """
+        futures = []
+        for request in requests:
+            options = {k: v for k, v in request.items() if k not in ('mode', 'query')}
+            try:
+                futures.append(self.submit(request.get('mode', 'data'), str(request.get('query', '')), **options))
+            except Exception as e:
+                futures.append(e)
+
+        results = []
+        for future in futures:
+            if isinstance(future, Exception):
+                results.append({'error': str(future)})
+                continue
+            try:
+                results.append(future.result())
+            except Exception as e:
+                results.append({'error': str(e)})
+        return results
+
+    def _run(self, mode: str, query: str, options: Dict[str, Any], submitted: float) -> Dict[str, Any]:
+        options = dict(options)
+        # profile=True runs this one request under cProfile and tracemalloc
+        profiler = QueryProfiler() if options.pop('profile', False) else None
+        started = time.perf_counter()
+        error = True
+        try:
+            if profiler is not None:
+                profiler.start()
+            try:
+                if mode == 'data':
+                    result = self._search_data(query, **options)
+                else:
+                    result = self._search_reports(query, **options)
+            finally:
+                if profiler is not None:
+                    profiler.stop()
+            error = False
+        finally:
+            finished = time.perf_counter()
+            self.metrics.record(mode, finished - submitted, error)
+        result.update({
+            'mode': mode,
+            'query': query,
+            'queued_ms': (started - submitted) * 1000,
+            'elapsed_ms': (finished - started) * 1000,
+        })
+        if profiler is not None:
+            result['profile'] = profiler.report()
+        return result
+
+    def _search_data(self, query: str, limit: Optional[int] = None, exact: bool = False) -> Dict[str, Any]:
+        limit = self.max_rows if limit is None else min(int(limit), self.max_rows)
+        stats = SearchStats(query)
+        groups = []
+        for filename, df, column_rows in self.store.search_csvs(query, stats, exact=bool(exact)):
+            for column, rows in column_rows.items():
+                best = self.searcher.rank_rows(df, column, rows, query, top_k=limit)
+                # to_json turns NaN into null and numpy scalars into plain numbers
+                records = json.loads(df.iloc[best].to_json(orient='records'))
+                groups.append({'file': filename, 'column': column, 'count': len(rows), 'rows': records})
+        result = {'groups': groups, 'stats': stats.to_dict()}
+        if not groups:
+            result['suggestion'] = self.store.suggest(query)
+        return result
+
+    def _search_reports(self, query: str, top_k: int = 10) -> Dict[str, Any]:
+        hits, total = self.store.search_reports(query, top_k=int(top_k), stop_words=self.searcher.stop_words)
+        result = {
+            'total': total,
+            'hits': [{'name': hit.name, 'score': hit.score, 'lines': hit.lines} for hit in hits],
+        }
+        if not total:
+            result['suggestion'] = self.store.suggest(query, 'reports', self.searcher.stop_words)
+        return result
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            'datasets': self.store.cache_info(),
+            'reports': len(self.store.report_paths),
+            'query_cache': self.store.query_cache.stats(),
+            'latency': self.metrics.to_dict(),
+            'instruments': instruments.snapshot(),
+        }
+
+    def shutdown(self):
+        self._pool.shutdown(wait=False)
+        self.store.shutdown()
@@ -3,11 +3,137 @@ Search utilities for EconoVisionAI
 Provides advanced search and filtering functions for economic data
 """
 
+import numpy as np
 import pandas as pd
 import re
-from typing import List, Dict, Tuple, Any
+import sys
+import threading
+import time
+import weakref
+from typing import List, Dict, Set, Tuple, Any, Optional, Union, Iterable, Iterator, Callable, Hashable
 import json
 
+from .search_index import ColumnIndex, DatasetIndex
+from .keyword_matcher import KeywordMatcher
+from .json_index import FlatJSON
+from .key_index import KeyIndex, NumericIndex, intersect_rows
+from .column_stats import ColumnStats, DatasetStats, GROUP_COLUMNS, grouped_stats
+from .panel_store import PanelStore, Conditions
+from .instrumentation import instruments
+from .relevance import relevance_scores, top_k_indices, value_scores
+from .fuzzy_index import FuzzyIndex, vocabulary_of
+
+class FileMatchStats:
+    """Match statistics for one searched file, gathered during the search pass"""
+
+    def __init__(self, filename: str, rows_searched: int, column_hits: Dict[str, int],
+                 rows_hit: int, elapsed: float):
+        self.filename = filename
+        self.rows_searched = rows_searched
+        self.column_hits = column_hits
+        self.rows_hit = rows_hit
+        self.elapsed = elapsed
+
+    @property
+    def matches(self) -> int:
+        """Total (row, column) matches"""
+        return sum(self.column_hits.values())
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'filename': self.filename,
+            'rows_searched': self.rows_searched,
+            'rows_hit': self.rows_hit,
+            'matches': self.matches,
+            'columns_hit': dict(self.column_hits),
+            'elapsed': self.elapsed,
+        }
+
+
+class SearchStats:
+    """Aggregate statistics of one search across files"""
+
+    def __init__(self, query: str):
+        self.query = query
+        self.files: List[FileMatchStats] = []
+        self.elapsed = 0.0
+
+    def add(self, file_stats: FileMatchStats):
+        self.files.append(file_stats)
+
+    @property
+    def files_searched(self) -> int:
+        return len(self.files)
+
+    @property
+    def files_hit(self) -> int:
+        return sum(1 for f in self.files if f.rows_hit)
+
+    @property
+    def rows_hit(self) -> int:
+        return sum(f.rows_hit for f in self.files)
+
+    @property
+    def matches(self) -> int:
+        return sum(f.matches for f in self.files)
+
+    @property
+    def columns_hit(self) -> int:
+        return sum(len(f.column_hits) for f in self.files)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'query': self.query,
+            'files_searched': self.files_searched,
+            'files_hit': self.files_hit,
+            'rows_hit': self.rows_hit,
+            'matches': self.matches,
+            'columns_hit': self.columns_hit,
+            'elapsed': self.elapsed,
+            'files': [f.to_dict() for f in self.files],
+        }
+
+
+def _array_root(array: np.ndarray) -> int:
+    """Identity of the array that owns an array's memory"""
+    while isinstance(array.base, np.ndarray):
+        array = array.base
+    return id(array)
+
+
+def estimate_nbytes(obj: Any, seen: Optional[Set[int]] = None) -> int:
+    """
+    Approximate memory held by a derived structure: numpy, pandas and Arrow
+    buffers (object arrays with their elements), containers with their items
+    and the attributes of plain objects. Arrays whose memory is in seen
+    (e.g. the columns of the frame an index was built from) are not counted.
+    """
+    seen = seen if seen is not None else set()
+    if isinstance(obj, (pd.Series, pd.Index)):
+        obj = obj.to_numpy()
+    if isinstance(obj, np.ndarray):
+        root = _array_root(obj)
+        if root in seen:
+            return 0
+        seen.add(root)
+        if obj.dtype == object:
+            return int(pd.Series(obj.ravel(), copy=False).memory_usage(deep=True, index=False))
+        return int(obj.nbytes)
+    if isinstance(obj, (str, bytes, int, float, bool, type(None), np.generic)):
+        return sys.getsizeof(obj)
+    if isinstance(getattr(obj, 'nbytes', None), int):
+        # e.g. Arrow arrays
+        return obj.nbytes
+    if isinstance(obj, dict):
+        return sys.getsizeof(obj) + sum(estimate_nbytes(key, seen) + estimate_nbytes(value, seen)
+                                        for key, value in obj.items())
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return sys.getsizeof(obj) + sum(estimate_nbytes(item, seen) for item in obj)
+    if hasattr(obj, '__dict__'):
+        return sys.getsizeof(obj) + estimate_nbytes(vars(obj), seen)
+    return sys.getsizeof(obj)
+
+
 class DataSearcher:
     """Advanced search functionality for CSV and report data"""
 
@@ -18,6 +144,227 @@ class DataSearcher:
             'do', 'does', 'did', 'will', 'would', 'could', 'should', 'may', 'might',
             'a', 'an', 'this', 'that', 'these', 'those'
         }
+        # Ids of the DataFrames whose derived structures are memoised (see adopt_dataframe)
+        self._adopted: Set[int] = set()
+        # DataFrame id -> DatasetIndex, dropped when the DataFrame is collected
+        self._indexes: Dict[int, DatasetIndex] = {}
+        # Columns that get exact/prefix/range lookup indexes
+        self.key_columns = {'Country', 'Year'}
+        # DataFrame id -> {(kind, column): KeyIndex, NumericIndex or DatasetStats}
+        self._column_indexes: Dict[int, Dict[Tuple[str, Optional[str]], Any]] = {}
+        # Country-year panel and the (filename, DataFrame) pairs it was built from
+        self._panel: Optional[PanelStore] = None
+        self._panel_sources: List[Tuple[str, weakref.ref]] = []
+        # Typo index over the words of several datasets, and the key of their contents
+        self._typo_index: Optional[FuzzyIndex] = None
+        self._typo_key: Optional[Hashable] = None
+        # Held while the typo index is checked against its key and rebuilt,
+        # so concurrent searches never pair an index with another key
+        self._typo_lock = threading.Lock()
+
+    def adopt_dataframe(self, df: pd.DataFrame):
+        """
+        Memoise the search index, lookup indexes and statistics of a DataFrame
+        for as long as it lives (or until release_dataframe). Only for frames
+        that are never mutated afterwards, such as those a DataStore loads:
+        any other DataFrame may be edited in place between calls, so its
+        structures are rebuilt on every call instead.
+        """
+        key = id(df)
+        if key not in self._adopted:
+            self._adopted.add(key)
+            weakref.finalize(df, self.release_dataframe, key)
+
+    def release_dataframe(self, df: Union[pd.DataFrame, int]):
+        """Drop everything memoised for a DataFrame (or DataFrame id), e.g. once it has been replaced"""
+        key = df if isinstance(df, int) else id(df)
+        self._adopted.discard(key)
+        self._indexes.pop(key, None)
+        self._column_indexes.pop(key, None)
+
+    def memory_usage(self, df: pd.DataFrame) -> int:
+        """
+        Approximate bytes held by what is memoised for an adopted DataFrame
+        (search index, lookup and numeric indexes, statistics, vocabulary),
+        not counting the DataFrame itself. Structures are not changed once
+        built, so each is measured only the first time it is seen.
+        """
+        key = id(df)
+        if key not in self._adopted:
+            return 0
+        memo = self._memo(df)
+        # id(structure) -> measured size
+        sizes = memo.setdefault(('nbytes', None), {})
+        structures = [structure for name, structure in list(memo.items()) if name != ('nbytes', None)]
+        index = self._indexes.get(key)
+        if index is not None:
+            structures.append(index)
+
+        seen = None
+        total = 0
+        for structure in structures:
+            size = sizes.get(id(structure))
+            if size is None:
+                if seen is None:
+                    # Buffers shared with the frame's own columns are not extra memory
+                    seen = {_array_root(column.to_numpy()) for _, column in df.items()
+                            if pd.api.types.is_numeric_dtype(column.dtype)}
+                size = sizes[id(structure)] = estimate_nbytes(structure, seen)
+            total += size
+        return total
+
+    def index_dataframe(self, df: pd.DataFrame, index: Optional[DatasetIndex] = None) -> DatasetIndex:
+        """
+        Return the search index for a DataFrame, building it on first use.
+        A prebuilt index (e.g. loaded from the disk cache) can be attached.
+        Only adopted DataFrames keep their index; others get a one-off index
+        without n-gram postings on every call.
+        """
+        key = id(df)
+        if key not in self._adopted:
+            if index is None:
+                with instruments.stage('index', rows=len(df)):
+                    index = DatasetIndex(df, postings=False)
+            return index
+        if index is None:
+            index = self._indexes.get(key)
+            if index is not None:
+                return index
+            with instruments.stage('index', rows=len(df)):
+                index = DatasetIndex(df)
+        self._indexes[key] = index
+        return index
+
+    def register_key_column(self, column: str):
+        """Also build lookup indexes for a column (Country and Year are built by default)"""
+        self.key_columns.add(column)
+
+    def _memo(self, df: pd.DataFrame) -> Dict[Tuple[str, Optional[str]], Any]:
+        """
+        Structures derived from an adopted DataFrame, dropped when it is
+        released; a DataFrame that is not adopted gets an empty, throwaway memo
+        """
+        key = id(df)
+        if key not in self._adopted:
+            return {}
+        return self._column_indexes.setdefault(key, {})
+
+    def _column_index(self, df: pd.DataFrame, kind: str, column: str):
+        """
+        Return the memoised index of one kind for a column, building it on first use.
+        Returns None if the DataFrame has no such column.
+        """
+        if column not in df.columns:
+            return None
+        memo = self._memo(df)
+        index = memo.get((kind, column))
+        if index is None:
+            index_class = KeyIndex if kind == 'key' else NumericIndex
+            index = memo[(kind, column)] = index_class(df[column])
+        return index
+
+    def key_index(self, df: pd.DataFrame, column: str) -> Optional[KeyIndex]:
+        """Lookup index (exact/prefix/range/pattern) of a column"""
+        return self._column_index(df, 'key', column)
+
+    def numeric_index(self, df: pd.DataFrame, column: str) -> Optional[NumericIndex]:
+        """Coerced numeric values and sorted range index of a column"""
+        return self._column_index(df, 'numeric', column)
+
+    def vocabulary(self, df: pd.DataFrame) -> Dict[str, int]:
+        """Words of the distinct values of the text columns, with the number of values holding each"""
+        memo = self._memo(df)
+        vocabulary = memo.get(('vocabulary', None))
+        if vocabulary is None:
+            index = self.index_dataframe(df)
+            vocabulary = {}
+            for column in self.searchable_columns(df):
+                if pd.api.types.is_numeric_dtype(df[column]):
+                    continue
+                for word, count in vocabulary_of(index.columns[column].uniques).items():
+                    vocabulary[word] = vocabulary.get(word, 0) + count
+            memo[('vocabulary', None)] = vocabulary
+        return vocabulary
+
+    def typo_index(self, df: pd.DataFrame) -> FuzzyIndex:
+        """Trigram index over the vocabulary of a DataFrame for typo-tolerant lookup"""
+        memo = self._memo(df)
+        index = memo.get(('fuzzy', None))
+        if index is None:
+            index = memo[('fuzzy', None)] = FuzzyIndex(self.vocabulary(df))
+        return index
+
+    def build_key_indexes(self, df: pd.DataFrame):
+        """Build the lookup indexes of every registered column present in a DataFrame"""
+        for column in self.key_columns:
+            self.key_index(df, column)
+
+    def summarize_dataframe(self, df: pd.DataFrame, stats: Optional[DatasetStats] = None) -> DatasetStats:
+        """
+        Return the summary statistics of a DataFrame, computing them on first use:
+        every numeric column, overall and per Country/Year group.
+        Precomputed statistics (e.g. loaded from the disk cache) can be attached.
+        """
+        memo = self._memo(df)
+        if stats is None:
+            stats = memo.get(('stats', None))
+            if stats is not None:
+                return stats
+            stats = DatasetStats()
+            numeric_columns = [column for column in df.columns if pd.api.types.is_numeric_dtype(df[column].dtype)]
+            for column in numeric_columns:
+                index = self.numeric_index(df, column)
+                stats.columns[column] = ColumnStats.from_sorted(index.sorted_values[:index.count])
+                for by in GROUP_COLUMNS:
+                    if by in df.columns and by != column:
+                        stats.groups[(by, column)] = grouped_stats(df[by], index.values)
+        memo[('stats', None)] = stats
+        return stats
+
+    def append_rows(self, df: pd.DataFrame, rows: pd.DataFrame) -> pd.DataFrame:
+        """
+        Return df with rows appended; its summary statistics are merged from
+        those of df and of the new rows rather than recomputed
+        """
+        combined = pd.concat([df, rows], ignore_index=True)
+        if id(df) in self._adopted:
+            self.adopt_dataframe(combined)
+        stats = self.summarize_dataframe(df).merge(self.summarize_dataframe(rows))
+        self.summarize_dataframe(combined, stats)
+        return combined
+
+    def _same_sources(self, datasets: List[Tuple[str, pd.DataFrame]], sources: List[Tuple[str, weakref.ref]]) -> bool:
+        """
+        True if the (filename, DataFrame) pairs are the ones recorded in
+        sources and all of them are adopted (others may have been edited)
+        """
+        return len(datasets) == len(sources) and all(
+            name == source_name and ref() is df and id(df) in self._adopted
+            for (name, df), (source_name, ref) in zip(datasets, sources)
+        )
+
+    def panel(self, datasets: Iterable[Tuple[str, pd.DataFrame]]) -> PanelStore:
+        """
+        Return the country-year panel of the datasets, rebuilding it only
+        when the set of datasets (or any of their DataFrames) has changed
+        """
+        datasets = list(datasets)
+        if self._panel is None or not self._same_sources(datasets, self._panel_sources):
+            self._panel = PanelStore(datasets)
+            self._panel_sources = [(name, weakref.ref(df)) for name, df in datasets]
+        return self._panel
+
+    def query_panel(self, datasets: Iterable[Tuple[str, pd.DataFrame]], columns: Optional[List[str]] = None,
+                    where: Optional[Conditions] = None, countries: Optional[List[str]] = None,
+                    years: Union[List[int], Tuple[Optional[int], Optional[int]], None] = None,
+                    complete: bool = False) -> pd.DataFrame:
+        """
+        Query indicators across datasets joined on (Country, Year), e.g.
+        query_panel(store.csv_items(), ['Education_Spending_Percent_GDP', 'Gini_Coefficient'],
+                    where={'GDP_Growth_Rate': (3, None)})
+        See PanelStore.query for the arguments.
+        """
+        return self.panel(datasets).query(columns, where, countries, years, complete)
 
     def preprocess_query(self, query: str) -> List[str]:
         """
@@ -31,196 +378,443 @@ class DataSearcher:
 
         return keywords
 
-    def search_dataframe(self, df: pd.DataFrame, query: str, fuzzy: bool = True) -> Tuple[pd.DataFrame, Dict[str, int]]:
+    def _match_dataframe(self, df: pd.DataFrame, keywords: List[str], fuzzy: bool,
+                         index: Optional[DatasetIndex] = None,
+                         typos: bool = False) -> Tuple[np.ndarray, Dict[str, Dict[str, int]]]:
+        """
+        Count (keyword, column) hits per row in a single pass over the index.
+        With typos, a keyword also matches the words of the data within a
+        few edits of it (see utils.fuzzy_index).
+        Returns the per-row hit counts and {keyword: {column: matches}}.
+        """
+        if index is None:
+            index = self.index_dataframe(df)
+        hits = np.zeros(len(df), dtype=np.int32)
+        match_scores = {}
+
+        typo_index = self.typo_index(df) if typos else None
+        for keyword in keywords:
+            # Fuzzy matching means "contains keyword", otherwise exact match
+            column_rows = index.search(keyword, exact=not fuzzy)
+            if typo_index is not None:
+                for word, distance in typo_index.lookup(keyword):
+                    if distance:
+                        for column, rows in index.search(word, exact=not fuzzy).items():
+                            column_rows[column] = np.union1d(column_rows.get(column, rows), rows)
+            for rows in column_rows.values():
+                hits[rows] += 1
+            if column_rows:
+                match_scores[keyword] = {column: len(rows) for column, rows in column_rows.items()}
+
+        return hits, match_scores
+
+    def suggest_queries(self, datasets: Iterable[Tuple[str, pd.DataFrame]], query: str,
+                        key: Optional[Hashable] = None,
+                        check: Optional[Callable[[], None]] = None) -> List[str]:
+        """
+        "Did you mean" candidates, best first: the query with words that none
+        of the datasets contain replaced by close words they do contain (see
+        FuzzyIndex.corrections). The typo index over the datasets is reused
+        while key (e.g. the versions of their files) is unchanged; without a
+        key it is rebuilt every call. datasets are only consumed to rebuild
+        it, calling check() between them. Concurrent callers with the same
+        key wait for one rebuild instead of each doing their own.
+        """
+        with self._typo_lock:
+            if key is None or self._typo_index is None or key != self._typo_key:
+                vocabulary: Dict[str, int] = {}
+                for _, df in datasets:
+                    if check is not None:
+                        check()
+                    for word, count in self.vocabulary(df).items():
+                        vocabulary[word] = vocabulary.get(word, 0) + count
+                self._typo_index = FuzzyIndex(vocabulary)
+                self._typo_key = key
+            typo_index = self._typo_index
+        return typo_index.corrections(query, ignore=self.stop_words)
+
+    @staticmethod
+    def searchable_columns(df: pd.DataFrame) -> List[str]:
+        """Text columns first, then numeric columns (searched as strings)"""
+        text_columns = [c for c in df.columns if not pd.api.types.is_numeric_dtype(df[c])]
+        numeric_columns = list(df.select_dtypes(include=['number']).columns)
+        return text_columns + numeric_columns
+
+    def search_datasets(self, datasets: Iterable[Tuple[str, pd.DataFrame]], query: str,
+                        stats: Optional[SearchStats] = None,
+                        exact: bool = False) -> Iterator[Tuple[str, pd.DataFrame, Dict[str, np.ndarray]]]:
+        """
+        Search several datasets for the whole query string.
+        Yields (filename, df, {column: row ids}) for every file with matches;
+        per-file statistics are recorded in stats during the same pass.
+        """
+        started = time.perf_counter()
+        for filename, df in datasets:
+            file_started = time.perf_counter()
+            index = self.index_dataframe(df)
+            column_rows = index.search(query, exact=exact, columns=self.searchable_columns(df))
+
+            if stats is not None:
+                if len(column_rows) > 1:
+                    rows_hit = len(np.unique(np.concatenate(list(column_rows.values()))))
+                else:
+                    rows_hit = sum(len(rows) for rows in column_rows.values())
+                stats.add(FileMatchStats(
+                    filename, len(df),
+                    {column: len(rows) for column, rows in column_rows.items()},
+                    rows_hit, time.perf_counter() - file_started
+                ))
+                stats.elapsed = time.perf_counter() - started
+
+            if column_rows:
+                yield filename, df, column_rows
+
+    def search_chunks(self, filename: str, chunks: Iterable[pd.DataFrame], query: str,
+                      stats: Optional[SearchStats] = None, exact: bool = False,
+                      check: Optional[Callable[[], None]] = None) -> Iterator[Tuple[str, pd.DataFrame, Dict[str, np.ndarray]]]:
+        """
+        Search a file that is too large to keep resident, one chunk at a time.
+        Yields (filename, matching rows, {column: positions in those rows}) per
+        chunk with matches; only the matching rows are kept, so every chunk can
+        be released once it has been scanned. check() is called before each
+        chunk so a cancelled search stops between chunks.
+        """
+        started = time.perf_counter()
+        rows_searched = 0
+        rows_hit = 0
+        column_hits: Dict[str, int] = {}
+
+        for chunk in chunks:
+            if check is not None:
+                check()
+            # Each chunk is searched once, so no n-gram postings are built
+            index = DatasetIndex(chunk, postings=False)
+            column_rows = index.search(query, exact=exact, columns=self.searchable_columns(chunk))
+            rows_searched += len(chunk)
+            if not column_rows:
+                continue
+
+            matched = np.unique(np.concatenate(list(column_rows.values())))
+            rows_hit += len(matched)
+            for column, rows in column_rows.items():
+                column_hits[column] = column_hits.get(column, 0) + len(rows)
+            yield filename, chunk.iloc[matched], {
+                column: np.searchsorted(matched, rows) for column, rows in column_rows.items()
+            }
+
+        if stats is not None:
+            stats.add(FileMatchStats(filename, rows_searched, column_hits, rows_hit,
+                                     time.perf_counter() - started))
+
+    def search_dataframe(self, df: pd.DataFrame, query: str, fuzzy: bool = True,
+                         typos: bool = False) -> Tuple[pd.DataFrame, Dict[str, int]]:
         """
         Search DataFrame with advanced filtering
+        fuzzy matches keywords anywhere in a value (otherwise whole values);
+        typos also matches misspellings, e.g. 'brasil' finds Brazil
         Returns matching rows and match statistics
         """
         keywords = self.preprocess_query(query)
         if not keywords:
             return pd.DataFrame(), {}
 
-        match_scores = {}
-        all_matches = pd.DataFrame()
-
-        for keyword in keywords:
-            keyword_matches = pd.DataFrame()
-            column_matches = {}
-
-            # Search in each column
-            for column in df.columns:
-                column_data = df[column].astype(str).str.lower()
-
-                if fuzzy:
-                    # Fuzzy matching - contains keyword
-                    mask = column_data.str.contains(keyword, na=False, regex=False)
-                else:
-                    # Exact matching
-                    mask = column_data == keyword
-
-                column_results = df[mask]
-                if not column_results.empty:
-                    column_matches[column] = len(column_results)
-                    keyword_matches = pd.concat([keyword_matches, column_results]).drop_duplicates()
+        hits, match_scores = self._match_dataframe(df, keywords, fuzzy, typos=typos)
+        if not match_scores:
+            return pd.DataFrame(), {}
 
-            if not keyword_matches.empty:
-                match_scores[keyword] = column_matches
-                all_matches = pd.concat([all_matches, keyword_matches]).drop_duplicates()
+        return df.iloc[np.flatnonzero(hits)], match_scores
 
-        return all_matches, match_scores
+    def search_dataframe_ranked(self, df: pd.DataFrame, query: str, fuzzy: bool = True,
+                                top_k: Optional[int] = None) -> Tuple[pd.DataFrame, pd.Series, Dict[str, Dict[str, int]]]:
+        """
+        Search DataFrame and rank rows by relevance: the sum, over every
+        (keyword, column) pair a row matches, of the keyword's relevance score
+        for the cell (see utils.relevance). Returns the top_k (default all)
+        matching rows best first, their scores and match statistics
+        """
+        keywords = self.preprocess_query(query)
+        if not keywords:
+            return pd.DataFrame(), pd.Series(dtype=float), {}
 
-    def search_text_content(self, content: str, query: str, context_lines: int = 3) -> List[Dict[str, Any]]:
+        index = self.index_dataframe(df)
+        scores = np.zeros(len(df), dtype=np.float64)
+        hits = np.zeros(len(df), dtype=bool)
+        match_scores = {}
+        with instruments.stage('match', rows=len(df)):
+            for keyword in keywords:
+                # Fuzzy matching means "contains keyword", otherwise exact match
+                column_rows = index.search(keyword, exact=not fuzzy)
+                for column, rows in column_rows.items():
+                    column_index = index.columns[column]
+                    scores[rows] += value_scores(column_index.uniques, column_index.codes, rows, keyword)
+                    hits[rows] = True
+                if column_rows:
+                    match_scores[keyword] = {column: len(rows) for column, rows in column_rows.items()}
+
+        with instruments.stage('rank'):
+            rows = np.flatnonzero(hits)
+            # Equal scores keep file order
+            rows = rows[top_k_indices(scores[rows], top_k)]
+
+        ranked = df.iloc[rows]
+        return ranked, pd.Series(scores[rows], index=ranked.index, name='score'), match_scores
+
+    def rank_rows(self, df: pd.DataFrame, column: str, rows: np.ndarray, query: str,
+                  top_k: Optional[int] = None) -> np.ndarray:
         """
-        Search text content and return matches with context
+        Order the rows a search matched in one column by the relevance of the
+        query to their cell, best first (file order among equal scores)
+        """
+        if column not in df.columns or len(rows) < 2:
+            return rows
+        if id(df) in self._adopted:
+            index = self.index_dataframe(df).columns[column]
+            scores = value_scores(index.uniques, index.codes, rows, query.lower())
+        else:
+            # One-off frames (e.g. matching rows of a streamed chunk): only
+            # the candidate cells are encoded, with the same normalisation
+            cells = ColumnIndex(df[column].iloc[rows], postings=False)
+            scores = value_scores(cells.uniques, cells.codes, np.arange(len(rows)), query.lower())
+        return rows[top_k_indices(scores, top_k)]
+
+    def search_text_content(self, content: str, query: str, context_lines: int = 3,
+                            matcher: Optional[KeywordMatcher] = None,
+                            top_k: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Search text content and return matches with context, best first.
+        Only the top_k (default all) matches are built.
         """
         keywords = self.preprocess_query(query)
         if not keywords:
             return []
+        if matcher is None:
+            matcher = KeywordMatcher(keywords)
+
+        started = time.perf_counter()
+        lowered = content.lower()
+
+        # Scan the whole text once per keyword in C, then map hits to lines
+        hits_by_line: Dict[int, set] = {}
+        line_number = 0
+        last_position = 0
+        for position, keyword in matcher.find(lowered):
+            line_number += lowered.count('\n', last_position, position)
+            last_position = position
+            hits_by_line.setdefault(line_number, set()).add(keyword)
+
+        if not hits_by_line:
+            return []
 
-        matches = []
+        # (line, keyword) candidates in line order, then query order, with
+        # the lowercased lines of each keyword gathered for batch scoring
         lines = content.split('\n')
+        candidates: List[Tuple[int, int]] = []
+        texts: Dict[int, List[str]] = {}
+        positions: Dict[int, List[int]] = {}
+        for i in sorted(hits_by_line):
+            line_hits = hits_by_line[i]
+            line_lower = None
+            for keyword_position, keyword in enumerate(keywords):
+                if keyword in line_hits:
+                    if line_lower is None:
+                        line_lower = lines[i].lower()
+                    positions.setdefault(keyword_position, []).append(len(candidates))
+                    texts.setdefault(keyword_position, []).append(line_lower)
+                    candidates.append((i, keyword_position))
+
+        scores = np.zeros(len(candidates), dtype=np.float64)
+        for keyword_position, selected in positions.items():
+            scores[selected] = relevance_scores(texts[keyword_position], keywords[keyword_position])
+
+        matched = time.perf_counter()
+        instruments.record('match', matched - started, mode='text')
 
-        for i, line in enumerate(lines):
-            line_lower = line.lower()
-
-            for keyword in keywords:
-                if keyword in line_lower:
-                    # Get context around the match
-                    start = max(0, i - context_lines)
-                    end = min(len(lines), i + context_lines + 1)
-                    context = lines[start:end]
-
-                    # Highlight the keyword in the matching line
-                    highlighted_line = re.sub(
-                        f'({re.escape(keyword)})', 
-                        r'**\1**', 
-                        line, 
-                        flags=re.IGNORECASE
-                    )
-
-                    matches.append({
-                        'keyword': keyword,
-                        'line_number': i + 1,
-                        'matched_line': highlighted_line,
-                        'context': context,
-                        'relevance_score': self._calculate_relevance(line_lower, keyword)
-                    })
-
-        # Sort by relevance score
-        matches.sort(key=lambda x: x['relevance_score'], reverse=True)
+        matches = []
+        for candidate in top_k_indices(scores, top_k).tolist():
+            i, keyword_position = candidates[candidate]
+            keyword = keywords[keyword_position]
+            # Get context around the match
+            start = max(0, i - context_lines)
+            end = min(len(lines), i + context_lines + 1)
+            matches.append({
+                'keyword': keyword,
+                'line_number': i + 1,
+                # Highlight the keyword in the matching line
+                'matched_line': matcher.highlight(lines[i], keyword),
+                'context': lines[start:end],
+                'relevance_score': float(scores[candidate])
+            })
+
+        instruments.record('rank', time.perf_counter() - matched, mode='text')
         return matches
 
-    def search_json_content(self, json_data: Dict, query: str) -> List[Dict[str, Any]]:
+    def search_json_content(self, json_data: Union[Dict, FlatJSON], query: str,
+                            matcher: Optional[KeywordMatcher] = None,
+                            path_prefix: Optional[str] = None,
+                            top_k: Optional[int] = None) -> List[Dict[str, Any]]:
         """
-        Search JSON content recursively
+        Search JSON content; pass a FlatJSON (built once per report) to avoid
+        walking the document again for every query.
+        path_prefix restricts the search, e.g. 'executive_summary.*'.
+        Returns the top_k (default all) matching leaves, best first.
         """
         keywords = self.preprocess_query(query)
         if not keywords:
             return []
 
-        matches = []
-
-        def search_recursive(obj, path=""):
-            if isinstance(obj, dict):
-                for key, value in obj.items():
-                    current_path = f"{path}.{key}" if path else key
-                    search_recursive(value, current_path)
-            elif isinstance(obj, list):
-                for i, item in enumerate(obj):
-                    current_path = f"{path}[{i}]"
-                    search_recursive(item, current_path)
-            else:
-                # Search in the value
-                str_value = str(obj).lower()
-                for keyword in keywords:
-                    if keyword in str_value:
-                        matches.append({
-                            'keyword': keyword,
-                            'path': path,
-                            'value': str(obj),
-                            'relevance_score': self._calculate_relevance(str_value, keyword)
-                        })
-
-        search_recursive(json_data)
-
-        # Sort by relevance and remove duplicates
-        unique_matches = []
-        seen = set()
-        for match in sorted(matches, key=lambda x: x['relevance_score'], reverse=True):
-            key = (match['path'], match['keyword'])
-            if key not in seen:
-                unique_matches.append(match)
-                seen.add(key)
-
-        return unique_matches
+        started = time.perf_counter()
+        flat = json_data if isinstance(json_data, FlatJSON) else FlatJSON(json_data)
+        allowed = flat.prefix_mask(path_prefix)
+
+        # Each (leaf, keyword) pair once: find() returns distinct leaves and
+        # repeated keywords are dropped, so no duplicate paths need removing
+        keywords = list(dict.fromkeys(keywords))
+        leaves = []
+        keyword_ids = []
+        scores = []
+        for keyword_position, keyword in enumerate(keywords):
+            found = flat.find(keyword)
+            found = found[allowed[found]]
+            leaves.append(found)
+            keyword_ids.append(np.full(len(found), keyword_position))
+            # Every leaf holding a keyword is scored in one batch
+            scores.append(relevance_scores(flat.lowered[found], keyword))
+        leaves = np.concatenate(leaves)
+        keyword_ids = np.concatenate(keyword_ids)
+        scores = np.concatenate(scores)
+
+        # Document order like a tree walk, then query order, before ranking
+        order = np.lexsort((keyword_ids, leaves))
+        leaves, keyword_ids, scores = leaves[order], keyword_ids[order], scores[order]
+
+        matched = time.perf_counter()
+        instruments.record('match', matched - started, mode='json')
+
+        selected = top_k_indices(scores, top_k)
+        matches = [
+            {
+                'keyword': keywords[keyword_position],
+                'path': path,
+                'value': value,
+                'relevance_score': score
+            }
+            for keyword_position, path, value, score in zip(
+                keyword_ids[selected].tolist(), flat.paths[leaves[selected]].tolist(),
+                flat.values[leaves[selected]].tolist(), scores[selected].tolist())
+        ]
+
+        instruments.record('rank', time.perf_counter() - matched, mode='json')
+        return matches
 
     def _calculate_relevance(self, text: str, keyword: str) -> float:
         """
         Calculate relevance score based on keyword frequency and position
+        (one text; see utils.relevance for batches)
         """
-        # Count occurrences
-        count = text.count(keyword)
-
-        # Check if keyword appears at the beginning (higher relevance)
-        position_bonus = 2.0 if text.startswith(keyword) else 1.0
-
-        # Check if keyword appears as a whole word
-        word_bonus = 1.5 if f' {keyword} ' in f' {text} ' else 1.0
-
-        # Calculate final score
-        score = count * position_bonus * word_bonus
-
-        return score
+        return float(relevance_scores([text], keyword)[0])
 
     def filter_by_country(self, df: pd.DataFrame, country: str) -> pd.DataFrame:
         """
         Filter DataFrame by country name
         """
-        if 'Country' in df.columns:
-            mask = df['Country'].str.contains(country, case=False, na=False)
-            return df[mask]
+        index = self.key_index(df, 'Country')
+        if index is not None:
+            return df.iloc[index.contains(country)]
         return pd.DataFrame()
 
     def filter_by_year(self, df: pd.DataFrame, year: int) -> pd.DataFrame:
         """
         Filter DataFrame by year
         """
-        if 'Year' in df.columns:
-            return df[df['Year'] == year]
+        index = self.key_index(df, 'Year')
+        if index is not None:
+            return df.iloc[index.exact(year)]
         return pd.DataFrame()
 
+    def filter_by_country_year(self, df: pd.DataFrame, country: str, year: int) -> pd.DataFrame:
+        """
+        Filter DataFrame by country name and year, intersecting both indexes
+        """
+        country_index = self.key_index(df, 'Country')
+        year_index = self.key_index(df, 'Year')
+        if country_index is None or year_index is None:
+            return pd.DataFrame()
+        return df.iloc[intersect_rows(country_index.contains(country), year_index.exact(year))]
+
+    def filter_by_key(self, df: pd.DataFrame, column: str, value: Any = None, prefix: Optional[str] = None,
+                      low: Any = None, high: Any = None) -> pd.DataFrame:
+        """
+        Filter DataFrame through the lookup index of a column.
+        Rows must equal value, start with prefix and lie in [low, high]
+        (string keys compare case-insensitively); unset conditions are skipped.
+        """
+        index = self.key_index(df, column)
+        if index is None:
+            return pd.DataFrame()
+        row_sets = [
+            index.exact(value) if value is not None else None,
+            index.prefix(prefix) if prefix is not None else None,
+            index.range(low, high) if low is not None or high is not None else None,
+        ]
+        if all(rows is None for rows in row_sets):
+            return df
+        return df.iloc[intersect_rows(*row_sets)]
+
     def filter_by_range(self, df: pd.DataFrame, column: str, min_val: float, max_val: float) -> pd.DataFrame:
         """
         Filter DataFrame by numeric range
         """
-        if column in df.columns:
-            numeric_col = pd.to_numeric(df[column], errors='coerce')
-            mask = (numeric_col >= min_val) & (numeric_col <= max_val)
-            return df[mask]
+        index = self.numeric_index(df, column)
+        if index is not None:
+            return df.iloc[index.range(min_val, max_val)]
         return pd.DataFrame()
 
+    def filter_by_ranges(self, df: pd.DataFrame, ranges: Dict[str, Tuple[Optional[float], Optional[float]]]) -> pd.DataFrame:
+        """
+        Filter DataFrame by numeric ranges on several columns,
+        e.g. {'Gini': (0.25, 0.30), 'Year': (2000, None)}; None leaves a side open
+        """
+        row_sets = []
+        for column, (min_val, max_val) in ranges.items():
+            index = self.numeric_index(df, column)
+            if index is None:
+                return pd.DataFrame()
+            row_sets.append(index.range(min_val, max_val))
+        if not row_sets:
+            return df
+        return df.iloc[intersect_rows(*row_sets)]
+
     def get_summary_stats(self, df: pd.DataFrame, column: str) -> Dict[str, Any]:
         """
         Get summary statistics for a numeric column
         """
-        if column not in df.columns:
+        if column not in df.columns or df.empty:
             return {}
 
-        numeric_col = pd.to_numeric(df[column], errors='coerce')
+        stats = self.summarize_dataframe(df)
+        column_stats = stats.columns.get(column)
+        # Missing for a non-numeric dtype (statistics of its numeric coercion
+        # are taken); quantiles are unknown after a merge
+        if column_stats is None or column_stats.quantiles is None:
+            index = self.numeric_index(df, column)
+            column_stats = stats.columns[column] = ColumnStats.from_sorted(index.sorted_values[:index.count])
 
-        if numeric_col.empty:
-            return {}
+        return column_stats.summary()
 
-        return {
-            'count': len(numeric_col.dropna()),
-            'mean': numeric_col.mean(),
-            'median': numeric_col.median(),
-            'std': numeric_col.std(),
-            'min': numeric_col.min(),
-            'max': numeric_col.max(),
-            'q25': numeric_col.quantile(0.25),
-            'q75': numeric_col.quantile(0.75)
-        }
+    def get_group_stats(self, df: pd.DataFrame, column: str, by: str = 'Country') -> pd.DataFrame:
+        """
+        Get summary statistics for a numeric column per value of another
+        column (e.g. per Country or Year), one row per group
+        """
+        if column not in df.columns or by not in df.columns:
+            return pd.DataFrame()
+
+        stats = self.summarize_dataframe(df)
+        groups = stats.groups.get((by, column))
+        if groups is None or any(group.quantiles is None for group in groups.values()):
+            groups = stats.groups[(by, column)] = grouped_stats(df[by], self.numeric_index(df, column).values)
+
+        return pd.DataFrame.from_dict({key: group.summary() for key, group in groups.items()}, orient='index')
 
 # Utility functions for data formatting
 def format_large_number(num: float) -> str:
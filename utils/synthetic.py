@@ -0,0 +1,180 @@
+"""
+Synthetic corpora for EconoVisionAI
+Deterministic generators for OECD-shaped CSV panels (Country, Year, Region
+and indicator columns) and for text and nested JSON country reports, used to
+benchmark loading and searching at sizes the bundled samples cannot reach.
+The same seed always produces the same files, and a larger corpus starts
+with the rows of a smaller one.
+"""
+
+import json
+import os
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+COUNTRIES = [
+    "Australia", "Austria", "Belgium", "Brazil", "Canada", "Chile", "China", "Colombia",
+    "Costa Rica", "Czech Republic", "Denmark", "Estonia", "Finland", "France", "Germany",
+    "Greece", "Hungary", "Iceland", "India", "Indonesia", "Ireland", "Israel", "Italy",
+    "Japan", "Korea", "Latvia", "Lithuania", "Luxembourg", "Mexico", "Netherlands",
+    "New Zealand", "Norway", "Poland", "Portugal", "Slovak Republic", "Slovenia",
+    "South Africa", "Spain", "Sweden", "Switzerland", "Turkey", "United Kingdom",
+    "United States",
+]
+
+# First year of every synthetic panel; each region covers YEAR_SPAN years
+FIRST_YEAR = 1960
+YEAR_SPAN = 64
+
+# indicator -> (mean, standard deviation, decimals)
+INDICATORS = {
+    'GDP_Billion_USD': (1500.0, 900.0, 1),
+    'GDP_Growth_Rate': (2.5, 2.0, 1),
+    'Education_Spending_Percent_GDP': (5.0, 1.2, 1),
+    'Gini_Coefficient': (0.35, 0.06, 3),
+    'Poverty_Rate_Percent': (12.0, 5.0, 1),
+}
+
+# Rows generated per block; block i depends only on (seed, i)
+GENERATE_BLOCK_ROWS = 1_000_000
+
+TOPICS = ["growth", "inflation", "education", "inequality", "employment", "productivity",
+          "investment", "trade", "innovation", "pensions", "housing", "energy"]
+
+WORDS = ["economy", "policy", "reform", "fiscal", "monetary", "spending", "labour", "market",
+         "income", "poverty", "enrollment", "exports", "deficit", "debt", "outlook", "survey",
+         "recovery", "resilience", "transition", "digital", "infrastructure", "tax", "wages",
+         "households", "firms", "skills", "regional", "structural", "sustainable", "climate"]
+
+
+def _block(seed: int, block: int, start: int, stop: int) -> pd.DataFrame:
+    """Rows [start, stop) of block `block` of the panel for `seed`"""
+    rng = np.random.default_rng([seed, block])
+    rows = np.arange(block * GENERATE_BLOCK_ROWS + start, block * GENERATE_BLOCK_ROWS + stop)
+    region = rows // YEAR_SPAN
+    country = region % len(COUNTRIES)
+    names = np.asarray(COUNTRIES, dtype=object)
+
+    data: Dict[str, Any] = {
+        'Country': names[country],
+        'Year': FIRST_YEAR + rows % YEAR_SPAN,
+        # One region per YEAR_SPAN rows, so the column's cardinality grows with the panel
+        'Region': [f"{names[c][:3].upper()}-{r:06d}" for c, r in zip(country, region)],
+    }
+    # Draw the whole block so a row's values do not depend on where a file ends
+    for name, (mean, std, decimals) in INDICATORS.items():
+        values = rng.normal(mean, std, GENERATE_BLOCK_ROWS)[start:stop]
+        data[name] = np.round(np.abs(values), decimals)
+    return pd.DataFrame(data)
+
+
+def generate_panel(rows: int, seed: int = 0) -> pd.DataFrame:
+    """An OECD-shaped panel with `rows` rows, built in memory"""
+    frames = [
+        _block(seed, block, 0, min(GENERATE_BLOCK_ROWS, rows - block * GENERATE_BLOCK_ROWS))
+        for block in range(-(-rows // GENERATE_BLOCK_ROWS))
+    ]
+    if not frames:
+        return _block(seed, 0, 0, 0)
+    return pd.concat(frames, ignore_index=True)
+
+
+def write_panel_csv(path: str, rows: int, seed: int = 0):
+    """Write a panel to CSV block by block, so any size fits in memory"""
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        for block in range(max(1, -(-rows // GENERATE_BLOCK_ROWS))):
+            stop = min(GENERATE_BLOCK_ROWS, rows - block * GENERATE_BLOCK_ROWS)
+            _block(seed, block, 0, stop).to_csv(f, index=False, header=block == 0)
+
+
+def _sentence(rng: np.random.Generator, country: str) -> str:
+    words = list(rng.choice(WORDS, size=int(rng.integers(6, 14))))
+    words.insert(int(rng.integers(0, len(words))), str(rng.choice(TOPICS)))
+    if rng.random() < 0.3:
+        words.insert(int(rng.integers(0, len(words))), country)
+    if rng.random() < 0.4:
+        words.append(f"{rng.normal(3, 2):.1f}%")
+    sentence = " ".join(words)
+    return sentence[0].upper() + sentence[1:] + "."
+
+
+def generate_text_report(country: str, year: int, sections: int = 8, seed: int = 0) -> str:
+    """A plain-text country report shaped like the bundled OECD summaries"""
+    rng = np.random.default_rng([seed, COUNTRIES.index(country) if country in COUNTRIES else 0, year])
+    lines = [f"OECD Economic Survey: {country} {year}", "Country Report", ""]
+    for _ in range(sections):
+        topic = str(rng.choice(TOPICS))
+        lines.append(f"{topic.capitalize()} and {str(rng.choice(WORDS))}:")
+        lines.append(" ".join(_sentence(rng, country) for _ in range(int(rng.integers(2, 6)))))
+        lines.append("")
+        lines.append(f"Key {topic} indicators:")
+        for _ in range(int(rng.integers(3, 7))):
+            lines.append(f"- {str(rng.choice(WORDS)).capitalize()} {topic}: {rng.normal(5, 3):.1f}%")
+        lines.append("")
+    return "\n".join(lines)
+
+
+def generate_json_report(country: str, year: int, sections: int = 8, depth: int = 3,
+                         seed: int = 0) -> Dict[str, Any]:
+    """A nested JSON country report; every section nests `depth` levels deep"""
+    rng = np.random.default_rng([seed, COUNTRIES.index(country) if country in COUNTRIES else 0, year, depth])
+
+    def node(level: int) -> Any:
+        if level >= depth:
+            kind = rng.random()
+            if kind < 0.5:
+                return _sentence(rng, country)
+            if kind < 0.8:
+                return round(float(rng.normal(5, 3)), 2)
+            return [str(rng.choice(WORDS)) + " " + str(rng.choice(TOPICS)) for _ in range(int(rng.integers(2, 5)))]
+        return {f"{str(rng.choice(TOPICS))}_{i}": node(level + 1) for i in range(int(rng.integers(2, 4)))}
+
+    report: Dict[str, Any] = {
+        'country': country,
+        'report_year': year,
+        'title': f"OECD Economic Outlook: {country} {year}",
+    }
+    for i in range(sections):
+        report[f"{str(rng.choice(TOPICS))}_section_{i}"] = node(1)
+    return report
+
+
+def write_report_corpus(directory: str, reports: int, sections: int = 8, depth: int = 3,
+                        seed: int = 0) -> List[str]:
+    """
+    Write `reports` country reports, alternating text and JSON, and return
+    their paths
+    """
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+    for i in range(reports):
+        country = COUNTRIES[i % len(COUNTRIES)]
+        year = 2023 - i // len(COUNTRIES)
+        stem = f"{country.lower().replace(' ', '_')}_{year}"
+        if i % 2 == 0:
+            path = os.path.join(directory, f"{stem}.txt")
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(generate_text_report(country, year, sections, seed))
+        else:
+            path = os.path.join(directory, f"{stem}.json")
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(generate_json_report(country, year, sections, depth, seed), f, indent=2)
+        paths.append(path)
+    return paths
+
+
+def write_corpus(directory: str, rows: int, reports: int = 20, files: int = 1,
+                 seed: int = 0, report_sections: Optional[int] = None) -> Dict[str, str]:
+    """
+    A data/ and reports/ folder pair under directory, laid out like the
+    application's own: `files` CSVs of `rows` rows each and `reports` reports
+    """
+    data_dir = os.path.join(directory, "data")
+    reports_dir = os.path.join(directory, "reports")
+    os.makedirs(data_dir, exist_ok=True)
+    for i in range(files):
+        write_panel_csv(os.path.join(data_dir, f"panel_{i}.csv"), rows, seed + i)
+    write_report_corpus(reports_dir, reports, report_sections or 8, seed=seed)
+    return {'data_dir': data_dir, 'reports_dir': reports_dir}